@@ -4,14 +4,31 @@
 # This file marks the 'src' directory as a Python package.
 # It can also be used for package-wide configurations or imports.
 
-# Ensure all core components are implicitly available for internal use.
-from .sovereign_core import ZKVSNodePrime
-from .praetorian_layers import cerebrum, hadrian, dagger
-from .axiom_lattice import enforcement, trust_metrics, complexity_sieve
-from .data_moat import cultivation_engine
-from .dagger_agents import core as dagger_agents_core, utils as dagger_agents_utils
+# Core components stay available for internal use, but are imported on first access
+# so that importing one submodule does not pull in every layer and agent.
+import importlib
+
+_LAZY_IMPORTS = {
+    "ZKVSNodePrime": (".sovereign_core", "ZKVSNodePrime"),
+    "cerebrum": (".praetorian_layers.cerebrum", None),
+    "hadrian": (".praetorian_layers.hadrian", None),
+    "dagger": (".praetorian_layers.dagger", None),
+    "enforcement": (".axiom_lattice.enforcement", None),
+    "trust_metrics": (".axiom_lattice.trust_metrics", None),
+    "complexity_sieve": (".axiom_lattice.complexity_sieve", None),
+    "cultivation_engine": (".data_moat.cultivation_engine", None),
+    "dagger_agents_core": (".dagger_agents.core", None),
+    "dagger_agents_utils": (".dagger_agents.utils", None),
+}
+
+def __getattr__(name):
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(target[0], __name__)
+    return getattr(module, target[1]) if target[1] else module
 
 # Define package version for auditability
 __version__ = "2.1.0-APEX-SOVEREIGN"
 
-# All paths converge to flawless execution.
\ No newline at end of file
+# All paths converge to flawless execution.
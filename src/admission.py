@@ -0,0 +1,271 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE ADMISSION: Bounded Intake, Per-Client Rate Limits and Priority Shedding
+
+"""
+Admission control for the AXIOMHIVE ZKVS Sieve Protocol.
+
+AdmissionController sits at the server and daemon boundary, in front of execute and
+execute-batch (status, ledger and metrics are never gated):
+
+- at most max_in_flight mandate requests execute at once; the rest wait in a bounded
+  intake queue (queue_size, sized from max_connections) and are started highest
+  priority first, FIFO within a priority;
+- each client has a token bucket (client_rate per second, client_burst deep); a batch
+  costs one token per framework, and a batch larger than client_burst is always rejected;
+- the queue sheds by priority: "low" is only queued while the queue is under half
+  full, "normal" under 3/4, "high" under 9/10, "absolute" up to the full queue;
+- a request that waits longer than max_wait is rejected rather than run late.
+
+Every rejection is an AdmissionRejected carrying retry_after: time to the client's
+next token, or the expected time for the queue to drain. Under overload the node keeps
+running max_in_flight mandates at normal latency and turns the excess away early,
+instead of letting every mandate queue past reboot_threshold.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import threading
+import time
+from typing import Dict, Any, Callable, List, Optional
+
+from src.instrumentation import LatencyHistogram
+from src.metrics import MetricsRegistry
+
+PRIORITY_RANKS = {"absolute": 0, "high": 1, "normal": 2, "low": 3}
+# Fraction of the intake queue each priority may fill
+SHED_THRESHOLDS = {"absolute": 1.0, "high": 0.9, "normal": 0.75, "low": 0.5}
+
+class AdmissionRejected(Exception):
+    """A mandate request turned away at admission; retry after retry_after seconds."""
+
+    def __init__(self, reason: str, retry_after: float, message: str):
+        super().__init__(message)
+        self.reason = reason # rate_limited | shed | queue_timeout
+        self.retry_after = retry_after
+
+class TokenBucket:
+    """Token bucket refilled continuously at rate tokens per second, up to burst."""
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, cost: float, now: float) -> float:
+        """
+        Takes cost tokens and returns 0, or returns the wait until they are available:
+        math.inf for a cost above burst, which can never be paid at once.
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if cost > self.burst:
+            return math.inf
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+def priority_of(frameworks: List[Any]) -> str:
+    """Highest priority among frameworks; unknown or missing priorities count as normal."""
+    best = "normal"
+    for framework in frameworks:
+        priority = framework.get("priority") if isinstance(framework, dict) else None
+        if priority in PRIORITY_RANKS and PRIORITY_RANKS[priority] < PRIORITY_RANKS[best]:
+            best = priority
+    return best
+
+class _Waiter:
+    __slots__ = ("priority", "rank", "seq", "enqueued", "wake", "state")
+
+    def __init__(self, priority: str, seq: int, enqueued: float, wake: Callable[[], None]):
+        self.priority = priority
+        self.rank = PRIORITY_RANKS.get(priority, PRIORITY_RANKS["normal"])
+        self.seq = seq
+        self.enqueued = enqueued
+        self.wake = wake
+        self.state = "waiting" # waiting | admitted | abandoned
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.rank, self.seq) < (other.rank, other.seq)
+
+class AdmissionController:
+    """Thread-safe admission gate; acquire() for threads, acquire_async() on an event loop."""
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    MAX_CLIENTS = 10000 # Idle buckets are pruned beyond this many tracked clients
+
+    def __init__(self, max_in_flight: int, queue_size: int, client_rate: float = 0.0,
+                 client_burst: float = 50.0, max_wait: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_in_flight <= 0 or queue_size < 0:
+            raise ValueError("max_in_flight must be positive and queue_size non-negative.")
+        self.max_in_flight = max_in_flight
+        self.queue_size = queue_size
+        self.client_rate = client_rate # 0 disables per-client rate limiting
+        self.client_burst = max(client_burst, 1.0)
+        self.max_wait = max_wait
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._queue: List[_Waiter] = [] # Heap; abandoned waiters are skipped lazily
+        self._queued = 0
+        self._seq = itertools.count()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._service_time = 0.01 # EWMA of admitted request duration, for retry-after estimates
+
+        self.metrics = MetricsRegistry()
+        self._admitted = self.metrics.counter("axiomhive_admission_admitted_total",
+                                              "Mandate requests admitted, by priority.", ("priority",))
+        self._rejected = self.metrics.counter("axiomhive_admission_rejected_total",
+                                              "Mandate requests rejected at admission.", ("reason", "priority"))
+        self.queue_wait = LatencyHistogram()
+        self.metrics.callback("axiomhive_admission_queue_depth", "Requests waiting in the intake queue.",
+                              lambda: self._queued)
+        self.metrics.callback("axiomhive_admission_queue_capacity", "Intake queue size.", lambda: self.queue_size)
+        self.metrics.callback("axiomhive_admission_in_flight", "Admitted requests executing.", lambda: self._in_flight)
+        self.metrics.callback("axiomhive_admission_queue_wait_seconds", "Time admitted requests spent queued.",
+                              lambda: [({}, self.queue_wait)], type="histogram")
+
+    # --- Decisions (under the lock) ---
+
+    def _retry_after_drain(self) -> float:
+        return (self._queued / self.max_in_flight + 1) * self._service_time
+
+    def _enter(self, client: str, priority: str, cost: float, wake: Callable[[], None]) -> Optional[_Waiter]:
+        """None when admitted immediately, a waiter when queued; raises when rejected."""
+        if priority not in PRIORITY_RANKS: # Labels stay bounded whatever the caller passes
+            priority = "normal"
+        now = self._clock()
+        if self.client_rate > 0:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                if len(self._buckets) >= self.MAX_CLIENTS:
+                    self._prune_buckets(now)
+                bucket = self._buckets[client] = TokenBucket(self.client_rate, self.client_burst, now)
+            wait = bucket.take(cost, now)
+            if wait == math.inf:
+                self._rejected.inc(1, "rate_limited", priority)
+                raise AdmissionRejected("rate_limited", self.client_burst / self.client_rate,
+                                        f"Batch of {cost:g} exceeds the client burst of {self.client_burst:g}; "
+                                        f"split it into smaller batches.")
+            if wait > 0:
+                self._rejected.inc(1, "rate_limited", priority)
+                raise AdmissionRejected("rate_limited", wait,
+                                        f"Client rate limit of {self.client_rate:g}/s exceeded.")
+        if self._in_flight < self.max_in_flight and self._queued == 0:
+            self._in_flight += 1
+            self._admitted.inc(1, priority)
+            self.queue_wait.record(0.0)
+            return None
+        if self._queued >= SHED_THRESHOLDS.get(priority, SHED_THRESHOLDS["normal"]) * self.queue_size:
+            self._rejected.inc(1, "shed", priority)
+            raise AdmissionRejected("shed", self._retry_after_drain(),
+                                    f"Node overloaded; {priority}-priority mandates are being shed.")
+        waiter = _Waiter(priority, next(self._seq), now, wake)
+        heapq.heappush(self._queue, waiter)
+        self._queued += 1
+        return waiter
+
+    def _prune_buckets(self, now: float):
+        # Buckets that have refilled completely carry no state worth keeping
+        idle = [client for client, bucket in self._buckets.items()
+                if bucket.tokens + (now - bucket.updated) * bucket.rate >= bucket.burst]
+        for client in idle:
+            del self._buckets[client]
+
+    def _abandon(self, waiter: _Waiter, reason: str = "queue_timeout") -> bool:
+        """Gives up on a queued waiter; False if it was admitted in the meantime."""
+        with self._lock:
+            if waiter.state == "admitted":
+                return False
+            waiter.state = "abandoned"
+            self._queued -= 1
+            self._rejected.inc(1, reason, waiter.priority)
+            return True
+
+    def _timeout_error(self) -> AdmissionRejected:
+        return AdmissionRejected("queue_timeout", self._retry_after_drain(),
+                                 f"Mandate waited more than {self.max_wait:g}s for admission.")
+
+    # --- Public API ---
+
+    def acquire(self, client: str, priority: str = "normal", cost: float = 1.0):
+        """Blocks until admitted; raises AdmissionRejected. Pair with release()."""
+        event = threading.Event()
+        with self._lock:
+            waiter = self._enter(client, priority, cost, event.set)
+        if waiter is None:
+            return
+        if not event.wait(self.max_wait) and self._abandon(waiter):
+            raise self._timeout_error()
+
+    async def acquire_async(self, client: str, priority: str = "normal", cost: float = 1.0):
+        """
+        Waits on the running event loop until admitted; raises AdmissionRejected.
+        A caller cancelled while queued gives up its place, or its slot if already admitted.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        wake = lambda: loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+        with self._lock:
+            waiter = self._enter(client, priority, cost, wake)
+        if waiter is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.max_wait)
+        except asyncio.TimeoutError:
+            if self._abandon(waiter):
+                raise self._timeout_error()
+        except asyncio.CancelledError:
+            if not self._abandon(waiter, "cancelled"):
+                self.release()
+            raise
+
+    def release(self, duration: Optional[float] = None):
+        """Frees the slot of a finished request and starts the next queued one."""
+        with self._lock:
+            if duration is not None:
+                self._service_time = 0.9 * self._service_time + 0.1 * duration
+            self._in_flight -= 1
+            now = self._clock()
+            while self._queue and self._in_flight < self.max_in_flight:
+                waiter = heapq.heappop(self._queue)
+                if waiter.state != "waiting":
+                    continue
+                waiter.state = "admitted"
+                self._queued -= 1
+                self._in_flight += 1
+                self._admitted.inc(1, waiter.priority)
+                self.queue_wait.record(now - waiter.enqueued)
+                waiter.wake()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "queue_depth": self._queued,
+                "queue_size": self.queue_size,
+                "client_rate": self.client_rate,
+                "tracked_clients": len(self._buckets),
+                "service_time_s": self._service_time,
+            }
+
+def retry_after_header(seconds: float) -> str:
+    """Retry-After is whole seconds; never advertise 0."""
+    return str(max(1, math.ceil(seconds)))
+
+def controller_from_config(config, workers: int) -> Optional[AdmissionController]:
+    """The configured controller for a server or daemon with `workers` execution threads."""
+    if not config.enable_admission_control:
+        return None
+    return AdmissionController(
+        max_in_flight=config.admission_max_in_flight or workers,
+        queue_size=config.admission_queue_size or config.max_connections,
+        client_rate=config.client_rate_limit,
+        client_burst=config.client_burst,
+        max_wait=config.admission_max_wait,
+    )
@@ -1,7 +1,7 @@
 # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
 # AXIOM_LATTICE/TRUST_METRICS: Trust Metrics Engine (TME)
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import time
 
 class TrustMetricsEngine:
@@ -14,15 +14,18 @@ class TrustMetricsEngine:
         self._axioms = axioms
         self._trust_threshold = 0.99 # Minimum acceptable trust score
 
-    def evaluate_all_metrics(self, verifiable_ledger: List[Dict[str, Any]]) -> Dict[str, float]:
+    def evaluate_all_metrics(self, verifiable_ledger: List[Dict[str, Any]],
+                             critical_events: Optional[int] = None) -> Dict[str, float]:
         """
         Evaluates all Trust Metrics based on the Verifiable Ledger and internal state.
+        critical_events is the ledger's CRITICAL count when the caller keeps one as it appends;
+        without it the ledger is scanned.
         """
         # @AXIOMHIVE: Quantifiable Trust - Translating abstract principles into auditable metrics.
         metrics = {
             "SaliencyMapRobustness": self._evaluate_saliency_robustness(),
             "Uptime": self._evaluate_uptime(verifiable_ledger),
-            "ErrorRate": self._evaluate_error_rate(verifiable_ledger),
+            "ErrorRate": self._evaluate_error_rate(verifiable_ledger, critical_events),
             "Latency": self._evaluate_latency(verifiable_ledger),
             "MembershipInferenceScore": self._evaluate_privacy_score(),
             "GroupFairnessMetrics": self._evaluate_fairness_metrics(),
@@ -44,11 +47,13 @@ class TrustMetricsEngine:
         current_timestamp = time.time()
         return current_timestamp - first_timestamp
 
-    def _evaluate_error_rate(self, verifiable_ledger: List[Dict[str, Any]]) -> float:
-        """Calculates error rate from ledger."""
+    def _evaluate_error_rate(self, verifiable_ledger: List[Dict[str, Any]],
+                             critical_events: Optional[int] = None) -> float:
+        """Calculates error rate from ledger, using the caller's running CRITICAL count if given."""
         total_events = len(verifiable_ledger)
-        error_events = sum(1 for entry in verifiable_ledger if entry['level'] == 'CRITICAL')
-        return error_events / total_events if total_events > 0 else 0.0
+        if critical_events is None:
+            critical_events = sum(1 for event in verifiable_ledger if event['level'] == 'CRITICAL')
+        return critical_events / total_events if total_events > 0 else 0.0
 
     def _evaluate_latency(self, verifiable_ledger: List[Dict[str, Any]]) -> float:
         """Simulates average latency (target 0.2ms)."""
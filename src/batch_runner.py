@@ -0,0 +1,282 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE BATCH RUNNER: Resumable Bulk Execution of JSON-Lines Frameworks
+
+"""
+Bulk runner for the AXIOMHIVE ZKVS Sieve Protocol.
+
+BatchRunner streams frameworks from a JSON-lines file (optionally gzip-compressed), one
+framework per line or a record carrying one under "framework", and writes one result line
+per input record:
+
+    {"index": 0, "status": "success", "result": "..."}
+    {"index": 1, "id": "job-7", "status": "error", "error": "..."}
+
+Frameworks are sent in chunks through execute_mandates(), so a node amortizes trust
+evaluation, ledger appends and the ZK pass across each chunk, and a node pool splits every
+chunk over its workers. `concurrency` chunks are in flight at once; results are written in
+input order, or as chunks complete with ordered=False.
+
+Progress is checkpointed next to the output every `checkpoint_interval` records: the input
+offset below which every record is written, the records above it already written, and the
+output length they occupy. resume=True truncates the output back to that length and skips
+those records. Records written after the last checkpoint are executed again on resume
+(at-least-once), so an interruption never loses or duplicates output lines.
+"""
+
+import gzip
+import json
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger('AXIOMHIVE.BatchRunner')
+
+CHECKPOINT_VERSION = 1
+
+class _Chunk:
+    """A run of consecutive input records and where it ends in the input."""
+    __slots__ = ("start", "end", "end_offset", "records", "written")
+
+    def __init__(self, start: int, end: int, end_offset: int, records: List[Tuple[int, Dict[str, Any]]]):
+        self.start = start
+        self.end = end
+        self.end_offset = end_offset
+        self.records = records # (index, parsed line or {"error": ...}) for records still to run
+        self.written = False
+
+def _open_input(path: str):
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+def _parse_line(line: bytes) -> Dict[str, Any]:
+    """{"framework", "id"?} for a valid line, {"error"} for one that cannot be executed."""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return {"error": f"Invalid JSON line: {e}"}
+    parsed: Dict[str, Any] = {}
+    if isinstance(record, dict) and isinstance(record.get("framework"), dict):
+        if "id" in record:
+            parsed["id"] = record["id"]
+        record = record["framework"]
+    parsed["framework"] = record
+    return parsed
+
+class BatchRunner:
+    """Executes a JSON-lines file of frameworks against a node, daemon client or node pool."""
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, target: Any, input_path: str, output_path: str, chunk_size: int = 64,
+                 concurrency: int = 2, ordered: bool = True, checkpoint_path: Optional[str] = None,
+                 checkpoint_interval: int = 1000, resume: bool = False):
+        if chunk_size <= 0 or concurrency <= 0:
+            raise ValueError("chunk_size and concurrency must be positive.")
+        self.target = target
+        self.input_path = input_path
+        self.output_path = output_path
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.checkpoint_path = checkpoint_path or output_path + ".checkpoint"
+        self.checkpoint_interval = checkpoint_interval
+        self.resume = resume
+
+        # Progress: every record below _watermark is written; _open holds chunks past it
+        self._watermark = 0
+        self._input_offset = 0
+        self._open: "OrderedDict[int, _Chunk]" = OrderedDict()
+        self._skip: Set[int] = set()
+        self._output = None
+        self._output_bytes = 0 # Output length covering fully written chunks only
+        self._since_checkpoint = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    # --- Checkpoints ---
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.checkpoint_path) as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return None
+        if (checkpoint.get("version") != CHECKPOINT_VERSION
+                or checkpoint.get("input") != os.path.abspath(self.input_path)):
+            raise ValueError(f"Checkpoint {self.checkpoint_path} does not belong to {self.input_path}")
+        return checkpoint
+
+    def _write_checkpoint(self):
+        self._output.flush()
+        os.fsync(self._output.fileno())
+        done = [[chunk.start, chunk.end] for chunk in self._open.values()
+                if chunk.written and chunk.start >= self._watermark]
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "input": os.path.abspath(self.input_path),
+            "input_offset": self._input_offset,
+            "watermark": self._watermark,
+            "done": done,
+            "output_bytes": self._output_bytes,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+        }
+        tmp = self.checkpoint_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp, self.checkpoint_path) # Atomic: a crash leaves the old or the new one
+        self._since_checkpoint = 0
+
+    # --- Input ---
+
+    def _chunks(self, handle) -> Iterator[_Chunk]:
+        index, offset = self._watermark, self._input_offset
+        records: List[Tuple[int, Dict[str, Any]]] = []
+        start = index
+        for line in handle:
+            offset += len(line)
+            if not line.strip():
+                continue
+            if index not in self._skip:
+                records.append((index, _parse_line(line)))
+            index += 1
+            if index - start >= self.chunk_size:
+                yield _Chunk(start, index, offset, records)
+                records, start = [], index
+        if index > start:
+            yield _Chunk(start, index, offset, records)
+
+    # --- Execution and output ---
+
+    def _execute(self, chunk: _Chunk) -> List[Dict[str, Any]]:
+        runnable = [(i, parsed["framework"]) for i, (_, parsed) in enumerate(chunk.records) if "error" not in parsed]
+        results = self.target.execute_mandates([framework for _, framework in runnable]) if runnable else []
+        outcomes: List[Dict[str, Any]] = [{"status": "error", "error": parsed.get("error")}
+                                          for _, parsed in chunk.records]
+        for (position, _), result in zip(runnable, results):
+            outcomes[position] = result
+        return outcomes
+
+    def _write(self, chunk: _Chunk, future: Future):
+        try:
+            outcomes = future.result()
+        except Exception as e: # The whole chunk failed (e.g. node not ready): every record errors
+            outcomes = [{"status": "error", "error": f"{type(e).__name__}: {e}"}] * len(chunk.records)
+        lines = []
+        succeeded = 0
+        for (index, parsed), outcome in zip(chunk.records, outcomes):
+            record: Dict[str, Any] = {"index": index}
+            if "id" in parsed:
+                record["id"] = parsed["id"]
+            record.update(outcome)
+            succeeded += record.get("status") == "success"
+            lines.append(json.dumps(record, default=str))
+        data = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+        self._output.write(data)
+        # @AXIOMHIVE: One assignment, so an interrupt checkpoints the chunk either wholly done
+        # (bytes kept, records skipped) or not at all (bytes truncated, records rerun)
+        self._output_bytes, self.succeeded, self.failed, chunk.written = (
+            self._output_bytes + len(data), self.succeeded + succeeded, self.failed + len(lines) - succeeded, True)
+        while self._open and next(iter(self._open.values())).written:
+            done = next(iter(self._open.values()))
+            self._watermark, self._input_offset = done.end, done.end_offset
+            del self._open[done.start] # Only after the watermark covers it, so it is never lost in between
+        self._since_checkpoint += len(lines)
+        if self._since_checkpoint >= self.checkpoint_interval:
+            self._write_checkpoint()
+
+    def _prepare(self) -> int:
+        """Restores a checkpoint when resuming; returns the number of records already done."""
+        checkpoint = self._load_checkpoint() if self.resume else None
+        if checkpoint is None:
+            if self.resume:
+                logger.info(f"No checkpoint at {self.checkpoint_path}; starting from the beginning")
+            self._output = open(self.output_path, "wb")
+            return 0
+        self._watermark, self._input_offset = checkpoint["watermark"], checkpoint["input_offset"]
+        self._skip = {index for start, end in checkpoint["done"] for index in range(start, end)}
+        self.succeeded, self.failed = checkpoint["succeeded"], checkpoint["failed"]
+        self._output_bytes = checkpoint["output_bytes"]
+        self._output = open(self.output_path, "r+b")
+        self._output.truncate(self._output_bytes) # Drop lines written after the checkpoint
+        self._output.seek(self._output_bytes)
+        logger.info(f"Resuming {self.input_path} at record {self._watermark} "
+                    f"({len(self._skip)} later records already written)")
+        return self._watermark + len(self._skip)
+
+    def run(self) -> Dict[str, Any]:
+        """Runs the batch to completion, or until interrupted; returns a report."""
+        resumed = self._prepare()
+        started = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="axiomhive-batch")
+        in_order: "deque[Tuple[_Chunk, Future]]" = deque() # ordered: written oldest first
+        pending: Dict[Future, _Chunk] = {} # unordered: written as they complete
+        interrupted = False
+
+        def write_next():
+            if self.ordered:
+                chunk, future = in_order.popleft()
+                wait([future])
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = next(iter(done))
+                chunk = pending.pop(future)
+            self._write(chunk, future)
+
+        try:
+            with _open_input(self.input_path) as handle:
+                handle.seek(self._input_offset)
+                for chunk in self._chunks(handle):
+                    self._open[chunk.start] = chunk
+                    future = executor.submit(self._execute, chunk)
+                    if self.ordered:
+                        in_order.append((chunk, future))
+                    else:
+                        pending[future] = chunk
+                    # Bounded lookahead keeps memory flat however large the input is
+                    while len(in_order) + len(pending) >= self.concurrency * 2:
+                        write_next()
+            while in_order or pending:
+                write_next()
+        except KeyboardInterrupt:
+            interrupted = True
+            logger.warning(f"Batch interrupted; resume with the checkpoint at {self.checkpoint_path}")
+        finally:
+            executor.shutdown(wait=not interrupted, cancel_futures=interrupted)
+            if interrupted:
+                self._write_checkpoint()
+            self._output.close()
+
+        if not interrupted:
+            try:
+                os.unlink(self.checkpoint_path)
+            except FileNotFoundError:
+                pass
+        elapsed = time.perf_counter() - started
+        processed = self.succeeded + self.failed - resumed
+        return {
+            "input": self.input_path,
+            "output": self.output_path,
+            "ordered": self.ordered,
+            "records": self.succeeded + self.failed,
+            "processed": processed,
+            "resumed": resumed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed_s": elapsed,
+            "throughput_rps": processed / elapsed if elapsed > 0 else 0.0,
+            "interrupted": interrupted,
+        }
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable summary of a batch run report."""
+    lines = [
+        f"Input:           {report['input']}",
+        f"Output:          {report['output']} ({'input order' if report['ordered'] else 'completion order'})",
+        f"Records:         {report['records']} ({report['succeeded']} succeeded, {report['failed']} failed)",
+        f"Processed:       {report['processed']} this run, {report['resumed']} from checkpoint",
+        f"Throughput:      {report['throughput_rps']:.1f} mandates/s over {report['elapsed_s']:.2f}s",
+    ]
+    if report["interrupted"]:
+        lines.append("Status:          INTERRUPTED - rerun with --resume to continue")
+    return "\n".join(lines)
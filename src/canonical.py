@@ -0,0 +1,119 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE CANONICAL: Deterministic Encoding and the Per-Mandate Digest Context
+
+"""
+Canonical serialization for the AXIOMHIVE ZKVS Sieve Protocol.
+
+str(dict) depends on insertion order and on each type's repr, so the same framework
+could hash differently across callers and processes. canonical_encode produces one
+byte string per logical value; MandateContext computes each digest of a mandate once
+and carries it through the Praetorian layers, the ZK step and the data moat.
+
+Encoding rules:
+- str is hashed as its UTF-8 bytes (text is its own canonical form)
+- bytes-like values are hashed as 0xFE followed by the raw bytes
+- everything else is 0xFF followed by compact JSON with sorted keys; tuples become lists
+Neither marker byte can occur in UTF-8, so text never collides with another type. Inside
+the JSON, values JSON cannot represent directly are tagged as {"<NUL><type>": payload}:
+bytes as hex, sets as sorted lists, dicts with any non-str key as sorted [key, value]
+pairs, and unknown types as str(). A str key starting with NUL also forces the pairs
+form, so no user dict can pass for a tag.
+"""
+
+import json
+from typing import Dict, Any, Optional
+
+from src import hashing
+
+_BYTES_MARK = b"\xfe"
+_VALUE_MARK = b"\xff"
+_TAG = "\x00"
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+def _tagged(value: Any) -> Any:
+    """The value as plain JSON data, with every non-JSON type tagged."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, dict):
+        if all(type(key) is str and not key.startswith(_TAG) for key in value):
+            return {key: _tagged(item) for key, item in value.items()}
+        pairs = [[_tagged(key), _tagged(item)] for key, item in value.items()]
+        return {_TAG + "map": sorted(pairs, key=lambda pair: _dumps(pair[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_tagged(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return {_TAG + "set": sorted((_tagged(item) for item in value), key=_dumps)}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {_TAG + "bytes": bytes(value).hex()}
+    return {_TAG + type(value).__name__: str(value)}
+
+def canonical_encode(value: Any) -> bytes:
+    """Deterministic, type-unambiguous byte encoding of a value, identical across runs and processes."""
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return _BYTES_MARK + bytes(value)
+    return _VALUE_MARK + _dumps(_tagged(value)).encode()
+
+def canonical_digest(value: Any) -> bytes:
+    """Raw digest (active hash backend) of a value's canonical encoding."""
+    return hashing.digest(canonical_encode(value))
+
+def canonical_hexdigest(value: Any) -> str:
+    """Hex digest (active hash backend) of a value's canonical encoding."""
+    return hashing.hexdigest(canonical_encode(value))
+
+class MandateContext:
+    """
+    Per-mandate digest cache.
+    Each named digest is computed on first request and reused by every later stage,
+    so the framework, intent and output are each encoded and hashed exactly once.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    __slots__ = ("framework", "_digests", "_hex")
+
+    def __init__(self, framework: Dict[str, Any]):
+        self.framework = framework
+        self._digests: Dict[str, bytes] = {} # Raw digests; hex is rendered once, on demand
+        self._hex: Dict[str, str] = {}
+
+    @property
+    def framework_digest(self) -> str:
+        """Canonical digest of the submitted framework."""
+        return self.digest("framework", self.framework)
+
+    def raw_digest(self, key: str, value: Any) -> bytes:
+        """
+        Raw digest of value, memoized under key for the rest of the mandate.
+        Once cached, value is not looked at again: a key names one value per mandate, and a
+        different value needs a key of its own.
+        """
+        cached = self._digests.get(key)
+        if cached is None:
+            cached = self._digests[key] = canonical_digest(value)
+        return cached
+
+    def digest(self, key: str, value: Any) -> str:
+        """Hex digest of value, memoized under key for the rest of the mandate."""
+        cached = self._hex.get(key)
+        if cached is None:
+            cached = self._hex[key] = self.raw_digest(key, value).hex()
+        return cached
+
+    def combine(self, key: str, *keys: str) -> str:
+        """Hex digest over digests already held under keys (no re-encoding of payloads)."""
+        cached = self._hex.get(key)
+        if cached is None:
+            raw = self._digests[key] = hashing.digest(b"".join(self._digests[k] for k in keys))
+            cached = self._hex[key] = raw.hex()
+        return cached
+
+    def get(self, key: str) -> Optional[str]:
+        """Previously computed hex digest, or None."""
+        raw = self._digests.get(key)
+        return None if raw is None else self.digest(key, None)
+
+    def digests(self) -> Dict[str, str]:
+        return {key: raw.hex() for key, raw in self._digests.items()}
@@ -3,14 +3,21 @@
 # AXIOMHIVE CLI: Command Line Interface for ZKVS Sieve Protocol
 
 import argparse
+import os
 import sys
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Union
 
 # Import the core system
 from src.sovereign_core import ZKVSNodePrime, main
+from src.batch_runner import BatchRunner, format_report as format_batch_report
+from src.config import get_config
+from src.daemon import NodeDaemon, DaemonClient, DaemonError
+from src.instrumentation import format_stage_table
+from src.load_generator import LoadGenerator, synthetic_frameworks, load_frameworks, format_report
+from src.replay import Replayer, read_capture, format_report as format_replay_report
 
 # Configure CLI logging
 logging.basicConfig(
@@ -22,14 +29,25 @@ logger = logging.getLogger('AXIOMHIVE.CLI')
 class AXIOMHIVE_CLI:
     """Command Line Interface for AXIOMHIVE ZKVS Sieve Protocol."""
 
-    def __init__(self):
-        self.node: Optional[ZKVSNodePrime] = None
+    def __init__(self, socket_path: Optional[str] = None):
+        self.node: Optional[Union[ZKVSNodePrime, DaemonClient]] = None
+        self.socket_path = socket_path # Daemon to use when it is running; None always runs in-process
 
     def initialize_node(self) -> bool:
-        """Initialize the ZKVS Node Prime."""
+        """Connect to the running daemon, or initialize an in-process ZKVS Node Prime."""
+        if self.socket_path and DaemonClient.is_running(self.socket_path):
+            self.node = DaemonClient(self.socket_path)
+            logger.info(f"✓ Connected to AXIOMHIVE daemon at {self.socket_path}")
+            return True
         try:
             logger.info("Initializing AXIOMHIVE ZKVS Node Prime...")
-            self.node = ZKVSNodePrime()
+            snapshot_path = get_config().node_snapshot_path
+            if snapshot_path:
+                from src.snapshot import ensure_snapshot
+                ensure_snapshot(snapshot_path)
+                self.node = ZKVSNodePrime.from_snapshot(snapshot_path)
+            else:
+                self.node = ZKVSNodePrime()
             logger.info("✓ Node initialized successfully")
             return True
         except Exception as e:
@@ -37,7 +55,8 @@ class AXIOMHIVE_CLI:
             return False
 
     def execute_intent(self, intent: str, context: str = "general",
-                      priority: str = "normal", output_file: str = None) -> bool:
+                      priority: str = "normal", output_file: str = None,
+                      idempotency_key: Optional[str] = None) -> bool:
         """Execute a mandate through the AXIOMHIVE system."""
 
         if not self.node:
@@ -57,7 +76,7 @@ class AXIOMHIVE_CLI:
             logger.info(f"Context: {context}, Priority: {priority}")
 
             # Execute the mandate
-            result = self.node.execute_mandate(framework)
+            result = self.node.execute_mandate(framework, idempotency_key=idempotency_key)
 
             # Display result
             print("\n" + "="*80)
@@ -68,19 +87,7 @@ class AXIOMHIVE_CLI:
 
             # Save to file if requested
             if output_file:
-                try:
-                    with open(output_file, 'w') as f:
-                        f.write("AXIOMHIVE EXECUTION RESULT\n")
-                        f.write("="*80 + "\n")
-                        f.write(f"Intent: {intent}\n")
-                        f.write(f"Context: {context}\n")
-                        f.write(f"Priority: {priority}\n")
-                        f.write("="*80 + "\n")
-                        f.write(result)
-                        f.write("\n" + "="*80)
-                    logger.info(f"✓ Result saved to: {output_file}")
-                except Exception as e:
-                    logger.error(f"✗ Failed to save result: {e}")
+                self._save_results(output_file, [(intent, result)], context, priority)
 
             return True
 
@@ -88,6 +95,63 @@ class AXIOMHIVE_CLI:
             logger.error(f"✗ Execution failed: {e}")
             return False
 
+    def execute_intents(self, intents: List[str], context: str = "general",
+                        priority: str = "normal", output_file: str = None) -> bool:
+        """Execute several mandates; against the daemon they are pipelined in one round trip."""
+        if not self.node:
+            if not self.initialize_node():
+                return False
+
+        frameworks = [{"intent": intent, "context": context, "priority": priority, "timestamp": None}
+                      for intent in intents]
+        logger.info(f"Executing {len(intents)} intents (Context: {context}, Priority: {priority})")
+        try:
+            if isinstance(self.node, DaemonClient):
+                results = self.node.execute_pipelined(frameworks)
+            else:
+                results = []
+                for framework in frameworks:
+                    try:
+                        results.append(self.node.execute_mandate(framework))
+                    except Exception as e:
+                        results.append(e)
+        except (OSError, DaemonError) as e:
+            logger.error(f"✗ Execution failed: {e}")
+            return False
+
+        succeeded = []
+        for intent, result in zip(intents, results):
+            print("\n" + "="*80)
+            print(f"AXIOMHIVE EXECUTION RESULT: {intent[:60]}{'...' if len(intent) > 60 else ''}")
+            print("="*80)
+            if isinstance(result, Exception):
+                logger.error(f"✗ Execution failed: {result}")
+                print(f"FAILED: {result}")
+            else:
+                print(result)
+                succeeded.append((intent, result))
+            print("="*80)
+
+        if output_file:
+            self._save_results(output_file, succeeded, context, priority)
+        return len(succeeded) == len(intents)
+
+    def _save_results(self, output_file: str, results: List[Any], context: str, priority: str):
+        try:
+            with open(output_file, 'w') as f:
+                for intent, result in results:
+                    f.write("AXIOMHIVE EXECUTION RESULT\n")
+                    f.write("="*80 + "\n")
+                    f.write(f"Intent: {intent}\n")
+                    f.write(f"Context: {context}\n")
+                    f.write(f"Priority: {priority}\n")
+                    f.write("="*80 + "\n")
+                    f.write(result)
+                    f.write("\n" + "="*80)
+            logger.info(f"✓ Result saved to: {output_file}")
+        except Exception as e:
+            logger.error(f"✗ Failed to save result: {e}")
+
     def show_status(self) -> bool:
         """Show system status and metrics."""
         if not self.node:
@@ -96,18 +160,28 @@ class AXIOMHIVE_CLI:
 
         try:
             # Get system metrics
-            ledger_count = len(self.node._verifiable_ledger)
-            moat_strength = self.node._data_moat_engine._moat_strength
-            refinement_count = self.node._data_moat_engine._model_refinement_count
+            status = self.node.status()
 
             print("\n" + "="*60)
             print("AXIOMHIVE SYSTEM STATUS")
             print("="*60)
-            print(f"Node Status: {'READY' if self.node._is_ready else 'INITIALIZING'}")
-            print(f"Verifiable Events: {ledger_count}")
-            print(f"Data Moat Strength: {moat_strength:.4f}")
-            print(f"Model Refinements: {refinement_count}")
-            print(f"Axiom Adherence: {self.node.AXIOMS}")
+            if "pid" in status:
+                print(f"Daemon: pid {status['pid']}, up {status['uptime_s']:.0f}s, "
+                      f"{status['daemon_requests']} requests served")
+            print(f"Node Status: {'READY' if status['ready'] else 'INITIALIZING'}")
+            print(f"Verifiable Events: {status['ledger_events']}")
+            print(f"Data Moat Strength: {status['moat_strength']:.4f}")
+            print(f"Model Refinements: {status['model_refinements']}")
+            print(f"Axiom Adherence: {status['axioms']}")
+            cache_stats = status['cache']
+            if cache_stats is not None:
+                print(f"Mandate Cache: {cache_stats['size']}/{cache_stats['max_entries']} entries, "
+                      f"{cache_stats['hits']} hits, {cache_stats['misses']} misses")
+            stage_metrics = status['stage_metrics']
+            print("-"*60)
+            print(f"Stage Latency (slow mandates > {stage_metrics['slow_threshold_s'] * 1e3:.1f}ms: "
+                  f"{stage_metrics['slow_mandates']})")
+            print(format_stage_table(stage_metrics["stages"]))
             print("="*60)
 
             return True
@@ -123,25 +197,248 @@ class AXIOMHIVE_CLI:
                 return False
 
         try:
+            events = self.node.ledger_events()
             export_data = {
-                "node_id": self.node.HASH_PREFIX[:16],
+                "node_id": ZKVSNodePrime.HASH_PREFIX[:16],
                 "export_timestamp": None,  # Will be set by JSON serialization
-                "total_events": len(self.node._verifiable_ledger),
-                "axiom_lattice": self.node.AXIOMS,
-                "events": self.node._verifiable_ledger
+                "total_events": len(events),
+                "axiom_lattice": ZKVSNodePrime.AXIOMS,
+                "events": events
             }
 
             with open(output_file, 'w') as f:
                 json.dump(export_data, f, indent=2, default=str)
 
             logger.info(f"✓ Ledger exported to: {output_file}")
-            print(f"✓ Verifiable ledger exported with {len(self.node._verifiable_ledger)} events")
+            print(f"✓ Verifiable ledger exported with {len(events)} events")
             return True
 
         except Exception as e:
             logger.error(f"✗ Failed to export ledger: {e}")
             return False
 
+    def run_batch(self, input_file: str, output_file: str, pool_workers: Optional[int] = None,
+                  chunk_size: int = 64, concurrency: Optional[int] = None, ordered: bool = True,
+                  resume: bool = False) -> bool:
+        """Execute a JSON-lines file of frameworks in chunks, checkpointing so it can resume."""
+        pool = None
+        if pool_workers is not None:
+            from src.node_pool import NodePoolSupervisor
+            logger.info(f"Starting node pool with {pool_workers or 'auto'} workers...")
+            pool = NodePoolSupervisor(workers=pool_workers)
+            target = pool
+        else:
+            if not self.node:
+                if not self.initialize_node():
+                    return False
+            target = self.node
+
+        try:
+            # A pool already spreads each chunk over its workers; two chunks in flight keep them busy
+            runner = BatchRunner(target, input_file, output_file, chunk_size=chunk_size,
+                                 concurrency=concurrency or 2, ordered=ordered, resume=resume)
+            report = runner.run()
+        except (OSError, ValueError) as e:
+            logger.error(f"✗ Batch failed: {e}")
+            return False
+        finally:
+            if pool is not None:
+                pool.close()
+
+        print("\n" + "="*60)
+        print("AXIOMHIVE BATCH EXECUTION")
+        print("="*60)
+        print(format_batch_report(report))
+        print("="*60)
+        return not report["interrupted"] and report["failed"] == 0
+
+    def save_snapshot(self, output_file: Optional[str] = None) -> bool:
+        """Write a warm-start snapshot for pool workers and CLI nodes."""
+        from src.snapshot import ensure_snapshot, SnapshotError
+        output_file = output_file or get_config().node_snapshot_path or "axiomhive_snapshot.json"
+        try:
+            if os.path.exists(output_file):
+                os.unlink(output_file) # Always rebuild on request
+            snapshot = ensure_snapshot(output_file)
+        except (OSError, SnapshotError) as e:
+            logger.error(f"✗ Failed to save snapshot: {e}")
+            return False
+        print(f"✓ Snapshot saved to {output_file}: {len(snapshot['agent_specs'])} agents, "
+              f"{len(snapshot['warm_agents'])} loaded at start")
+        return True
+
+    def run_load(self, mode: str = "closed", duration: float = 10.0, concurrency: int = 8,
+                 rate: float = 100.0, pool_workers: Optional[int] = None, frameworks_file: Optional[str] = None,
+                 unique: int = 1000, intent_size: int = 256, output_file: Optional[str] = None) -> bool:
+        """Drive a node or node pool with synthetic or recorded frameworks and report the results."""
+        try:
+            frameworks = (load_frameworks(frameworks_file) if frameworks_file
+                          else synthetic_frameworks(unique, intent_size))
+        except (OSError, ValueError) as e:
+            logger.error(f"✗ Failed to load frameworks: {e}")
+            return False
+
+        pool = None
+        if pool_workers is not None:
+            from src.node_pool import NodePoolSupervisor
+            logger.info(f"Starting node pool with {pool_workers or 'auto'} workers...")
+            pool = NodePoolSupervisor(workers=pool_workers)
+            target = pool
+        else:
+            if not self.node:
+                if not self.initialize_node():
+                    return False
+            target = self.node
+
+        try:
+            report = LoadGenerator(target, frameworks, mode=mode, concurrency=concurrency,
+                                   rate=rate, duration=duration).run()
+        except Exception as e:
+            logger.error(f"✗ Load test failed: {e}")
+            return False
+        finally:
+            if pool is not None:
+                pool.close()
+
+        report["target"] = f"pool({pool.worker_count})" if pool is not None else "node"
+        report["frameworks"] = frameworks_file or f"synthetic({len(frameworks)})"
+        print("\n" + "="*60)
+        print("AXIOMHIVE LOAD TEST")
+        print("="*60)
+        print(f"Target:          {report['target']}, frameworks: {report['frameworks']}")
+        print(format_report(report))
+        print("="*60)
+
+        if output_file:
+            with open(output_file, 'w') as f:
+                json.dump(report, f, indent=2)
+            logger.info(f"✓ Load report saved to: {output_file}")
+        return report["errors"] == 0
+
+    def run_replay(self, capture_file: str, speed: float = 1.0, concurrency: int = 8,
+                   pool_workers: Optional[int] = None, verify: bool = True,
+                   output_file: Optional[str] = None) -> bool:
+        """Re-drive captured traffic against a node or node pool, checking result hashes."""
+        try:
+            capture = read_capture(capture_file)
+        except (OSError, ValueError) as e:
+            logger.error(f"✗ Failed to read capture: {e}")
+            return False
+
+        pool = None
+        if pool_workers is not None:
+            from src.node_pool import NodePoolSupervisor
+            pool = NodePoolSupervisor(workers=pool_workers)
+            target = pool
+        else:
+            if not self.node:
+                if not self.initialize_node():
+                    return False
+            target = self.node
+
+        try:
+            report = Replayer(target, capture, speed=speed, concurrency=concurrency, verify=verify).run()
+        except Exception as e:
+            logger.error(f"✗ Replay failed: {e}")
+            return False
+        finally:
+            if pool is not None:
+                pool.close()
+
+        print("\n" + "="*60)
+        print("AXIOMHIVE REPLAY")
+        print("="*60)
+        print(f"Capture:         {capture_file} ({capture['header'].get('source', 'node')})")
+        print(format_replay_report(report))
+        print("="*60)
+
+        if output_file:
+            with open(output_file, 'w') as f:
+                json.dump(report, f, indent=2)
+            logger.info(f"✓ Replay report saved to: {output_file}")
+        return report["mismatched"] == 0 and report["unexpected_errors"] == 0
+
+    def run_daemon(self, detach: bool = False, workers: Optional[int] = None) -> bool:
+        """Host a long-lived node on the daemon socket, in the foreground or detached."""
+        socket_path = self.socket_path or get_config().daemon_socket_path
+        if DaemonClient.is_running(socket_path):
+            logger.error(f"✗ An AXIOMHIVE daemon is already running on {socket_path}")
+            return False
+
+        if detach:
+            import subprocess
+            import time
+            command = [sys.executable, "-m", "src.cli", "--socket", socket_path, "daemon", "start"]
+            if workers:
+                command += ["--workers", str(workers)]
+            process = subprocess.Popen(command, cwd=str(Path(__file__).resolve().parent.parent),
+                                       stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.DEVNULL, start_new_session=True)
+            deadline = time.monotonic() + 30.0
+            while time.monotonic() < deadline:
+                if DaemonClient.is_running(socket_path):
+                    logger.info(f"✓ AXIOMHIVE daemon started (pid {process.pid}) on {socket_path}")
+                    return True
+                if process.poll() is not None:
+                    break
+                time.sleep(0.05)
+            logger.error("✗ AXIOMHIVE daemon failed to start")
+            return False
+
+        import signal
+        import threading
+        try:
+            daemon = NodeDaemon(socket_path=socket_path, workers=workers)
+        except (OSError, RuntimeError) as e:
+            logger.error(f"✗ Failed to start daemon: {e}")
+            return False
+        stop = lambda *_: threading.Thread(target=daemon.shutdown, daemon=True).start()
+        signal.signal(signal.SIGTERM, stop)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            daemon.close()
+        return True
+
+    def stop_daemon(self) -> bool:
+        """Ask the running daemon to shut down."""
+        socket_path = self.socket_path or get_config().daemon_socket_path
+        if not DaemonClient.is_running(socket_path):
+            logger.error(f"✗ No AXIOMHIVE daemon running on {socket_path}")
+            return False
+        client = DaemonClient(socket_path)
+        try:
+            client.shutdown()
+        finally:
+            client.close()
+        logger.info("✓ AXIOMHIVE daemon stopping")
+        return True
+
+    def run_server(self, host: Optional[str] = None, port: Optional[int] = None,
+                   max_connections: Optional[int] = None, pool_workers: Optional[int] = None) -> bool:
+        """Serve a node (or node pool) over JSON/HTTP until interrupted, then drain."""
+        from src.server import NodeServer
+        pool = None
+        if pool_workers is not None:
+            from src.node_pool import NodePoolSupervisor
+            pool = NodePoolSupervisor(workers=pool_workers)
+            target = pool
+        else:
+            if not self.node:
+                if not self.initialize_node():
+                    return False
+            target = self.node
+
+        try:
+            NodeServer(target, host, port, max_connections).serve_forever()
+        except OSError as e:
+            logger.error(f"✗ Failed to start server: {e}")
+            return False
+        finally:
+            if pool is not None:
+                pool.close()
+        return True
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser for CLI."""
     parser = argparse.ArgumentParser(
@@ -149,18 +446,31 @@ def create_parser() -> argparse.ArgumentParser:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
+  %(prog)s daemon start --detach
+  %(prog)s serve --port 8080
   %(prog)s execute "Architect market dominance through verifiable systems"
+  %(prog)s execute "Filter the data stream" "Forecast demand" --context technical
   %(prog)s execute "Optimize supply chain efficiency" --context commercial --priority high
+  %(prog)s execute-batch frameworks.jsonl --output results.jsonl --workers 4
+  %(prog)s execute-batch frameworks.jsonl --output results.jsonl --resume
   %(prog)s status
   %(prog)s export-ledger --output audit.json
+  %(prog)s snapshot --output node.snapshot.json
+  %(prog)s load --mode open --rate 200 --duration 30 --pool-workers 4
+  AXIOMHIVE_CAPTURE_PATH=capture.jsonl.gz %(prog)s load --duration 30
+  %(prog)s replay capture.jsonl.gz --speed 2
         """
     )
 
+    parser.add_argument('--socket', help='Daemon socket path (default: daemon_socket_path / AXIOMHIVE_DAEMON_SOCKET)')
+    parser.add_argument('--no-daemon', action='store_true',
+                        help='Run in-process even when a daemon is running')
+
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
     # Execute command
-    execute_parser = subparsers.add_parser('execute', help='Execute an intent')
-    execute_parser.add_argument('intent', help='The intent to execute')
+    execute_parser = subparsers.add_parser('execute', help='Execute one or more intents')
+    execute_parser.add_argument('intent', nargs='+', help='The intent(s) to execute; several are pipelined to the daemon')
     execute_parser.add_argument('--context', default='general',
                                choices=['general', 'commercial', 'technical', 'strategic'],
                                help='Execution context')
@@ -168,6 +478,21 @@ Examples:
                                choices=['low', 'normal', 'high', 'absolute'],
                                help='Execution priority')
     execute_parser.add_argument('--output', help='Save result to file')
+    execute_parser.add_argument('--idempotency-key',
+                               help='Client key identifying retries of the same mandate (requires enable_mandate_cache)')
+
+    # Execute-batch command
+    batch_parser = subparsers.add_parser('execute-batch', help='Execute a JSON-lines file of frameworks')
+    batch_parser.add_argument('input', help='Frameworks, one per line or under "framework" (optionally .gz)')
+    batch_parser.add_argument('--output', required=True, help='Results file, one JSON line per input record')
+    batch_parser.add_argument('--workers', type=int,
+                             help='Run on a node pool with this many workers (0 = one per CPU) instead of one node')
+    batch_parser.add_argument('--chunk-size', type=int, default=64, help='Frameworks per execute_mandates call')
+    batch_parser.add_argument('--concurrency', type=int, help='Chunks in flight (default: 2)')
+    batch_parser.add_argument('--order', default='input', choices=['input', 'completion'],
+                             help='Write results in input order or as chunks complete')
+    batch_parser.add_argument('--resume', action='store_true',
+                             help='Continue an interrupted run from its checkpoint (<output>.checkpoint)')
 
     # Status command
     status_parser = subparsers.add_parser('status', help='Show system status')
@@ -177,6 +502,50 @@ Examples:
     export_parser.add_argument('--output', default='axiomhive_ledger.json',
                               help='Output file path')
 
+    # Snapshot command
+    snapshot_parser = subparsers.add_parser('snapshot', help='Write a warm-start node snapshot')
+    snapshot_parser.add_argument('--output', help='Snapshot path (default: node_snapshot_path / AXIOMHIVE_NODE_SNAPSHOT)')
+
+    # Daemon command
+    daemon_parser = subparsers.add_parser('daemon', help='Run or stop the long-lived node daemon')
+    daemon_parser.add_argument('action', choices=['start', 'stop'], help='start serves in the foreground unless --detach')
+    daemon_parser.add_argument('--detach', action='store_true', help='Start in the background and return once listening')
+    daemon_parser.add_argument('--workers', type=int, help='Request threads (default: daemon_workers)')
+
+    # Serve command
+    serve_parser = subparsers.add_parser('serve', help='Serve the node over JSON/HTTP (Ctrl-C drains and stops)')
+    serve_parser.add_argument('--host', help='Listen address (default: listen_host)')
+    serve_parser.add_argument('--port', type=int, help='Listen port (default: listen_port)')
+    serve_parser.add_argument('--max-connections', type=int, help='Connection limit (default: max_connections)')
+    serve_parser.add_argument('--pool-workers', type=int,
+                             help='Serve a node pool with this many workers (0 = one per CPU) instead of one node')
+
+    # Load command
+    load_parser = subparsers.add_parser('load', help='Drive a node or node pool with synthetic or recorded load')
+    load_parser.add_argument('--mode', default='closed', choices=['closed', 'open'],
+                            help='closed: fixed concurrency; open: fixed arrival rate')
+    load_parser.add_argument('--duration', type=float, default=10.0, help='Test duration in seconds')
+    load_parser.add_argument('--concurrency', type=int, default=8,
+                            help='Concurrent clients (closed loop) or maximum in flight (open loop)')
+    load_parser.add_argument('--rate', type=float, default=100.0, help='Target mandates per second (open loop)')
+    load_parser.add_argument('--pool-workers', type=int,
+                            help='Drive a node pool with this many workers (0 = one per CPU) instead of one node')
+    load_parser.add_argument('--frameworks', help='Recorded frameworks (JSON lines, optionally .gz) instead of synthetic ones')
+    load_parser.add_argument('--unique', type=int, default=1000, help='Distinct synthetic frameworks')
+    load_parser.add_argument('--intent-size', type=int, default=256, help='Synthetic intent length in characters')
+    load_parser.add_argument('--output', help='Save the JSON report to file')
+
+    # Replay command
+    replay_parser = subparsers.add_parser('replay', help='Replay captured traffic and verify output hashes')
+    replay_parser.add_argument('capture', help='Capture file recorded with capture_path / AXIOMHIVE_CAPTURE_PATH')
+    replay_parser.add_argument('--speed', type=float, default=1.0,
+                              help='Pace relative to the recording (2 = twice as fast, 0 = as fast as possible)')
+    replay_parser.add_argument('--concurrency', type=int, default=8, help='Maximum mandates in flight')
+    replay_parser.add_argument('--pool-workers', type=int,
+                              help='Replay against a node pool with this many workers (0 = one per CPU)')
+    replay_parser.add_argument('--no-verify', action='store_true', help='Skip output hash verification')
+    replay_parser.add_argument('--output', help='Save the JSON report to file')
+
     return parser
 
 def main():
@@ -189,18 +558,55 @@ def main():
         return 1
 
     # Initialize CLI
-    cli = AXIOMHIVE_CLI()
+    socket_path = args.socket or get_config().daemon_socket_path
+    cli = AXIOMHIVE_CLI(socket_path=None if args.no_daemon and args.command != 'daemon' else socket_path)
 
     # Execute commands
     if args.command == 'execute':
-        success = cli.execute_intent(
-            intent=args.intent,
-            context=args.context,
-            priority=args.priority,
-            output_file=args.output
+        if len(args.intent) == 1:
+            success = cli.execute_intent(
+                intent=args.intent[0],
+                context=args.context,
+                priority=args.priority,
+                output_file=args.output,
+                idempotency_key=args.idempotency_key
+            )
+        elif args.idempotency_key:
+            logger.error("--idempotency-key applies to a single intent")
+            success = False
+        else:
+            success = cli.execute_intents(
+                intents=args.intent,
+                context=args.context,
+                priority=args.priority,
+                output_file=args.output
+            )
+        return 0 if success else 1
+
+    elif args.command == 'execute-batch':
+        success = cli.run_batch(
+            input_file=args.input,
+            output_file=args.output,
+            pool_workers=args.workers,
+            chunk_size=args.chunk_size,
+            concurrency=args.concurrency,
+            ordered=args.order == 'input',
+            resume=args.resume
         )
         return 0 if success else 1
 
+    elif args.command == 'serve':
+        success = cli.run_server(args.host, args.port, args.max_connections, args.pool_workers)
+        return 0 if success else 1
+
+    elif args.command == 'daemon':
+        success = cli.run_daemon(args.detach, args.workers) if args.action == 'start' else cli.stop_daemon()
+        return 0 if success else 1
+
+    elif args.command == 'snapshot':
+        success = cli.save_snapshot(args.output)
+        return 0 if success else 1
+
     elif args.command == 'status':
         success = cli.show_status()
         return 0 if success else 1
@@ -209,6 +615,31 @@ def main():
         success = cli.export_ledger(args.output)
         return 0 if success else 1
 
+    elif args.command == 'load':
+        success = cli.run_load(
+            mode=args.mode,
+            duration=args.duration,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            pool_workers=args.pool_workers,
+            frameworks_file=args.frameworks,
+            unique=args.unique,
+            intent_size=args.intent_size,
+            output_file=args.output
+        )
+        return 0 if success else 1
+
+    elif args.command == 'replay':
+        success = cli.run_replay(
+            capture_file=args.capture,
+            speed=args.speed,
+            concurrency=args.concurrency,
+            pool_workers=args.pool_workers,
+            verify=not args.no_verify,
+            output_file=args.output
+        )
+        return 0 if success else 1
+
     else:
         logger.error(f"Unknown command: {args.command}")
         return 1
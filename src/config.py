@@ -15,12 +15,16 @@ This module provides centralized configuration management with support for:
 import os
 import json
 import logging
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
 
 logger = logging.getLogger('AXIOMHIVE.Config')
 
+def runtime_dir() -> str:
+    """Per-user directory for local sockets: $XDG_RUNTIME_DIR, else a private directory under /tmp."""
+    return os.environ.get("XDG_RUNTIME_DIR") or f"/tmp/axiomhive-{os.getuid()}"
+
 @dataclass
 class AXIOMHIVEConfig:
     """Configuration dataclass for AXIOMHIVE system."""
@@ -38,6 +42,7 @@ class AXIOMHIVEConfig:
 
     # Security settings
     zk_proof_model: str = "PlonK-over-HyperPlonK"
+    hash_algorithm: str = "sha256"  # sha256 | blake2b | blake2s (see `python -m src.hashing`)
     encryption_enabled: bool = True
     audit_log_enabled: bool = True
 
@@ -53,14 +58,74 @@ class AXIOMHIVEConfig:
     enable_trust_metrics: bool = True
     enable_ethical_guardrails: bool = True
 
-    # Network settings (for future distributed deployment)
+    # Dagger agent registry: extra/overriding agents as {"agent_name": "module:Class"}
+    dagger_agents: Dict[str, str] = field(default_factory=dict)
+    dagger_agent_entry_points: bool = True
+
+    # Process-isolated execution for CPU-bound agents (empty list disables the pool)
+    process_pool_agents: List[str] = field(default_factory=list)
+    process_pool_workers: int = 0  # 0 = one warm worker per CPU core
+    process_pool_deadline: float = 30.0  # seconds before a worker is restarted
+
+    # Multi-process node pool (src/node_pool.py)
+    node_pool_deadline: float = 60.0  # seconds a worker may spend on one request before it is restarted
+
+    # End-to-end mandate result cache (keyed by framework digest or idempotency key)
+    enable_mandate_cache: bool = False
+    mandate_cache_size: int = 1024
+    mandate_cache_ttl: float = 300.0  # seconds; 0 disables expiry
+
+    # Metrics endpoint (Prometheus text format at http://metrics_host:metrics_port/metrics)
+    enable_metrics: bool = False
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int = 9464
+
+    # Per-mandate tracing (spans exported as JSON lines, or kept in memory with trace_exporter="memory")
+    enable_tracing: bool = False
+    trace_sample_rate: float = 0.1  # fraction of mandates traced
+    trace_exporter: str = "jsonl"  # jsonl | memory
+    trace_export_path: str = "axiomhive_traces.jsonl"
+
+    # Traffic capture for replay (gzip JSON lines of incoming frameworks; empty disables)
+    capture_path: str = ""
+
+    # Warm-start snapshot for pool workers and CLI nodes (src/snapshot.py; empty disables)
+    node_snapshot_path: str = ""
+
+    # Long-lived node daemon behind a Unix domain socket (the CLI's default backend when running)
+    daemon_socket_path: str = field(default_factory=lambda: os.path.join(runtime_dir(), "axiomhive.sock"))
+    daemon_workers: int = 8  # threads executing daemon requests
+
+    # Binary RPC for co-located clients (the daemon also serves it when enable_rpc is set)
+    enable_rpc: bool = False
+    rpc_socket_path: str = field(default_factory=lambda: os.path.join(runtime_dir(), "axiomhive-rpc.sock"))
+    rpc_shared_memory_threshold: int = 64 * 1024  # payload bytes above which shared memory is used
+
+    # JSON-over-HTTP/1.1 server (the daemon also serves HTTP when enable_networking is set)
     enable_networking: bool = False
+    listen_host: str = "127.0.0.1"
     listen_port: int = 8080
     max_connections: int = 100
+    server_workers: int = 8  # threads executing mandates for the server
+    keepalive_timeout: float = 15.0  # seconds an idle keep-alive connection is held open
+    drain_timeout: float = 30.0  # seconds in-flight requests get to finish on shutdown
+
+    # Admission control for server and daemon mandate requests
+    enable_admission_control: bool = True
+    admission_max_in_flight: int = 0  # 0 = one per server/daemon worker thread
+    admission_queue_size: int = 0  # 0 = max_connections
+    admission_max_wait: float = 1.0  # seconds a request may wait in the intake queue
+    client_rate_limit: float = 0.0  # mandates per second per client; 0 disables
+    client_burst: float = 50.0  # token bucket depth per client
 
     # Development settings
     debug_mode: bool = False
     profile_performance: bool = False
+    profile_mode: str = "sample"  # sample | cprofile
+    profile_output_dir: str = "profiles"
+    profile_sample_interval: float = 0.001  # seconds between stack samples
+    profile_dump_interval: float = 60.0  # seconds between report dumps
+    profile_memory: bool = True  # tracemalloc allocation report per component
 
 class ConfigManager:
     """Configuration manager for AXIOMHIVE system."""
@@ -121,6 +186,29 @@ class ConfigManager:
             'AXIOMHIVE_TRUST_THRESHOLD': 'trust_threshold',
             'AXIOMHIVE_REBOOT_THRESHOLD': 'reboot_threshold',
             'AXIOMHIVE_MAX_LEDGER_EVENTS': 'max_ledger_events',
+            'AXIOMHIVE_HASH_ALGORITHM': 'hash_algorithm',
+            'AXIOMHIVE_ENABLE_MANDATE_CACHE': 'enable_mandate_cache',
+            'AXIOMHIVE_MANDATE_CACHE_TTL': 'mandate_cache_ttl',
+            'AXIOMHIVE_PROFILE_PERFORMANCE': 'profile_performance',
+            'AXIOMHIVE_PROFILE_MODE': 'profile_mode',
+            'AXIOMHIVE_PROFILE_OUTPUT_DIR': 'profile_output_dir',
+            'AXIOMHIVE_ENABLE_METRICS': 'enable_metrics',
+            'AXIOMHIVE_METRICS_PORT': 'metrics_port',
+            'AXIOMHIVE_ENABLE_TRACING': 'enable_tracing',
+            'AXIOMHIVE_TRACE_SAMPLE_RATE': 'trace_sample_rate',
+            'AXIOMHIVE_TRACE_EXPORT_PATH': 'trace_export_path',
+            'AXIOMHIVE_CAPTURE_PATH': 'capture_path',
+            'AXIOMHIVE_NODE_SNAPSHOT': 'node_snapshot_path',
+            'AXIOMHIVE_DAEMON_SOCKET': 'daemon_socket_path',
+            'AXIOMHIVE_DAEMON_WORKERS': 'daemon_workers',
+            'AXIOMHIVE_ENABLE_RPC': 'enable_rpc',
+            'AXIOMHIVE_RPC_SOCKET': 'rpc_socket_path',
+            'AXIOMHIVE_ENABLE_NETWORKING': 'enable_networking',
+            'AXIOMHIVE_LISTEN_HOST': 'listen_host',
+            'AXIOMHIVE_LISTEN_PORT': 'listen_port',
+            'AXIOMHIVE_MAX_CONNECTIONS': 'max_connections',
+            'AXIOMHIVE_ENABLE_ADMISSION_CONTROL': 'enable_admission_control',
+            'AXIOMHIVE_CLIENT_RATE_LIMIT': 'client_rate_limit',
         }
 
         for env_var, config_attr in env_mappings.items():
@@ -129,16 +217,21 @@ class ConfigManager:
                 # Type conversion
                 if config_attr in ['debug_mode', 'enable_data_moat', 'enable_complexity_sieve',
                                  'enable_trust_metrics', 'enable_ethical_guardrails', 'enable_networking',
-                                 'encryption_enabled', 'audit_log_enabled', 'profile_performance']:
+                                 'encryption_enabled', 'audit_log_enabled', 'profile_performance',
+                                 'enable_mandate_cache', 'enable_metrics', 'enable_tracing',
+                                 'enable_admission_control', 'enable_rpc']:
                     value = value.lower() in ('true', '1', 'yes', 'on')
-                elif config_attr in ['trust_threshold', 'reboot_threshold', 'density_threshold']:
+                elif config_attr in ['trust_threshold', 'reboot_threshold', 'density_threshold',
+                                     'mandate_cache_ttl', 'trace_sample_rate', 'keepalive_timeout', 'drain_timeout',
+                                     'admission_max_wait', 'client_rate_limit', 'client_burst']:
                     try:
                         value = float(value)
                     except ValueError:
                         logger.warning(f"Invalid float value for {env_var}: {value}")
                         continue
                 elif config_attr in ['max_ledger_events', 'log_max_size', 'log_backup_count',
-                                   'listen_port', 'max_connections']:
+                                   'listen_port', 'max_connections', 'metrics_port', 'daemon_workers',
+                                   'server_workers']:
                     try:
                         value = int(value)
                     except ValueError:
@@ -208,6 +301,22 @@ class ConfigManager:
             (config.density_threshold > 0, "density_threshold must be positive"),
             (len(config.node_id) > 0, "node_id cannot be empty"),
             (len(config.hash_prefix) >= 16, "hash_prefix must be at least 16 characters"),
+            (config.hash_algorithm in ("sha256", "blake2b", "blake2s"), "hash_algorithm must be sha256, blake2b or blake2s"),
+            (config.mandate_cache_size > 0, "mandate_cache_size must be positive"),
+            (config.mandate_cache_ttl >= 0, "mandate_cache_ttl must be non-negative"),
+            (config.profile_mode in ("sample", "cprofile"), "profile_mode must be sample or cprofile"),
+            (config.profile_sample_interval > 0, "profile_sample_interval must be positive"),
+            (0 <= config.metrics_port <= 65535, "metrics_port must be a valid TCP port"),
+            (0 <= config.trace_sample_rate <= 1, "trace_sample_rate must be between 0 and 1"),
+            (config.daemon_workers > 0, "daemon_workers must be positive"),
+            (config.rpc_shared_memory_threshold > 0, "rpc_shared_memory_threshold must be positive"),
+            (0 <= config.listen_port <= 65535, "listen_port must be a valid TCP port"),
+            (config.max_connections > 0, "max_connections must be positive"),
+            (config.server_workers > 0, "server_workers must be positive"),
+            (config.admission_max_in_flight >= 0, "admission_max_in_flight must be non-negative"),
+            (config.admission_queue_size >= 0, "admission_queue_size must be non-negative"),
+            (config.client_rate_limit >= 0, "client_rate_limit must be non-negative"),
+            (config.trace_exporter in ("jsonl", "memory"), "trace_exporter must be jsonl or memory"),
         ]
 
         all_valid = True
@@ -0,0 +1,415 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE DAEMON: Long-Lived Node Behind a Unix Domain Socket
+
+"""
+Node daemon for the AXIOMHIVE ZKVS Sieve Protocol.
+
+NodeDaemon hosts one ZKVSNodePrime for the life of the process and serves it on a Unix
+domain socket ('daemon_socket_path', AXIOMHIVE_DAEMON_SOCKET), so CLI commands share one
+ledger and skip node initialization. The socket is created owner-only (0600) in the
+user's runtime directory, and clients refuse a daemon run by another (non-root) user. With
+'enable_networking' the daemon also serves the node over HTTP (src/server.py), and with
+'enable_rpc' over the binary RPC socket (src/rpc.py).
+
+Protocol: newline-delimited JSON in both directions.
+
+    -> {"id": 1, "method": "execute", "params": {"framework": {...}}}
+    <- {"id": 1, "result": "AXIOMHIVE/ZKVS_SIEVE_PROTOCOL ..."}
+    <- {"id": 2, "error": {"type": "ValueError", "message": "..."}}
+
+Clients may pipeline: write many requests without waiting. Requests run concurrently on
+a thread pool ('daemon_workers') and responses are written as they complete, so they
+can arrive out of order; match them by id. Methods: execute, execute_batch, status,
+ledger, metrics, ping, shutdown.
+
+execute and execute_batch pass admission control (src/admission.py) keyed by the peer
+pid; a rejection is an "AdmissionRejected" error carrying "retry_after_s".
+"""
+
+import itertools
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+from src.admission import AdmissionRejected, controller_from_config, priority_of
+from src.config import get_config
+
+logger = logging.getLogger('AXIOMHIVE.Daemon')
+
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+class DaemonError(RuntimeError):
+    """An error raised by the daemon while serving a request."""
+
+    def __init__(self, error_type: str, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.error_type = error_type
+        self.retry_after = retry_after # Set on AdmissionRejected errors
+
+    @classmethod
+    def from_response(cls, error: Dict[str, Any], default_type: str = "Error") -> "DaemonError":
+        return cls(error.get("type", default_type), error.get("message", ""), error.get("retry_after_s"))
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return (json.dumps(message, default=str, separators=(",", ":")) + "\n").encode("utf-8")
+
+def _peer_credentials(sock: socket.socket) -> Optional[Tuple[int, int]]:
+    """(pid, uid) of a Unix socket peer, or None where the platform does not report it."""
+    if hasattr(socket, "SO_PEERCRED"):
+        try:
+            pid, uid, _ = struct.unpack("3i", sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED,
+                                                              struct.calcsize("3i")))
+            return pid, uid
+        except OSError:
+            pass
+    return None
+
+def _peer_id(sock: socket.socket) -> str:
+    """Admission client id of a Unix socket peer: its pid where the platform reports it."""
+    credentials = _peer_credentials(sock)
+    return f"pid:{credentials[0]}" if credentials else "local"
+
+def _check_server_owner(sock: socket.socket, path: str):
+    """Refuses a server run by another user: whoever binds the path first would see every mandate."""
+    credentials = _peer_credentials(sock)
+    if credentials is not None and credentials[1] not in (os.getuid(), 0):
+        raise PermissionError(f"{path} is served by uid {credentials[1]}, not by this user")
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Reads pipelined requests from one connection and writes responses as they complete."""
+
+    def handle(self):
+        daemon: "NodeDaemon" = self.server.axiomhive_daemon
+        client = _peer_id(self.connection)
+        write_lock = threading.Lock()
+        pending: List[Any] = []
+
+        def respond(message: Dict[str, Any]):
+            data = _encode(message)
+            with write_lock:
+                try:
+                    self.wfile.write(data)
+                except OSError:
+                    pass # Client went away; its remaining responses are dropped
+
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            if not line:
+                break
+            if len(line) > MAX_REQUEST_BYTES:
+                respond({"id": None, "error": {"type": "ProtocolError", "message": "Request too large."}})
+                break
+            try:
+                request = json.loads(line)
+                request_id, method, params = request.get("id"), request["method"], request.get("params") or {}
+            except (ValueError, KeyError, AttributeError) as e:
+                respond({"id": None, "error": {"type": "ProtocolError", "message": f"Malformed request: {e}"}})
+                continue
+            future = daemon.submit(request_id, method, params, respond, client)
+            if future is not None:
+                pending.append(future)
+            if len(pending) >= 1024:
+                pending = [future for future in pending if not future.done()]
+        # Answer everything already read, even if the client half-closed after pipelining
+        wait(pending)
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+def _claim_socket_path(path: str):
+    """
+    Creates the socket's directory owner-only if missing and removes a stale socket file
+    of ours; refuses to start over a live daemon or to remove anything else.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    owner = os.stat(directory)
+    if owner.st_uid not in (os.getuid(), 0) or (owner.st_mode & 0o022 and not owner.st_mode & stat.S_ISVTX):
+        raise RuntimeError(f"Socket directory {directory} is writable by other users; refusing to listen there")
+    try:
+        info = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(info.st_mode):
+        raise RuntimeError(f"{path} exists and is not a socket; refusing to remove it")
+    if DaemonClient.is_running(path):
+        raise RuntimeError(f"An AXIOMHIVE daemon is already listening on {path}")
+    if info.st_uid != os.getuid():
+        raise RuntimeError(f"Stale socket {path} belongs to uid {info.st_uid}; refusing to remove it")
+    os.unlink(path)
+
+class NodeDaemon:
+    """Serves a long-lived ZKVSNodePrime on a Unix domain socket."""
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    ADMITTED_METHODS = ("execute", "execute_batch")
+
+    def __init__(self, node: Any = None, socket_path: Optional[str] = None, workers: Optional[int] = None):
+        config = get_config()
+        self.socket_path = socket_path or config.daemon_socket_path
+        self._owns_node = node is None
+        if node is None:
+            from src.sovereign_core import ZKVSNodePrime
+            node = ZKVSNodePrime()
+        self.node = node
+        self.started = time.time()
+        self.requests = 0
+        self._requests_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers or config.daemon_workers,
+                                            thread_name_prefix="axiomhive-daemon")
+        self._admission = controller_from_config(config, workers or config.daemon_workers)
+        self._methods: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "execute": lambda p: self.node.execute_mandate(p["framework"], p.get("idempotency_key")),
+            "execute_batch": lambda p: self.node.execute_mandates(p["frameworks"]),
+            "status": lambda p: self.status(),
+            "ledger": lambda p: self.node.ledger_events(p.get("offset", 0), p.get("limit")),
+            "metrics": lambda p: self.render_metrics(),
+            "ping": lambda p: "pong",
+            "shutdown": lambda p: self._request_shutdown(),
+        }
+        _claim_socket_path(self.socket_path)
+        old_umask = os.umask(0o177) # Only the owner may submit mandates
+        try:
+            self._server = _UnixServer(self.socket_path, _DaemonRequestHandler)
+        finally:
+            os.umask(old_umask)
+        self._server.axiomhive_daemon = self
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        logger.info(f"AXIOMHIVE daemon listening on {self.socket_path}")
+
+        # @AXIOMHIVE: With enable_networking the same node is also served over HTTP
+        self._http = None
+        if config.enable_networking:
+            from src.server import NodeServer
+            self._http = NodeServer(self.node).start()
+        self._rpc = None
+        if config.enable_rpc:
+            from src.rpc import RpcServer
+            self._rpc = RpcServer(self.node, workers=workers).start()
+
+    def status(self) -> Dict[str, Any]:
+        status = dict(self.node.status(), pid=os.getpid(), uptime_s=time.time() - self.started,
+                      daemon_requests=self.requests)
+        if self._admission is not None:
+            status["admission"] = self._admission.stats()
+        return status
+
+    def render_metrics(self) -> str:
+        text = self.node.render_metrics()
+        if self._admission is not None:
+            text += self._admission.metrics.render()
+        return text
+
+    def _admit(self, client: str, params: Dict[str, Any]):
+        """Blocks the connection's reader until admitted, so a flooding client stalls itself."""
+        frameworks = params.get("frameworks")
+        if not isinstance(frameworks, list):
+            frameworks = [params.get("framework")]
+        self._admission.acquire(client, priority_of(frameworks), max(1, len(frameworks)))
+
+    def submit(self, request_id: Any, method: str, params: Dict[str, Any],
+               respond: Callable[[Dict[str, Any]], None], client: str = "local"):
+        with self._requests_lock:
+            self.requests += 1
+        admission = self._admission if method in self.ADMITTED_METHODS else None
+        if admission is not None:
+            try:
+                self._admit(client, params)
+            except AdmissionRejected as e:
+                respond({"id": request_id, "error": {"type": "AdmissionRejected", "message": str(e),
+                                                     "reason": e.reason, "retry_after_s": e.retry_after}})
+                return None
+        try:
+            future = self._executor.submit(self._dispatch, request_id, method, params, respond)
+        except RuntimeError: # Executor already shut down
+            if admission is not None:
+                admission.release()
+            respond({"id": request_id, "error": {"type": "ProtocolError", "message": "Daemon is shutting down."}})
+            return None
+        if admission is not None:
+            started = time.perf_counter()
+            future.add_done_callback(lambda _: admission.release(time.perf_counter() - started))
+        return future
+
+    def _dispatch(self, request_id: Any, method: str, params: Dict[str, Any],
+                  respond: Callable[[Dict[str, Any]], None]):
+        handler = self._methods.get(method)
+        if handler is None:
+            respond({"id": request_id, "error": {"type": "ProtocolError", "message": f"Unknown method: {method}"}})
+            return
+        try:
+            respond({"id": request_id, "result": handler(params)})
+        except Exception as e:
+            respond({"id": request_id, "error": {"type": type(e).__name__, "message": str(e)}})
+
+    def _request_shutdown(self) -> str:
+        threading.Thread(target=self.shutdown, name="axiomhive-daemon-shutdown", daemon=True).start()
+        return "shutting down"
+
+    def serve_forever(self):
+        """Serves until shutdown() is called, then releases the socket and the node."""
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self.close()
+
+    def start(self) -> "NodeDaemon":
+        """Serves from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="axiomhive-daemon", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self):
+        """Stops accepting requests; safe to call from any thread other than the serving one."""
+        self._server.shutdown()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._http is not None:
+            self._http.shutdown()
+        if self._rpc is not None:
+            self._rpc.shutdown()
+        self._server.server_close()
+        self._executor.shutdown(wait=True)
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        if self._owns_node:
+            self.node.close()
+        logger.info(f"AXIOMHIVE daemon stopped after {self.requests} requests")
+
+class DaemonClient:
+    """
+    Thin client for NodeDaemon. Offers the node calls the CLI needs, plus pipeline()
+    to send many requests in one round trip. Each thread uses its own connection.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, socket_path: Optional[str] = None, timeout: Optional[float] = None):
+        self.socket_path = socket_path or get_config().daemon_socket_path
+        self.timeout = timeout
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._connections: List[socket.socket] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_running(socket_path: str) -> bool:
+        """True when a daemon accepts connections on socket_path."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(1.0)
+        try:
+            sock.connect(socket_path)
+            return True
+        except OSError:
+            return False
+        finally:
+            sock.close()
+
+    def _connection(self) -> Tuple[socket.socket, Any]:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+                _check_server_owner(sock, self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            connection = self._local.connection = (sock, sock.makefile("rb"))
+            with self._lock:
+                self._connections.append(sock)
+        return connection
+
+    def _drop_connection(self):
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            connection[1].close()
+            connection[0].close()
+
+    def pipeline(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Sends all calls before reading any response. Returns results in call order,
+        with a DaemonError in place of each failed call.
+        """
+        ids = [next(self._ids) for _ in calls]
+        payload = b"".join(_encode({"id": request_id, "method": method, "params": params})
+                           for request_id, (method, params) in zip(ids, calls))
+        sock, reader = self._connection()
+        responses: Dict[int, Dict[str, Any]] = {}
+        try:
+            sock.sendall(payload)
+            while len(responses) < len(ids):
+                line = reader.readline()
+                if not line:
+                    raise ConnectionError("AXIOMHIVE daemon closed the connection.")
+                response = json.loads(line)
+                if response.get("id") is None: # The daemon could not parse the stream
+                    raise DaemonError.from_response(response.get("error", {}), "ProtocolError")
+                responses[response["id"]] = response
+        except (OSError, ValueError, DaemonError):
+            self._drop_connection() # Unread responses would desynchronize the next call
+            raise
+        results = []
+        for request_id in ids:
+            response = responses[request_id]
+            if "error" in response:
+                results.append(DaemonError.from_response(response["error"]))
+            else:
+                results.append(response.get("result"))
+        return results
+
+    def call(self, method: str, **params: Any) -> Any:
+        result = self.pipeline([(method, params)])[0]
+        if isinstance(result, DaemonError):
+            raise result
+        return result
+
+    def execute_mandate(self, framework: Dict[str, Any], idempotency_key: Optional[str] = None) -> str:
+        params: Dict[str, Any] = {"framework": framework}
+        if idempotency_key is not None:
+            params["idempotency_key"] = idempotency_key
+        return self.call("execute", **params)
+
+    def execute_mandates(self, frameworks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.call("execute_batch", frameworks=frameworks)
+
+    def execute_pipelined(self, frameworks: List[Dict[str, Any]]) -> List[Any]:
+        """Executes each framework as its own mandate, all in one round trip."""
+        return self.pipeline([("execute", {"framework": framework}) for framework in frameworks])
+
+    def status(self) -> Dict[str, Any]:
+        return self.call("status")
+
+    def ledger_events(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.call("ledger", offset=offset, limit=limit)
+
+    def render_metrics(self) -> str:
+        return self.call("metrics")
+
+    def ping(self) -> bool:
+        return self.call("ping") == "pong"
+
+    def shutdown(self):
+        self.call("shutdown")
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for sock in connections:
+            sock.close()
+        self._local = threading.local()
@@ -3,8 +3,25 @@
 
 # This file marks the 'dagger_agents' directory as a Python package.
 # It provides access to the core Dagger agent definitions and utility functions.
+# Agent modules are imported on first attribute access so the registry can stay lazy.
 
-from .core import DaggerAgent, DataSieveAgent, ZKProofAgent, MarketAnalysisAgent
-from .utils import DaggerAgentUtils
+import importlib
 
-# All paths converge to flawless execution.
\ No newline at end of file
+_LAZY_EXPORTS = {
+    "DaggerAgent": ".core",
+    "DataSieveAgent": ".core",
+    "ZKProofAgent": ".core",
+    "MarketAnalysisAgent": ".core",
+    "DaggerAgentUtils": ".utils",
+    "DaggerAgentRegistry": ".registry",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
+
+# All paths converge to flawless execution.
@@ -1,9 +1,13 @@
 # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
 # DAGGER_AGENTS/CORE: Specialized Atomic Execution Agents
 
-import hashlib
-from typing import Dict, Any
+import mmap
+import os
+from collections import deque
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from .utils import DaggerAgentUtils # Import utility functions
+from src import hashing
+from src.tracing import span
 
 class DaggerAgent:
     """
@@ -24,13 +28,15 @@ class DaggerAgent:
         Returns a dictionary containing the result and a verification hash.
         """
         self.status = "executing"
-        raw_result = self._perform_task(task_params)
+        with span("dagger_agent.execute", agent=self.name) as agent_span:
+            raw_result = self._perform_task(task_params)
 
-        # @AXIOMHIVE: FLAW=0 - Ensure result integrity
-        if not DaggerAgentUtils.validate_result_integrity(raw_result):
-            raise ValueError(f"Dagger Agent {self.name} detected result integrity flaw.")
+            # @AXIOMHIVE: FLAW=0 - Ensure result integrity
+            if not DaggerAgentUtils.validate_result_integrity(raw_result):
+                raise ValueError(f"Dagger Agent {self.name} detected result integrity flaw.")
 
-        result_hash = hashlib.sha256(str(raw_result).encode()).hexdigest()
+            result_hash = DaggerAgentUtils.generate_deterministic_hash(raw_result)
+            agent_span.set_attribute("result_hash", result_hash)
         self.status = "idle"
         return {"result": raw_result, "hash": result_hash, "agent": self.name}
 
@@ -44,7 +50,12 @@ class DataSieveAgent(DaggerAgent):
     def __init__(self, axioms: Dict[str, float]):
         super().__init__("DataSieveAgent", "data_filtering", axioms)
 
-    def _perform_task(self, task_params: Dict[str, Any]) -> str:
+    DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024 # 4 MiB per sieve chunk
+
+    def _perform_task(self, task_params: Dict[str, Any]) -> Any:
+        if "path" in task_params or "buffer" in task_params:
+            return self._sieve_large_input(task_params)
+
         data = task_params.get("data", "")
         # @AXIOMHIVE: Apply DENSITY and NOISE axioms for ultimate signal purity
         filtered_data = DaggerAgentUtils.densify_text(data, self._axioms['DENSITY'])
@@ -55,23 +66,140 @@ class DataSieveAgent(DaggerAgent):
         else:
             return f"Data sieved and densified: {filtered_data} [AXIOMHIVE:DENSITY_APPLIED]"
 
+    def _sieve_large_input(self, task_params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sieves a file path or bytes-like buffer chunk by chunk without materialising the full text.
+        Files are memory-mapped and their chunks sieved across worker processes; buffers are
+        sieved in-process to avoid copying them into workers.
+        Task params: 'path' or 'buffer', optional 'chunk_size', 'workers' and 'output_path'.
+        The sieve hash equals the digest of the densified text as a whole, whatever the chunking
+        (words longer than the hard chunk cap of plan_word_aligned_chunks excepted).
+        """
+        chunk_size = int(task_params.get("chunk_size", self.DEFAULT_CHUNK_SIZE))
+        output_path = task_params.get("output_path")
+        density = self._axioms['DENSITY']
+
+        if "path" in task_params:
+            path = os.fspath(task_params["path"])
+            workers = int(task_params.get("workers", os.cpu_count() or 1))
+            bytes_in = os.path.getsize(path)
+            chunks = self._iter_file_chunks(path, chunk_size, workers, density)
+        else:
+            buffer = task_params["buffer"]
+            bytes_in = len(buffer)
+            chunks = self._iter_buffer_chunks(buffer, chunk_size, density)
+
+        sieve_hash = hashing.new()
+        preview_parts: List[str] = []
+        preview_len = 0
+        bytes_out = 0
+        chunk_count = 0
+        output_file = open(output_path, "w", encoding="utf-8") if output_path else None
+        try:
+            for densified in chunks:
+                chunk_count += 1
+                if not densified:
+                    continue
+                # @AXIOMHIVE: Re-insert the single space the whole-text join would have produced;
+                # undensified chunks keep their own trailing whitespace and are concatenated as-is
+                piece = f" {densified}" if bytes_out and density == 1.0 else densified
+                encoded = piece.encode()
+                sieve_hash.update(encoded)
+                bytes_out += len(encoded)
+                if output_file:
+                    output_file.write(piece)
+                if preview_len <= 100:
+                    preview_parts.append(piece)
+                    preview_len += len(piece)
+        finally:
+            if output_file:
+                output_file.close()
+
+        preview = "".join(preview_parts)
+        if len(preview) > 100:
+            preview = f"{preview[:100]}..."
+        return {
+            "densified_preview": preview,
+            "output_path": output_path,
+            "sieve_hash": sieve_hash.hexdigest(),
+            "bytes_in": bytes_in,
+            "bytes_out": bytes_out,
+            "chunks": chunk_count,
+        }
+
+    @staticmethod
+    def _iter_buffer_chunks(buffer: Any, chunk_size: int, density: float) -> Iterator[str]:
+        view = memoryview(buffer).cast("B")
+        for start, end in DaggerAgentUtils.plan_word_aligned_chunks(view, chunk_size):
+            yield DaggerAgentUtils.densify_text(str(view[start:end], "utf-8", "replace"), density)
+
+    @staticmethod
+    def _iter_file_chunks(path: str, chunk_size: int, workers: int, density: float) -> Iterator[str]:
+        if os.path.getsize(path) == 0:
+            return
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = DaggerAgentUtils.plan_word_aligned_chunks(mm, chunk_size)
+
+        if workers <= 1 or len(ranges) <= 1:
+            for start, end in ranges:
+                yield _sieve_file_range(path, start, end, density)
+            return
+
+        # @AXIOMHIVE: Bounded in-flight window keeps results ordered and memory flat
+        from concurrent.futures import ProcessPoolExecutor # Deferred: only large sieves pay for it
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: deque = deque()
+            remaining = iter(ranges)
+            for start, end in remaining:
+                pending.append(executor.submit(_sieve_file_range, path, start, end, density))
+                if len(pending) >= workers * 2:
+                    break
+            while pending:
+                yield pending.popleft().result()
+                next_range: Optional[Tuple[int, int]] = next(remaining, None)
+                if next_range is not None:
+                    pending.append(executor.submit(_sieve_file_range, path, *next_range, density))
+
 class ZKProofAgent(DaggerAgent):
     """Specialized agent for generating ZK proofs, enforcing SOVEREIGNTY=1.0."""
     # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
     def __init__(self, axioms: Dict[str, float]):
         super().__init__("ZKProofAgent", "zk_computation", axioms)
 
-    def _perform_task(self, task_params: Dict[str, Any]) -> str:
-        input_data = task_params.get("input", "")
+    def _perform_task(self, task_params: Dict[str, Any]) -> Any:
         protocol = task_params.get("protocol", "PlonK-over-HyperPlonK")
+        if "inputs" in task_params:
+            return self.prove_batch(task_params["inputs"], protocol)
+
+        input_data = task_params.get("input", "")
 
         # @AXIOMHIVE: Generate cryptographic proof locally, zero egress
         # Enhanced ZK proof generation with protocol specification
         proof_data = f"{input_data}:{protocol}:{self._axioms['SOVEREIGNTY']}"
-        proof = hashlib.sha256(proof_data.encode()).hexdigest()
+        proof = hashing.hexdigest(proof_data.encode())
 
         return f"ZK Proof generated [{protocol}]: {proof} [SOVEREIGNTY_VERIFIED]"
 
+    def prove_batch(self, inputs: Iterable[Any], protocol: str = "PlonK-over-HyperPlonK") -> Dict[str, Any]:
+        """
+        Generates one aggregated proof for a whole batch of inputs.
+        Each leaf is the digest a single-input proof would produce; the leaves are folded into
+        a Merkle root, and every item carries the inclusion path that ties it to that root.
+        """
+        suffix = f":{protocol}:{self._axioms['SOVEREIGNTY']}"
+        digest = hashing.digest
+        leaves = [digest(f"{input_data}{suffix}".encode()) for input_data in inputs]
+        if not leaves:
+            raise ValueError("ZKProofAgent batch requires at least one input.")
+
+        root, paths = DaggerAgentUtils.build_merkle_tree(leaves)
+        return {
+            "protocol": protocol,
+            "merkle_root": root.hex(),
+            "leaf_count": len(leaves),
+            "proofs": [{"leaf": leaf.hex(), "path": path} for leaf, path in zip(leaves, paths)],
+        }
+
 class MarketAnalysisAgent(DaggerAgent):
     """Specialized agent for market intelligence and strategic analysis, enforcing SHARPEN=1.0."""
     # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
@@ -104,4 +232,9 @@ class MarketAnalysisAgent(DaggerAgent):
         )
         return analysis_result
 
+def _sieve_file_range(path: str, start: int, end: int, density: float) -> str:
+    """Process-pool worker: maps the file and densifies a single word-aligned range."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return DaggerAgentUtils.densify_text(str(mm[start:end], "utf-8", "replace"), density)
+
 # Additional specialized Dagger agents would follow this pattern, each enforcing specific axioms.
\ No newline at end of file
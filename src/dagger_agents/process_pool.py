@@ -0,0 +1,279 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# DAGGER_AGENTS/PROCESS_POOL: Process-Isolated Execution for CPU-Bound Dagger Agents
+
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+from multiprocessing import shared_memory
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger('AXIOMHIVE.ProcessPool')
+
+# @AXIOMHIVE: Workers come from a single-threaded fork server, never from the node process itself.
+# Forking the multithreaded node (executor, metrics and daemon threads) could hand the child a
+# lock some other thread held at the time, deadlocking it on first use.
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+_CONTEXT = multiprocessing.get_context(_START_METHOD)
+_PRELOAD_MODULES = [__name__] # Not '__main__': scripts without a main guard would rerun in the server
+
+def preload_worker_modules(module_names: Iterable[str]):
+    """
+    Has the fork server import these modules once, so every worker it forks starts with them.
+    Only applies if the fork server has not started yet in this process.
+    """
+    for name in module_names:
+        if name not in _PRELOAD_MODULES:
+            _PRELOAD_MODULES.append(name)
+    if _START_METHOD == "forkserver":
+        _CONTEXT.set_forkserver_preload(list(_PRELOAD_MODULES))
+
+preload_worker_modules(())
+
+class WorkerCrashedError(RuntimeError):
+    """Raised when a worker process dies while serving a request."""
+
+class ProcessWorker:
+    """
+    A single pre-forked worker process serving request/response pairs over a pipe.
+    The handler is built once inside the child by calling handler_factory, so per-call
+    work starts warm. Crashed or timed-out workers are replaced transparently.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, handler_factory: Callable[[], Callable[[Any], Any]], name: str = "axiomhive-worker"):
+        self._handler_factory = handler_factory
+        self.name = name
+        self.restarts = 0
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._conn = None
+        self.start()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    def is_alive(self) -> bool:
+        return bool(self._process and self._process.is_alive())
+
+    def start(self):
+        parent_conn, child_conn = _CONTEXT.Pipe()
+        self._process = _CONTEXT.Process(
+            target=_worker_main, args=(child_conn, self._handler_factory), name=self.name, daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+    def restart(self, reason: str):
+        logger.warning(f"Restarting worker {self.name} (pid {self.pid}): {reason}")
+        self.stop(graceful=False)
+        self.restarts += 1
+        self.start()
+
+    def call(self, request: Any, deadline: Optional[float] = None) -> Any:
+        """Sends one request and waits up to deadline seconds for its response."""
+        if not self.is_alive():
+            self.restart("found dead before dispatch")
+        try:
+            self._conn.send(request)
+            if not self._conn.poll(deadline):
+                self.restart(f"deadline of {deadline}s exceeded")
+                raise TimeoutError(f"Worker {self.name} exceeded its {deadline}s deadline.")
+            status, payload = self._conn.recv()
+        except (EOFError, BrokenPipeError, ConnectionResetError) as e:
+            self.restart(f"worker died: {e!r}")
+            raise WorkerCrashedError(f"Worker {self.name} crashed while serving a request.") from e
+
+        if status == "error":
+            if isinstance(payload, BaseException):
+                raise payload # The worker's own exception, so callers can catch its type
+            error_type, message = payload
+            raise RuntimeError(f"{error_type}: {message}")
+        return payload
+
+    def stop(self, graceful: bool = True):
+        if self._process is None:
+            return
+        if graceful and self._process.is_alive():
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(timeout=1.0)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=1.0)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join()
+        self._conn.close()
+        self._process = None
+
+def _worker_main(conn, handler_factory: Callable[[], Callable[[Any], Any]]):
+    """Child process loop: build the handler once, then serve until told to stop."""
+    handler = handler_factory()
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        try:
+            conn.send(("ok", handler(request)))
+        except Exception as e:
+            conn.send(("error", _portable_error(e)))
+    conn.close()
+
+def _portable_error(error: Exception) -> Any:
+    """The exception itself if it survives a pickle round trip, else its (type name, message)."""
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return (type(error).__name__, str(error))
+
+class _SharedPayload:
+    """Reference to a task parameter parked in a shared memory segment."""
+    __slots__ = ("name", "size", "is_text")
+
+    def __init__(self, name: str, size: int, is_text: bool):
+        self.name = name
+        self.size = size
+        self.is_text = is_text
+
+    def __getstate__(self):
+        return (self.name, self.size, self.is_text)
+
+    def __setstate__(self, state):
+        self.name, self.size, self.is_text = state
+
+class _AgentHandler:
+    """Worker-side handler: constructs the pooled agents once and executes tasks on them."""
+
+    def __init__(self, agent_specs: Dict[str, Any], axioms: Dict[str, float]):
+        self._agent_specs = agent_specs
+        self._axioms = axioms
+
+    def __call__(self):
+        # @AXIOMHIVE: Runs in the child - agents are warm before the first request arrives
+        from src.dagger_agents.registry import DaggerAgentRegistry
+        registry = DaggerAgentRegistry(self._axioms, specs=self._agent_specs, use_entry_points=False,
+                                       process_agents=())
+        for name in self._agent_specs:
+            registry.get(name)
+
+        def handle(request: Tuple[str, Dict[str, Any]]) -> Dict[str, Any]:
+            agent_name, task_params = request
+            attached: List[shared_memory.SharedMemory] = []
+            views: List[memoryview] = []
+            try:
+                params = {}
+                for key, value in task_params.items():
+                    if isinstance(value, _SharedPayload):
+                        shm = _attach_shared_memory(value.name)
+                        attached.append(shm)
+                        view = shm.buf[:value.size]
+                        views.append(view)
+                        value = str(view, "utf-8") if value.is_text else view
+                    params[key] = value
+                return registry[agent_name].execute(params)
+            finally:
+                for view in views:
+                    view.release()
+                for shm in attached:
+                    shm.close()
+
+        return handle
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        # The parent owns the segment; keep this process's tracker from unlinking it at exit.
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return shm
+
+class AgentProcessPool:
+    """
+    Opt-in process pool for CPU-bound Dagger agents.
+    Pre-forks warm workers that each hold every pooled agent, hands large str/bytes task
+    parameters over through shared memory, and restarts workers that crash or exceed the deadline.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, agent_specs: Dict[str, Any], axioms: Dict[str, float], workers: int = 0,
+                 deadline: Optional[float] = 30.0, shared_memory_threshold: int = 64 * 1024):
+        self.agent_specs = dict(agent_specs)
+        self.deadline = deadline
+        self.shared_memory_threshold = shared_memory_threshold
+        worker_count = workers or os.cpu_count() or 1
+        factory = _AgentHandler(self.agent_specs, dict(axioms))
+        self._workers = [ProcessWorker(factory, name=f"axiomhive-agent-worker-{i}") for i in range(worker_count)]
+        self._idle: "queue.Queue[ProcessWorker]" = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._closed = False
+        self._lock = threading.Lock()
+        logger.info(f"Agent process pool started with {worker_count} warm workers for {sorted(self.agent_specs)}")
+
+    def execute(self, agent_name: str, task_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Runs one agent task on the next free worker and returns the agent's result dict."""
+        if self._closed:
+            raise RuntimeError("Agent process pool is closed.")
+        if agent_name not in self.agent_specs:
+            raise KeyError(agent_name)
+
+        params, segments = self._share_large_params(task_params)
+        worker = self._idle.get()
+        try:
+            return worker.call((agent_name, params), self.deadline)
+        finally:
+            self._idle.put(worker)
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+
+    def _share_large_params(self, task_params: Dict[str, Any]) -> Tuple[Dict[str, Any], List[shared_memory.SharedMemory]]:
+        params: Dict[str, Any] = {}
+        segments: List[shared_memory.SharedMemory] = []
+        for key, value in task_params.items():
+            if isinstance(value, (str, bytes, bytearray, memoryview)):
+                data = value.encode() if isinstance(value, str) else memoryview(value).cast("B")
+                if len(data) >= self.shared_memory_threshold:
+                    shm = shared_memory.SharedMemory(create=True, size=len(data))
+                    shm.buf[:len(data)] = data
+                    segments.append(shm)
+                    value = _SharedPayload(shm.name, len(data), isinstance(value, str))
+            params[key] = value
+        return params, segments
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._workers),
+            "idle": self._idle.qsize(),
+            "restarts": sum(worker.restarts for worker in self._workers),
+        }
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for worker in self._workers:
+            worker.stop()
+
+class ProcessPoolAgent:
+    """Stands in for a Dagger agent whose execute() runs in an AgentProcessPool."""
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, name: str, pool: AgentProcessPool):
+        self.name = name
+        self.specialization = "process_isolated"
+        self.status = "idle" # The pool queues work, so the agent is always routable
+        self._pool = pool
+
+    def execute(self, task_params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._pool.execute(self.name, task_params)
@@ -0,0 +1,193 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# DAGGER_AGENTS/REGISTRY: Lazy Plugin Registry for Dagger Agents
+
+import importlib
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from typing import Dict, Any, Iterable, Iterator, Optional
+
+logger = logging.getLogger('AXIOMHIVE.DaggerRegistry')
+
+# @AXIOMHIVE: Built-in agents, addressed as "module:Class" so nothing is imported up front.
+DEFAULT_AGENT_SPECS: Dict[str, str] = {
+    "data_sieve_agent": "src.dagger_agents.core:DataSieveAgent",
+    "zk_proof_agent": "src.dagger_agents.core:ZKProofAgent",
+    "market_analysis_agent": "src.dagger_agents.core:MarketAnalysisAgent",
+}
+
+# Third-party agents register under this entry point group: name = "package.module:AgentClass"
+ENTRY_POINT_GROUP = "axiomhive.dagger_agents"
+
+class DaggerAgentRegistry(Mapping):
+    """
+    Maps agent names to Dagger agents, importing and instantiating each one on first lookup.
+    Agents come from the built-in specs, the 'dagger_agents' config mapping and the
+    'axiomhive.dagger_agents' entry point group (consulted only for names not found otherwise).
+    Records the import and construction cost of every agent type it loads.
+    Agents named in process_agents run in a shared AgentProcessPool instead of in-process.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, axioms: Dict[str, float], specs: Optional[Dict[str, str]] = None,
+                 use_entry_points: Optional[bool] = None, process_agents: Optional[Iterable[str]] = None,
+                 process_workers: Optional[int] = None, process_deadline: Optional[float] = None):
+        self._axioms = axioms
+        if specs is None or use_entry_points is None or process_agents is None:
+            from src.config import get_config
+            config = get_config()
+            if specs is None:
+                specs = {**DEFAULT_AGENT_SPECS, **config.dagger_agents}
+            if use_entry_points is None:
+                use_entry_points = config.dagger_agent_entry_points
+            if process_agents is None:
+                process_agents = config.process_pool_agents
+                process_workers = config.process_pool_workers if process_workers is None else process_workers
+                process_deadline = config.process_pool_deadline if process_deadline is None else process_deadline
+        self._specs: Dict[str, Any] = dict(specs)
+        self._use_entry_points = use_entry_points
+        self._process_agents = frozenset(process_agents)
+        self._process_workers = process_workers or 0
+        self._process_deadline = process_deadline
+        self._process_pool = None
+        self._entry_points_scanned = False
+        self._instances: Dict[str, Any] = {}
+        self._startup_costs: Dict[str, Dict[str, float]] = {}
+        self._load_lock = threading.RLock() # Only taken on a miss; loaded agents are read lock-free
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Returns the agent instance for a route target, loading it on first use."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._load_lock:
+            instance = self._instances.get(name)
+            if instance is not None:
+                return instance
+            if name not in self._specs and not self._discover(name):
+                return default
+            return self._load(name)
+
+    def __getitem__(self, name: str) -> Any:
+        agent = self.get(name)
+        if agent is None:
+            raise KeyError(name)
+        return agent
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs or (isinstance(name, str) and self._discover(name))
+
+    def __iter__(self) -> Iterator[str]:
+        self._scan_entry_points()
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        self._scan_entry_points()
+        return len(self._specs)
+
+    def register(self, name: str, spec: Any):
+        """Registers an agent by "module:Class" spec, or by a class/factory taking the axioms."""
+        with self._load_lock: # A concurrent load never builds from a spec being replaced
+            self._specs[name] = spec
+            self._instances.pop(name, None)
+
+    def is_routable(self, name: str) -> bool:
+        """
+        True when a sub-task can be assigned to this agent now. Process-isolated agents are
+        always routable (their pool queues work), so they are answered without starting the pool.
+        """
+        if name in self._process_agents:
+            return name in self
+        agent = self.get(name)
+        return agent is not None and agent.status == "idle"
+
+    def specs(self) -> Dict[str, Any]:
+        """Every known agent spec, including those discovered through entry points."""
+        self._scan_entry_points()
+        return dict(self._specs)
+
+    def loaded_agents(self) -> Dict[str, Any]:
+        """Agents instantiated so far; never triggers a load."""
+        return dict(self._instances)
+
+    def startup_costs(self) -> Dict[str, Dict[str, float]]:
+        """Per-agent import and construction time in seconds, for agents loaded so far."""
+        return {name: dict(costs) for name, costs in self._startup_costs.items()}
+
+    def process_pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Worker pool statistics, or None while no process-isolated agent has been used."""
+        return self._process_pool.stats() if self._process_pool else None
+
+    def close(self):
+        """Stops the process pool, if one was started."""
+        if self._process_pool is not None:
+            self._process_pool.close()
+            self._process_pool = None
+        for name in self._process_agents:
+            self._instances.pop(name, None)
+
+    def _load(self, name: str) -> Any:
+        if name in self._process_agents:
+            return self._load_process_agent(name)
+
+        spec = self._specs[name]
+        start = time.perf_counter()
+        agent_class = self._resolve(spec)
+        imported = time.perf_counter()
+        instance = agent_class(self._axioms)
+        constructed = time.perf_counter()
+
+        self._instances[name] = instance
+        self._startup_costs[name] = {"import_s": imported - start, "init_s": constructed - imported}
+        logger.info(f"Dagger agent '{name}' loaded on demand "
+                    f"(import {1000 * (imported - start):.3f}ms, init {1000 * (constructed - imported):.3f}ms)")
+        return instance
+
+    def _load_process_agent(self, name: str) -> Any:
+        from src.dagger_agents.process_pool import AgentProcessPool, ProcessPoolAgent
+        start = time.perf_counter()
+        if self._process_pool is None:
+            self._scan_entry_points()
+            pooled_specs = {agent: self._specs[agent] for agent in self._process_agents if agent in self._specs}
+            self._process_pool = AgentProcessPool(pooled_specs, self._axioms, workers=self._process_workers,
+                                                  deadline=self._process_deadline)
+        instance = ProcessPoolAgent(name, self._process_pool)
+        elapsed = time.perf_counter() - start
+
+        self._instances[name] = instance
+        self._startup_costs[name] = {"import_s": 0.0, "init_s": elapsed}
+        logger.info(f"Dagger agent '{name}' bound to process pool (init {1000 * elapsed:.3f}ms)")
+        return instance
+
+    @staticmethod
+    def _resolve(spec: Any) -> Any:
+        if hasattr(spec, "load") and not isinstance(spec, str): # importlib.metadata.EntryPoint
+            return spec.load()
+        if isinstance(spec, str):
+            module_name, _, attribute = spec.partition(":")
+            if not attribute:
+                raise ValueError(f"Dagger agent spec '{spec}' must have the form 'module:Class'.")
+            return getattr(importlib.import_module(module_name), attribute)
+        return spec
+
+    def _discover(self, name: str) -> bool:
+        self._scan_entry_points()
+        return name in self._specs
+
+    def _scan_entry_points(self):
+        if self._entry_points_scanned or not self._use_entry_points:
+            return
+        self._entry_points_scanned = True
+        try:
+            from importlib.metadata import entry_points
+            discovered = entry_points()
+            if hasattr(discovered, "select"):
+                group = discovered.select(group=ENTRY_POINT_GROUP)
+            else: # Python < 3.10
+                group = discovered.get(ENTRY_POINT_GROUP, [])
+        except Exception as e:
+            logger.warning(f"Dagger agent entry point discovery failed: {e}")
+            return
+        for entry_point in group:
+            # @AXIOMHIVE: Explicit config always wins over installed plugins
+            self._specs.setdefault(entry_point.name, entry_point)
@@ -1,8 +1,27 @@
 # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
 # DAGGER_AGENTS/UTILS: Utility Functions for Dagger Agents
 
-import hashlib
-from typing import Any, Dict
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from src import hashing
+from src.canonical import canonical_hexdigest
+
+# @AXIOMHIVE: ASCII whitespace (plus the separators str.split() also honours).
+# A cut on one of these bytes never splits a word or a UTF-8 sequence.
+_WORD_BOUNDARY = re.compile(rb"[\s\x1c-\x1f]")
+# @AXIOMHIVE: Every separator str.split() honours, as UTF-8: the ASCII ones above plus the
+# multi-byte encodings of U+0085, U+00A0, U+1680, U+2000-U+200A, U+2028/9, U+202F, U+205F, U+3000.
+_UTF8_WHITESPACE = re.compile(
+    rb"(?:[\s\x1c-\x1f]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)+")
+# ASCII separators bytes.split() does not honour
+_ASCII_SEPARATORS = (b"\x1c", b"\x1d", b"\x1e", b"\x1f")
+MAX_CHUNK_GROWTH = 16 # A chunk may run this many times past chunk_size looking for whitespace
+
+# @AXIOMHIVE: DENSITY=1.0 stop words, frozen once at import instead of rebuilt per word.
+_DENSIFY_STOP_WORDS = frozenset({"a", "an", "the", "is", "are", "and", "or"})
+_DENSIFY_STOP_WORDS_BYTES = frozenset(word.encode() for word in _DENSIFY_STOP_WORDS)
+# Only words of these lengths can be stop words, so every other word skips lower().
+_DENSIFY_STOP_WORD_LENGTHS = frozenset(len(word) for word in _DENSIFY_STOP_WORDS)
 
 class DaggerAgentUtils:
     """
@@ -31,16 +50,135 @@ class DaggerAgentUtils:
         Enforces DENSITY=1.0.
         """
         if density_axiom_value == 1.0:
-            words = text.split()
             # Remove common stop words and short words for higher density
-            filtered_words = [word for word in words if len(word) > 2 and word.lower() not in ["a", "an", "the", "is", "are", "and", "or"]]
-            return " ".join(filtered_words)
+            stop_lengths = _DENSIFY_STOP_WORD_LENGTHS
+            return " ".join([
+                word for word in text.split()
+                if len(word) > 2 and (len(word) not in stop_lengths or word.lower() not in _DENSIFY_STOP_WORDS)
+            ])
         return text # If density axiom is not 1.0, less aggressive densification
 
+    @staticmethod
+    def densify_bytes(data: bytes, density_axiom_value: float) -> bytes:
+        """
+        Byte-level densify_text for ASCII/UTF-8 payloads, skipping the decode/encode round trip.
+        Words split on the same separators as str.split(). Word length is measured in bytes, so
+        a two-character non-ASCII word may be kept where densify_text drops it; stop words are
+        matched case-insensitively on ASCII.
+        """
+        if density_axiom_value == 1.0:
+            stop_lengths = _DENSIFY_STOP_WORD_LENGTHS
+            if data.isascii() and not any(separator in data for separator in _ASCII_SEPARATORS):
+                words = data.split() # Plain ASCII: bytes.split() agrees with str.split()
+            else:
+                words = _UTF8_WHITESPACE.split(data)
+            return b" ".join([
+                word for word in words
+                if len(word) > 2 and (len(word) not in stop_lengths or word.lower() not in _DENSIFY_STOP_WORDS_BYTES)
+            ])
+        return bytes(data)
+
+    @staticmethod
+    def densify_texts(texts: Iterable[Union[str, bytes]], density_axiom_value: float,
+                      as_bytes: bool = False) -> Iterator[Union[str, bytes]]:
+        """
+        Batch densification: lazily yields one densified result per input, in order.
+        Bytes inputs are densified at byte level; as_bytes=True yields UTF-8 bytes for str inputs too.
+        """
+        densify_text = DaggerAgentUtils.densify_text
+        densify_bytes = DaggerAgentUtils.densify_bytes
+        for text in texts:
+            if isinstance(text, (bytes, bytearray, memoryview)):
+                yield densify_bytes(bytes(text), density_axiom_value)
+            elif as_bytes:
+                yield densify_text(text, density_axiom_value).encode()
+            else:
+                yield densify_text(text, density_axiom_value)
+
+    @staticmethod
+    def plan_word_aligned_chunks(buffer: Any, chunk_size: int, max_chunk_size: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Splits a bytes-like buffer (bytes, mmap, memoryview) into (start, end) ranges.
+        Every range except the last ends just after a whitespace byte, so no word
+        straddles two chunks and each chunk decodes independently. A range that finds no
+        whitespace within max_chunk_size (default MAX_CHUNK_GROWTH * chunk_size) is cut
+        there instead, on a UTF-8 character boundary, so memory stays bounded on inputs
+        without whitespace; only words longer than that cap are split.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        limit = max(max_chunk_size or chunk_size * MAX_CHUNK_GROWTH, chunk_size)
+        total = len(buffer)
+        ranges = []
+        start = 0
+        while start < total:
+            end = start + chunk_size
+            if end >= total:
+                end = total
+            else:
+                hard_end = min(start + limit, total)
+                boundary = _WORD_BOUNDARY.search(buffer, end - 1, hard_end)
+                if boundary:
+                    end = boundary.end()
+                elif hard_end == total:
+                    end = total
+                else:
+                    end = hard_end
+                    while end > start + 1 and buffer[end] & 0xC0 == 0x80: # UTF-8 continuation byte
+                        end -= 1
+            ranges.append((start, end))
+            start = end
+        return ranges
+
+    @staticmethod
+    def build_merkle_tree(leaves: List[bytes]) -> Tuple[bytes, List[List[Tuple[str, str]]]]:
+        """
+        Aggregates raw leaf digests into a Merkle root using the active hash backend.
+        Returns the root and, per leaf, its inclusion path as (sibling_hex, side) pairs from
+        the leaf upwards; side is "L" when the sibling sits to the left. Leaves are hashed
+        under a 0x00 prefix and interior nodes under 0x01. An odd node at the end of a level
+        is promoted unpaired, so [a, b, c] and [a, b, c, c] have different roots.
+        """
+        if not leaves:
+            raise ValueError("Merkle tree requires at least one leaf")
+
+        digest = hashing.digest
+        levels = [[digest(b"\x00" + leaf) for leaf in leaves]]
+        while len(levels[-1]) > 1:
+            level = levels[-1]
+            parents = [digest(b"\x01" + level[i] + level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                parents.append(level[-1])
+            levels.append(parents)
+
+        paths = []
+        for index in range(len(leaves)):
+            path = []
+            position = index
+            for level in levels[:-1]:
+                if position % 2:
+                    path.append((level[position - 1].hex(), "L"))
+                elif position + 1 < len(level): # The unpaired last node has no sibling
+                    path.append((level[position + 1].hex(), "R"))
+                position //= 2
+            paths.append(path)
+        return levels[-1][0], paths
+
+    @staticmethod
+    def verify_merkle_inclusion(leaf_hex: str, path: List[Tuple[str, str]], root_hex: str) -> bool:
+        """Recomputes the root from a raw leaf digest and its inclusion path."""
+        node = hashing.digest(b"\x00" + bytes.fromhex(leaf_hex))
+        for sibling_hex, side in path:
+            sibling = bytes.fromhex(sibling_hex)
+            pair = sibling + node if side == "L" else node + sibling
+            node = hashing.digest(b"\x01" + pair)
+        return node.hex() == root_hex
+
     @staticmethod
     def generate_deterministic_hash(data: Any) -> str:
         """
-        Generates a deterministic SHA256 hash for any given data.
+        Generates a deterministic hash for any given data, via the canonical encoding and active backend.
         Ensures auditability and tamper-evidence.
         """
-        return hashlib.sha256(str(data).encode()).hexdigest()
\ No newline at end of file
+        return canonical_hexdigest(data)
\ No newline at end of file
@@ -1,8 +1,9 @@
 # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
 # DATA_MOAT/CULTIVATION_ENGINE: Dynamic Moat Cultivation Engine (DMCE)
 
-from typing import Dict, Any
-import hashlib
+from typing import Dict, Any, List, Optional
+from src import hashing
+import threading
 
 class DynamicMoatCultivationEngine:
     """
@@ -15,8 +16,9 @@ class DynamicMoatCultivationEngine:
         self._axioms: Dict[str, float] = axioms
         self._moat_strength: float = 1.0 # Initial moat strength
         self._model_refinement_count: int = 0
+        self._lock = threading.Lock() # Keeps strength and refinement count updated together
 
-    def cultivate_moat(self, user_interaction_data: Dict[str, Any]):
+    def cultivate_moat(self, user_interaction_data: Dict[str, Any], context: Optional[Any] = None):
         """
         Processes user interaction data to refine internal models, creating a proprietary data moat.
         Simulates the self-reinforcing feedback loop (RLHF concept).
@@ -24,16 +26,35 @@ class DynamicMoatCultivationEngine:
         # @AXIOMHIVE: SOVEREIGNTY=1.0 - Proprietary, high-quality dataset.
         # Placeholder: In a real system, this would update internal weights,
         # refine prompt understanding, or adapt Dagger agent behaviors based on RLHF.
-        data_hash = hashlib.sha256(str(user_interaction_data).encode()).hexdigest()
+        if context is not None:
+            # The intent digest is already held; the verified output is not the Dagger "output"
+            context.raw_digest("intent", user_interaction_data.get("intent", ""))
+            context.raw_digest("moat_output", user_interaction_data.get("output", ""))
+            data_hash = context.combine("moat_interaction", "intent", "moat_output")
+        else:
+            data_hash = hashing.hexdigest(str(user_interaction_data).encode())
 
         # Simulate model refinement based on interaction quality
         if user_interaction_data.get("output", "").endswith("ABSOLUTE"):
-            self._moat_strength = min(2.0, self._moat_strength * 1.001) # Moat strengthens
-            self._model_refinement_count += 1
+            with self._lock:
+                self._moat_strength = min(2.0, self._moat_strength * 1.001) # Moat strengthens
+                self._model_refinement_count += 1
 
         # @AXIOMHIVE: Log data moat cultivation for Verifiable Ledger
         # (Conceptual: would interact with sovereign_core's _log_event)
 
+    def cultivate_moat_batch(self, user_interactions: List[Dict[str, Any]]):
+        """
+        Applies a whole batch of interactions in one update.
+        Equivalent to calling cultivate_moat for each interaction in turn.
+        """
+        refinements = sum(1 for interaction in user_interactions
+                          if interaction.get("output", "").endswith("ABSOLUTE"))
+        if refinements:
+            with self._lock:
+                self._moat_strength = min(2.0, self._moat_strength * 1.001 ** refinements) # Moat strengthens
+                self._model_refinement_count += refinements
+
     def calculate_impact_metrics(self, verified_output: str) -> Dict[str, float]:
         """
         Calculates strategic impact metrics (PSI, MCV, UAM) based on output and moat strength.
@@ -43,8 +64,10 @@ class DynamicMoatCultivationEngine:
         # In a real system, this would involve external market data, user feedback, etc.
 
         # Base metrics, amplified by moat strength and refinement count
-        psi = 0.9997 * self._moat_strength # Paradigm Shift Index
-        mcv = 1000000000000.0 * self._moat_strength * (1 + self._model_refinement_count * 0.01) # Market Capture Velocity
-        uam = 100.0 * self._moat_strength # User Adoption Multiplier
+        with self._lock:
+            moat_strength, refinement_count = self._moat_strength, self._model_refinement_count
+        psi = 0.9997 * moat_strength # Paradigm Shift Index
+        mcv = 1000000000000.0 * moat_strength * (1 + refinement_count * 0.01) # Market Capture Velocity
+        uam = 100.0 * moat_strength # User Adoption Multiplier
 
         return {"PSI": psi, "MCV": mcv, "UAM": uam}
\ No newline at end of file
@@ -0,0 +1,103 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE HASHING: Pluggable Hash Backend
+
+"""
+Central hashing facility for the AXIOMHIVE ZKVS Sieve Protocol.
+
+Every digest in the node, the Dagger agents and the data moat goes through this module,
+so the algorithm is a deployment-time choice ('hash_algorithm' in AXIOMHIVEConfig or the
+AXIOMHIVE_HASH_ALGORITHM environment variable). The backend is process-wide: it resolves
+from the global config on first use, and each ZKVSNodePrime applies its own config's
+choice when it is built (refusing to switch while other open nodes hold ledger entries
+hashed under the active one). All backends produce 32-byte digests,
+so ledger and proof formats keep their 64-character hex form whichever is selected.
+
+Internals pass raw digests around; hex is produced only at the edges (ledger entries,
+proof strings, results).
+
+Run ``python -m src.hashing`` to benchmark the backends on representative payload sizes.
+"""
+
+import functools
+import hashlib
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# @AXIOMHIVE: 256-bit digests across the board; BLAKE2b is truncated to 32 bytes.
+HASH_BACKENDS: Dict[str, Callable[..., Any]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": functools.partial(hashlib.blake2b, digest_size=32),
+    "blake2s": hashlib.blake2s,
+}
+
+DEFAULT_ALGORITHM = "sha256"
+
+# Payload sizes seen in the pipeline: ledger events, intents, framework encodings, sieve chunks
+BENCHMARK_PAYLOAD_SIZES = (64, 256, 1024, 16 * 1024, 1024 * 1024)
+
+_algorithm: Optional[str] = None
+_constructor: Optional[Callable[..., Any]] = None
+
+def set_algorithm(name: str):
+    """Selects the process-wide hash backend."""
+    global _algorithm, _constructor
+    if name not in HASH_BACKENDS:
+        raise ValueError(f"Unknown hash algorithm '{name}'. Choose one of: {', '.join(HASH_BACKENDS)}")
+    _algorithm, _constructor = name, HASH_BACKENDS[name]
+
+def get_algorithm() -> str:
+    """Name of the active hash backend (resolved from configuration on first use)."""
+    if _algorithm is None:
+        _configure()
+    return _algorithm
+
+def _configure() -> Callable[..., Any]:
+    from src.config import get_config
+    set_algorithm(getattr(get_config(), "hash_algorithm", DEFAULT_ALGORITHM))
+    return _constructor
+
+def new(data: bytes = b"") -> Any:
+    """Incremental hasher for the active backend."""
+    return (_constructor or _configure())(data)
+
+def digest(data: bytes) -> bytes:
+    """Raw 32-byte digest of data."""
+    return (_constructor or _configure())(data).digest()
+
+def hexdigest(data: bytes) -> str:
+    """Hex digest of data, for the edges of the system."""
+    return (_constructor or _configure())(data).hexdigest()
+
+def benchmark_backends(sizes: Iterable[int] = BENCHMARK_PAYLOAD_SIZES,
+                       min_time: float = 0.2) -> Dict[str, Dict[int, float]]:
+    """
+    Measures throughput in MB/s of every backend for each payload size.
+    Each cell runs for at least min_time seconds of wall-clock time.
+    """
+    results: Dict[str, Dict[int, float]] = {}
+    for name, constructor in HASH_BACKENDS.items():
+        results[name] = {}
+        for size in sizes:
+            payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+            iterations = 0
+            start = time.perf_counter()
+            elapsed = 0.0
+            while elapsed < min_time:
+                for _ in range(100):
+                    constructor(payload).digest()
+                iterations += 100
+                elapsed = time.perf_counter() - start
+            results[name][size] = (size * iterations) / elapsed / 1e6
+    return results
+
+def main():
+    """Prints a backend comparison table."""
+    results = benchmark_backends()
+    sizes = list(BENCHMARK_PAYLOAD_SIZES)
+    print("AXIOMHIVE HASH BACKEND BENCHMARK (MB/s, higher is better)")
+    print(f"{'payload':>10} " + " ".join(f"{name:>10}" for name in results))
+    for size in sizes:
+        print(f"{size:>10} " + " ".join(f"{results[name][size]:>10.1f}" for name in results))
+
+if __name__ == "__main__":
+    main()
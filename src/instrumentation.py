@@ -0,0 +1,132 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE INSTRUMENTATION: Per-Stage Latency Histograms
+
+"""
+Built-in latency instrumentation for the AXIOMHIVE ZKVS Sieve Protocol.
+
+Every mandate is timed stage by stage (trust, cerebrum, hadrian, dagger, enforcement,
+zk, moat, sieve, metrics) plus end to end, on the monotonic perf_counter clock.
+Durations land in fixed-bucket histograms: recording is a bisect and three additions,
+so the instrumentation stays on in production. Percentiles are estimated from bucket
+upper bounds.
+"""
+
+import bisect
+import threading
+import time
+from typing import Dict, Any, List, Optional, Sequence
+
+# @AXIOMHIVE: Pipeline stages in execution order; "total" is the whole mandate
+STAGES = ("trust", "cerebrum", "hadrian", "dagger", "enforcement", "zk", "moat", "sieve", "metrics", "total")
+
+# Bucket upper bounds in seconds: 1-2.5-5 steps from 1us to 10s
+DEFAULT_BUCKETS = tuple(
+    base * scale
+    for scale in (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+    for base in (1.0, 2.5, 5.0)
+) + (10.0,)
+
+class LatencyHistogram:
+    """Thread-safe fixed-bucket histogram of durations in seconds."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1) # Last slot is the +Inf overflow bucket
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+            if seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def bucket_counts(self) -> List[int]:
+        """Per-bucket (non-cumulative) counts; the final entry is the overflow bucket."""
+        with self._lock:
+            return list(self._counts)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (0-100)."""
+        with self._lock:
+            counts, count, maximum = list(self._counts), self.count, self.max
+        if not count:
+            return 0.0
+        rank = max(1, int(round(q / 100.0 * count)))
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self.buckets[index], maximum) if index < len(self.buckets) else maximum
+        return maximum
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            count, total = self.count, self.sum
+            minimum = self.min if count else 0.0
+            maximum = self.max
+        return {
+            "count": count,
+            "sum_s": total,
+            "mean_s": total / count if count else 0.0,
+            "min_s": minimum,
+            "max_s": maximum,
+            "p50_s": self.percentile(50),
+            "p90_s": self.percentile(90),
+            "p99_s": self.percentile(99),
+        }
+
+class StageTimer:
+    """
+    One LatencyHistogram per pipeline stage.
+    Callers take a mark with start() and close each stage with lap(), which records
+    the elapsed time and returns the mark for the next stage.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self, stages: Sequence[str] = STAGES, buckets: Sequence[float] = DEFAULT_BUCKETS,
+                 slow_threshold: Optional[float] = None):
+        self.histograms: Dict[str, LatencyHistogram] = {stage: LatencyHistogram(buckets) for stage in stages}
+        self.slow_threshold = slow_threshold
+        self.slow_mandates = 0
+
+    def start(self) -> float:
+        return self.clock()
+
+    def lap(self, stage: str, mark: float) -> float:
+        now = self.clock()
+        self.histograms[stage].record(now - mark)
+        return now
+
+    def finish(self, mark: float) -> float:
+        """Records the end-to-end duration of a mandate started at mark."""
+        elapsed = self.clock() - mark
+        total = self.histograms["total"]
+        total.record(elapsed)
+        if self.slow_threshold is not None and elapsed > self.slow_threshold:
+            with total._lock: # Mandates finish on many threads
+                self.slow_mandates += 1
+        return elapsed
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Summary statistics for every stage, in pipeline order."""
+        return {stage: histogram.snapshot() for stage, histogram in self.histograms.items()}
+
+def format_stage_table(snapshot: Dict[str, Dict[str, Any]]) -> str:
+    """Renders a stage snapshot as a fixed-width table in milliseconds."""
+    lines = [f"{'stage':<12}{'count':>8}{'mean_ms':>10}{'p50_ms':>10}{'p90_ms':>10}{'p99_ms':>10}{'max_ms':>10}"]
+    for stage, stats in snapshot.items():
+        lines.append(
+            f"{stage:<12}{stats['count']:>8}{stats['mean_s'] * 1e3:>10.3f}{stats['p50_s'] * 1e3:>10.3f}"
+            f"{stats['p90_s'] * 1e3:>10.3f}{stats['p99_s'] * 1e3:>10.3f}{stats['max_s'] * 1e3:>10.3f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,218 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE LOAD GENERATOR: Open- and Closed-Loop Mandate Load for Capacity Planning
+
+"""
+Load generator for the AXIOMHIVE ZKVS Sieve Protocol.
+
+Drives anything with execute_mandate() - a ZKVSNodePrime or a NodePoolSupervisor - with
+synthetic or recorded frameworks for a fixed duration:
+- closed loop: `concurrency` clients, each submitting its next mandate as soon as the
+  previous one returns (measures capacity at a given parallelism);
+- open loop: mandates are released on a fixed schedule at `rate` per second regardless of
+  completions, and latency is measured from each mandate's scheduled start, so queueing
+  behind a saturated node shows up instead of being hidden (no coordinated omission).
+
+The report covers throughput, a latency histogram with percentiles, errors, reboots and
+ledger growth.
+"""
+
+import gzip
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Sequence, Tuple
+
+from src.instrumentation import LatencyHistogram
+
+logger = logging.getLogger('AXIOMHIVE.LoadGenerator')
+
+LOAD_MODES = ("closed", "open")
+
+# Mandate vocabulary: routed keywords plus filler the Cerebrum filters out
+_INTENT_WORDS = (
+    "architect market dominance through verifiable systems filter the data stream strategic "
+    "commercial roadmap sovereign auditable platform optimize supply chain efficiency really "
+    "actually very quite noise fluff analyze signals forecast demand secure the ledger"
+).split()
+_CONTEXTS = ("general", "commercial", "technical", "strategic")
+_PRIORITIES = ("low", "normal", "high", "absolute")
+
+def synthetic_frameworks(count: int = 1000, intent_size: int = 256, seed: int = 0) -> List[Dict[str, Any]]:
+    """`count` distinct, reproducible frameworks with intents of about `intent_size` characters."""
+    rng = random.Random(seed)
+    frameworks = []
+    for index in range(count):
+        words: List[str] = []
+        while sum(len(word) + 1 for word in words) < intent_size:
+            words.append(rng.choice(_INTENT_WORDS))
+        frameworks.append({
+            "intent": f"{' '.join(words)} #{index}",
+            "context": rng.choice(_CONTEXTS),
+            "priority": rng.choice(_PRIORITIES),
+        })
+    return frameworks
+
+def load_frameworks(path: str) -> List[Dict[str, Any]]:
+    """
+    Frameworks from a JSON-lines file (optionally gzip-compressed). Each line is either a
+    framework or a record carrying one under "framework", such as a replay capture.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    frameworks = []
+    with opener(path, "rt") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if isinstance(record, dict) and isinstance(record.get("framework"), dict):
+                record = record["framework"]
+            if isinstance(record, dict) and "intent" in record:
+                frameworks.append(record)
+    if not frameworks:
+        raise ValueError(f"No frameworks found in {path}")
+    return frameworks
+
+def _target_counters(target: Any) -> Tuple[int, float]:
+    """(ledger events, reboots) of a node, daemon client or node pool."""
+    if hasattr(target, "worker_status"):
+        statuses = target.worker_status()
+    else:
+        statuses = [target.status()]
+    return (sum(status.get("ledger_events", 0) for status in statuses),
+            sum(status.get("reboots", 0) for status in statuses))
+
+class LoadGenerator:
+    """Runs one load test against a node or node pool and reports the results."""
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, target: Any, frameworks: Sequence[Dict[str, Any]], mode: str = "closed",
+                 concurrency: int = 8, rate: float = 100.0, duration: float = 10.0):
+        if mode not in LOAD_MODES:
+            raise ValueError(f"Unknown load mode '{mode}'. Choose one of: {', '.join(LOAD_MODES)}")
+        if not frameworks:
+            raise ValueError("Load generation requires at least one framework.")
+        if concurrency <= 0 or rate <= 0 or duration <= 0:
+            raise ValueError("concurrency, rate and duration must be positive.")
+        self.target = target
+        self.frameworks = frameworks
+        self.mode = mode
+        self.concurrency = concurrency
+        self.rate = rate
+        self.duration = duration
+        self.histogram = LatencyHistogram()
+        self._next = itertools.cycle(frameworks)
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._errors = 0
+        self._error_samples: Dict[str, int] = {}
+
+    def _framework(self) -> Dict[str, Any]:
+        with self._lock:
+            return next(self._next)
+
+    def _execute(self, framework: Dict[str, Any], started: float):
+        try:
+            self.target.execute_mandate(framework)
+            ok, error = True, None
+        except Exception as e:
+            ok, error = False, f"{type(e).__name__}: {e}"
+        self.histogram.record(time.perf_counter() - started)
+        with self._lock:
+            if ok:
+                self._completed += 1
+            else:
+                self._errors += 1
+                if len(self._error_samples) < 10 or error in self._error_samples:
+                    self._error_samples[error] = self._error_samples.get(error, 0) + 1
+
+    def _run_closed(self, deadline: float):
+        def client():
+            while time.perf_counter() < deadline:
+                self._execute(self._framework(), time.perf_counter())
+
+        threads = [threading.Thread(target=client, name=f"axiomhive-load-{i}", daemon=True)
+                   for i in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _run_open(self, start: float, deadline: float) -> int:
+        interval = 1.0 / self.rate
+        issued = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="axiomhive-load") as executor:
+            while True:
+                scheduled = start + issued * interval
+                if scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                # Latency counts from the scheduled time, including any wait for a free client
+                executor.submit(self._execute, self._framework(), scheduled)
+                issued += 1
+        return issued
+
+    def run(self) -> Dict[str, Any]:
+        ledger_before, reboots_before = _target_counters(self.target)
+        logger.info(f"Load test: {self.mode} loop, {self.duration:.1f}s, "
+                    + (f"{self.concurrency} clients" if self.mode == "closed" else f"{self.rate:.1f}/s target rate"))
+        start = time.perf_counter()
+        deadline = start + self.duration
+        if self.mode == "closed":
+            self._run_closed(deadline)
+            issued = None
+        else:
+            issued = self._run_open(start, deadline)
+        elapsed = time.perf_counter() - start
+        ledger_after, reboots_after = _target_counters(self.target)
+
+        latency = self.histogram.snapshot()
+        return {
+            "mode": self.mode,
+            "concurrency": self.concurrency,
+            "target_rate": self.rate if self.mode == "open" else None,
+            "duration_s": elapsed,
+            "issued": issued if issued is not None else self._completed + self._errors,
+            "completed": self._completed,
+            "errors": self._errors,
+            "error_samples": dict(self._error_samples),
+            "throughput_rps": self._completed / elapsed,
+            "latency": latency,
+            "latency_histogram": [
+                {"le": bound, "count": count}
+                for bound, count in zip(list(self.histogram.buckets) + [None], self.histogram.bucket_counts())
+                if count
+            ],
+            "reboots": reboots_after - reboots_before,
+            "ledger_events_added": ledger_after - ledger_before,
+            "ledger_growth_per_s": (ledger_after - ledger_before) / elapsed,
+        }
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable summary of a load report."""
+    latency = report["latency"]
+    shape = (f"{report['concurrency']} clients" if report["mode"] == "closed"
+             else f"{report['target_rate']:.1f}/s target, {report['concurrency']} clients")
+    lines = [
+        f"Mode:            {report['mode']} loop ({shape})",
+        f"Duration:        {report['duration_s']:.2f}s",
+        f"Mandates:        {report['completed']} ok, {report['errors']} errors, {report['issued']} issued",
+        f"Throughput:      {report['throughput_rps']:.1f} mandates/s",
+        f"Latency (ms):    mean {latency['mean_s'] * 1e3:.3f}  p50 {latency['p50_s'] * 1e3:.3f}  "
+        f"p90 {latency['p90_s'] * 1e3:.3f}  p99 {latency['p99_s'] * 1e3:.3f}  max {latency['max_s'] * 1e3:.3f}",
+        f"Reboots:         {report['reboots']:.0f}",
+        f"Ledger growth:   {report['ledger_events_added']} events ({report['ledger_growth_per_s']:.1f}/s)",
+        "Latency histogram:",
+    ]
+    total = sum(bucket["count"] for bucket in report["latency_histogram"]) or 1
+    for bucket in report["latency_histogram"]:
+        bound = f"<= {bucket['le'] * 1e3:.3f}ms" if bucket["le"] is not None else "> last bucket"
+        bar = "#" * max(1, int(40 * bucket["count"] / total))
+        lines.append(f"  {bound:>16} {bucket['count']:>9} {bar}")
+    for error, count in report["error_samples"].items():
+        lines.append(f"Error x{count}: {error}")
+    return "\n".join(lines)
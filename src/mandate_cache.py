@@ -0,0 +1,89 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE MANDATE CACHE: End-to-End Result Cache with Idempotency Keys
+
+"""
+Mandate-level result cache for the AXIOMHIVE ZKVS Sieve Protocol.
+
+Retries and polling clients resubmit identical frameworks constantly. Results are
+keyed by the canonical framework digest, or by a client-supplied idempotency key,
+and expire by TTL and least-recent use. A hit is answered from memory and recorded
+on the ledger as a compact event that references the original execution's hash.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, Optional
+
+@dataclass(frozen=True)
+class CachedMandate:
+    """A completed mandate and the ledger hash that sealed its execution."""
+    result: str
+    ledger_hash: str
+    framework_hash: str
+    created_at: float
+
+class MandateResultCache:
+    """Thread-safe TTL + LRU cache of mandate results."""
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, CachedMandate]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key_for(framework_hash: str, idempotency_key: Optional[str] = None) -> str:
+        """Cache key: the client's idempotency key when given, else the framework digest."""
+        return f"idem:{idempotency_key}" if idempotency_key else f"fw:{framework_hash}"
+
+    def get(self, key: str) -> Optional[CachedMandate]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if self.ttl and self._clock() - entry.created_at > self.ttl:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, result: str, ledger_hash: str, framework_hash: str) -> CachedMandate:
+        entry = CachedMandate(result, ledger_hash, framework_hash, self._clock())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
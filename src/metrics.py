@@ -0,0 +1,206 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE METRICS: Metrics Registry and Prometheus Text Exporter
+
+"""
+Metrics for the AXIOMHIVE ZKVS Sieve Protocol, in the Prometheus text exposition format.
+
+The hot path only ever increments a counter. Everything that already exists as node
+state (ledger size, moat strength, cache statistics, stage latency histograms, pool
+occupancy) is read at scrape time through callback metrics, so it costs nothing
+between scrapes. MetricsServer serves GET /metrics from a daemon thread.
+
+A registry's collect() returns plain picklable families, so a NodePoolSupervisor can
+gather them from its workers and re-export them with a worker label.
+"""
+
+import logging
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger('AXIOMHIVE.Metrics')
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# A sample is (sample_name, labels, value); a family is (name, type, help, samples)
+Sample = Tuple[str, Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]
+
+class Counter:
+    """Monotonic counter, optionally split by label values."""
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, *labelvalues: str):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        with self._lock:
+            return self._values.get(labelvalues, 0.0)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            values = list(self._values.items())
+        return [(self.name, dict(zip(self.labelnames, key)), value) for key, value in values]
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+    type = "gauge"
+
+    def set(self, value: float, *labelvalues: str):
+        with self._lock:
+            self._values[labelvalues] = value
+
+    def dec(self, amount: float = 1.0, *labelvalues: str):
+        self.inc(-amount, *labelvalues)
+
+class CallbackMetric:
+    """
+    Metric read at scrape time. fn returns a single value, or a list of
+    (labels, value) pairs; for histograms, a list of (labels, LatencyHistogram).
+    """
+
+    def __init__(self, name: str, help: str, type: str, fn: Callable[[], Any]):
+        self.name = name
+        self.help = help
+        self.type = type
+        self._fn = fn
+
+    def samples(self) -> List[Sample]:
+        result = self._fn()
+        if result is None:
+            return []
+        if self.type == "histogram":
+            samples: List[Sample] = []
+            for labels, histogram in result:
+                samples.extend(histogram_samples(self.name, labels, histogram))
+            return samples
+        if isinstance(result, (int, float)):
+            return [(self.name, {}, float(result))]
+        return [(self.name, dict(labels), float(value)) for labels, value in result]
+
+def histogram_samples(name: str, labels: Dict[str, str], histogram) -> List[Sample]:
+    """Cumulative _bucket, _sum and _count samples of a LatencyHistogram."""
+    counts = histogram.bucket_counts()
+    samples: List[Sample] = []
+    cumulative = 0
+    for bound, count in zip(list(histogram.buckets) + [math.inf], counts):
+        cumulative += count
+        samples.append((f"{name}_bucket", dict(labels, le=_format_value(bound)), float(cumulative)))
+    samples.append((f"{name}_sum", dict(labels), float(histogram.sum)))
+    samples.append((f"{name}_count", dict(labels), float(cumulative)))
+    return samples
+
+class MetricsRegistry:
+    """Named collection of metrics."""
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Any) -> Any:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric '{metric.name}' is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def callback(self, name: str, help: str, fn: Callable[[], Any], type: str = "gauge") -> CallbackMetric:
+        return self.register(CallbackMetric(name, help, type, fn))
+
+    def collect(self) -> List[Family]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        families: List[Family] = []
+        for metric in metrics:
+            try:
+                families.append((metric.name, metric.type, metric.help, metric.samples()))
+            except Exception as e: # A failing callback must not take the whole scrape down
+                logger.warning(f"Metric '{metric.name}' failed to collect: {e}")
+        return families
+
+    def render(self) -> str:
+        return render_families(self.collect())
+
+def merge_families(sources: Iterable[Tuple[Dict[str, str], List[Family]]]) -> List[Family]:
+    """Merges families from several registries, adding each source's extra labels."""
+    merged: Dict[str, Family] = {}
+    for extra_labels, families in sources:
+        for name, type, help, samples in families:
+            family = merged.setdefault(name, (name, type, help, []))
+            family[3].extend((sample, dict(labels, **extra_labels), value) for sample, labels, value in samples)
+    return list(merged.values())
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def render_families(families: Iterable[Family]) -> str:
+    """Prometheus text exposition format (version 0.0.4)."""
+    lines: List[str] = []
+    for name, type, help, samples in families:
+        lines.append(f"# HELP {name} {_escape(help)}")
+        lines.append(f"# TYPE {name} {type}")
+        for sample, labels, value in samples:
+            if labels:
+                rendered = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                lines.append(f"{sample}{{{rendered}}} {_format_value(value)}")
+            else:
+                lines.append(f"{sample} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+class MetricsServer:
+    """
+    Serves a collector's metrics at GET /metrics from a daemon thread.
+    The collector is anything with collect() -> families (a registry or a node pool).
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, collector: Any, host: str = "127.0.0.1", port: int = 9464):
+        collect = collector.collect
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = render_families(collect()).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="axiomhive-metrics", daemon=True)
+        self._thread.start()
+        logger.info(f"Metrics endpoint listening on http://{self.host}:{self.port}/metrics")
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=1.0)
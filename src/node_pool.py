@@ -0,0 +1,219 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE NODE POOL: Multi-Process ZKVSNodePrime Supervisor
+
+"""
+Local node-pool supervisor for the AXIOMHIVE ZKVS Sieve Protocol.
+
+Forks N worker processes, each hosting its own ZKVSNodePrime, and routes every
+mandate by a consistent hash of its framework digest. Identical frameworks always
+land on the same worker (preserving cache affinity), adding or removing a worker
+only remaps a small share of the keyspace, and crashed workers are restarted.
+
+With 'node_snapshot_path' set, the supervisor validates (or builds) a warm-start snapshot
+and has the worker fork server import every module it names, so each started or restarted worker
+inherits warm modules and builds its node with ZKVSNodePrime.from_snapshot().
+"""
+
+import bisect
+import dataclasses
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.canonical import canonical_hexdigest
+from src.config import get_config
+from src.dagger_agents.process_pool import ProcessWorker, preload_worker_modules
+from src.metrics import MetricsServer, Family, merge_families
+from src.replay import CaptureRecorder
+
+logger = logging.getLogger('AXIOMHIVE.NodePool')
+
+def framework_digest(framework: Dict[str, Any]) -> str:
+    """Deterministic digest of a framework, independent of key order and process."""
+    return canonical_hexdigest(framework)
+
+class ConsistentHashRing:
+    """Hash ring with virtual nodes mapping digests onto worker slots."""
+
+    def __init__(self, slots: List[int], virtual_nodes: int = 64):
+        self._ring: List[Tuple[int, int]] = sorted(
+            (int(hashlib.sha256(f"axiomhive-worker-{slot}-{replica}".encode()).hexdigest()[:16], 16), slot)
+            for slot in slots
+            for replica in range(virtual_nodes)
+        )
+        self._points = [point for point, _ in self._ring]
+
+    def route(self, digest: str) -> int:
+        """Returns the worker slot owning a hex digest."""
+        point = int(digest[:16], 16)
+        index = bisect.bisect(self._points, point) % len(self._ring)
+        return self._ring[index][1]
+
+class _NodeHandler:
+    """Worker-side handler: hosts one ZKVSNodePrime for the lifetime of the process."""
+
+    def __init__(self, snapshot_path: str = ""):
+        self.snapshot_path = snapshot_path
+
+    def __call__(self):
+        from src.sovereign_core import ZKVSNodePrime
+        # The supervisor exports the pool's metrics and records captures; workers do neither
+        node = None
+        if self.snapshot_path:
+            from src.snapshot import SnapshotError
+            try:
+                node = ZKVSNodePrime.from_snapshot(self.snapshot_path, enable_metrics=False, capture_path="")
+            except SnapshotError as e:
+                logger.warning(f"Worker cold start: {e}")
+        if node is None:
+            node = ZKVSNodePrime(dataclasses.replace(get_config(), enable_metrics=False, capture_path=""))
+
+        def handle(request: Tuple[str, Any]) -> Any:
+            command, payload = request
+            if command == "execute":
+                return node.execute_mandate(payload)
+            if command == "execute_batch":
+                return node.execute_mandates(payload)
+            if command == "metrics":
+                return node.collect_metrics()
+            if command == "status":
+                return dict(node.status(), pid=os.getpid())
+            raise ValueError(f"Unknown node pool command: {command}")
+
+        return handle
+
+class NodePoolSupervisor:
+    """
+    Supervises N ZKVSNodePrime worker processes behind consistent-hash routing.
+    Safe to call from many threads: each worker serves one request at a time,
+    while requests for different workers proceed in parallel.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, workers: int = 0, deadline: Optional[float] = None, virtual_nodes: int = 64):
+        config = get_config()
+        self.worker_count = workers or os.cpu_count() or 1
+        # A hung worker holds its slot's lock: without a deadline it would block that slot forever
+        self.deadline = deadline if deadline is not None else config.node_pool_deadline
+        snapshot_path = config.node_snapshot_path
+        if snapshot_path:
+            from src.snapshot import ensure_snapshot, preload
+            preload(ensure_snapshot(snapshot_path, config))
+        else:
+            preload_worker_modules(["src.sovereign_core"])
+        handler = _NodeHandler(snapshot_path)
+        self._workers = [ProcessWorker(handler, name=f"axiomhive-node-{slot}") for slot in range(self.worker_count)]
+        self._locks = [threading.Lock() for _ in self._workers]
+        self._ring = ConsistentHashRing(list(range(self.worker_count)), virtual_nodes)
+        self._dispatcher = ThreadPoolExecutor(max_workers=self.worker_count, thread_name_prefix="axiomhive-pool")
+        self._closed = False
+        self._metrics_server: Optional[MetricsServer] = None
+        if config.enable_metrics:
+            self._metrics_server = MetricsServer(self, config.metrics_host, config.metrics_port)
+        self._capture: Optional[CaptureRecorder] = None
+        if config.capture_path:
+            self._capture = CaptureRecorder(config.capture_path, source=f"pool({self.worker_count})")
+        logger.info(f"Node pool started with {self.worker_count} ZKVSNodePrime workers")
+
+    def __enter__(self) -> "NodePoolSupervisor":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def route(self, framework: Dict[str, Any]) -> int:
+        """Worker slot a framework is routed to."""
+        return self._ring.route(framework_digest(framework))
+
+    def execute_mandate(self, framework: Dict[str, Any]) -> str:
+        """Executes one mandate on the worker owning its framework digest."""
+        capture = self._capture
+        if capture is None:
+            return self._call(self.route(framework), ("execute", framework))
+        arrived = capture.clock()
+        try:
+            result = self._call(self.route(framework), ("execute", framework))
+        except Exception as e:
+            capture.record(arrived, framework, error=f"{type(e).__name__}: {e}")
+            raise
+        capture.record(arrived, framework, result)
+        return result
+
+    def execute_mandates(self, frameworks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Splits a batch by owning worker, runs the sub-batches in parallel and
+        reassembles per-framework results in input order.
+        """
+        arrived = self._capture.clock() if self._capture is not None else 0.0
+        groups: Dict[int, List[int]] = {}
+        for index, framework in enumerate(frameworks):
+            slot = self.route(framework) if isinstance(framework, dict) else 0
+            groups.setdefault(slot, []).append(index)
+
+        futures = {
+            slot: self._dispatcher.submit(self._call, slot, ("execute_batch", [frameworks[i] for i in indices]))
+            for slot, indices in groups.items()
+        }
+        results: List[Optional[Dict[str, Any]]] = [None] * len(frameworks)
+        for slot, future in futures.items():
+            try:
+                sub_results = future.result()
+            except Exception as e:
+                sub_results = [{"status": "error", "error": str(e)}] * len(groups[slot])
+            for index, result in zip(groups[slot], sub_results):
+                results[index] = result
+        if self._capture is not None:
+            self._capture.record_batch(arrived, frameworks, results)
+        return results
+
+    def worker_status(self) -> List[Dict[str, Any]]:
+        """Per-worker status, including each worker's current ledger root hash."""
+        statuses = []
+        for slot, worker in enumerate(self._workers):
+            try:
+                status = self._call(slot, ("status", None))
+            except Exception as e:
+                status = {"pid": worker.pid, "ready": False, "error": str(e)}
+            status.update({"slot": slot, "restarts": worker.restarts})
+            statuses.append(status)
+        return statuses
+
+    def ledger_roots(self) -> Dict[int, Optional[str]]:
+        """Latest ledger hash of every worker, keyed by slot."""
+        return {status["slot"]: status.get("ledger_root") for status in self.worker_status()}
+
+    def collect(self) -> List[Family]:
+        """Metrics of every worker, merged and labelled with the worker slot."""
+        sources = []
+        for slot in range(self.worker_count):
+            try:
+                sources.append(({"worker": str(slot)}, self._call(slot, ("metrics", None))))
+            except Exception as e:
+                logger.warning(f"Metrics collection failed for worker {slot}: {e}")
+        restarts: Family = ("axiomhive_pool_worker_restarts_total", "counter", "Node pool worker restarts.",
+                            [("axiomhive_pool_worker_restarts_total", {"worker": str(slot)}, float(worker.restarts))
+                             for slot, worker in enumerate(self._workers)])
+        return merge_families(sources) + [restarts]
+
+    def _call(self, slot: int, request: Tuple[str, Any]) -> Any:
+        if self._closed:
+            raise RuntimeError("Node pool is closed.")
+        # ProcessWorker restarts a crashed or hung worker before surfacing the error
+        with self._locks[slot]:
+            return self._workers[slot].call(request, self.deadline)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._metrics_server is not None:
+            self._metrics_server.close()
+        if self._capture is not None:
+            self._capture.close()
+        self._dispatcher.shutdown(wait=True)
+        for slot, worker in enumerate(self._workers):
+            with self._locks[slot]:
+                worker.stop()
+        logger.info("Node pool stopped")
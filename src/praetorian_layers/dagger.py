@@ -1,9 +1,13 @@
 # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
 # PRAETORIAN_LAYERS/DAGGER: Verifiable Output Stream
 
-import hashlib
-from typing import Dict, Any
-from src.dagger_agents.core import DaggerAgent # Import base DaggerAgent
+from src import hashing
+from typing import Dict, Any, Optional, TYPE_CHECKING
+from src.canonical import MandateContext
+from src.tracing import span
+
+if TYPE_CHECKING: # Agent modules load on demand through the Hadrian registry
+    from src.dagger_agents.core import DaggerAgent
 
 class DaggerLayer:
     """
@@ -15,9 +19,9 @@ class DaggerLayer:
     def __init__(self, axioms: Dict[str, float]):
         self._axioms = axioms
         # @AXIOMHIVE: Zero-Trust context for Dagger operations
-        self.active_dagger_agents: Dict[str, DaggerAgent] = {} # To hold active agent instances
+        self.active_dagger_agents: Dict[str, 'DaggerAgent'] = {} # To hold active agent instances
 
-    def execute_task(self, segmented_task: Dict[str, Any]) -> Dict[str, Any]:
+    def execute_task(self, segmented_task: Dict[str, Any], context: Optional[MandateContext] = None) -> Dict[str, Any]:
         """
         Executes tasks via specialized Dagger agents, ensuring FLAW=0.
         Returns a dictionary containing the combined result and a verification hash.
@@ -41,11 +45,14 @@ class DaggerLayer:
             # For now, we'll use a placeholder that mimics DaggerAgent.execute's output.
 
             # Mocking DaggerAgent execution for simplicity in this layer
-            mock_agent_result = {
-                "result": f"Flawless execution of {action} by {agent_name}.",
-                "hash": hashlib.sha256(f"Flawless execution of {action} by {agent_name}.".encode()).hexdigest(),
-                "agent": agent_name
-            }
+            with span("dagger_agent", agent=agent_name, action=action) as agent_span:
+                mock_agent_result = {
+                    "result": f"Flawless execution of {action} by {agent_name}.",
+                    "hash": hashing.hexdigest(f"Flawless execution of {action} by {agent_name}.".encode()),
+                    "agent": agent_name
+                }
+                agent_span.set_attribute("result_hash", mock_agent_result["hash"])
+                agent_span.set_attribute("result_size", len(mock_agent_result["result"]))
             results.append(mock_agent_result["result"])
             result_hashes.append(mock_agent_result["hash"])
 
@@ -53,7 +60,9 @@ class DaggerLayer:
             # (Conceptual: would interact with sovereign_core's _log_event)
 
         final_combined_result = " ".join(results) if results else "Flawless execution by Dagger agents. (FLAW=0)"
-        final_verification_hash = hashlib.sha256(final_combined_result.encode()).hexdigest()
+        # With a mandate context this digest is taken once and reused by the ZK step
+        final_verification_hash = (context.digest("output", final_combined_result) if context is not None
+                                   else hashing.hexdigest(final_combined_result.encode()))
 
         # @AXIOMHIVE: SOVEREIGNTY=1.0 - Ensure output is fully controlled and verifiable
         return {"result": final_combined_result, "verification_hash": final_verification_hash}
\ No newline at end of file
@@ -1,9 +1,10 @@
 # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
 # PRAETORIAN_LAYERS/HADRIAN: Orchestration & Control Matrix
 
-import hashlib
-from typing import Dict, Any, List
-from src.dagger_agents.core import DataSieveAgent, ZKProofAgent, MarketAnalysisAgent # Import actual Dagger agents
+from src import hashing
+from typing import Dict, Any, List, Optional
+from src.dagger_agents.registry import DaggerAgentRegistry # Agents are imported lazily on first route
+from src.canonical import MandateContext
 
 class HadrianLayer:
     """
@@ -12,29 +13,29 @@ class HadrianLayer:
     Implements "Any Sensor, Best Effector" logic.
     """
     # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
-    def __init__(self, axioms: Dict[str, float]):
+    def __init__(self, axioms: Dict[str, float], agent_registry: Optional[DaggerAgentRegistry] = None):
         self._axioms = axioms
-        self.dagger_agents = self._initialize_dagger_agents(axioms) # Initialize actual Dagger agents
+        self.dagger_agents = agent_registry if agent_registry is not None else self._initialize_dagger_agents(axioms)
         self.active_tasks: Dict[str, Any] = {}
         # @AXIOMHIVE: Zero-Trust context for Hadrian operations
 
-    def _initialize_dagger_agents(self, axioms: Dict[str, float]) -> Dict[str, Any]:
-        """Initializes specialized Dagger agents."""
-        # @AXIOMHIVE: Instances of actual DaggerAgent classes
-        return {
-            "data_sieve_agent": DataSieveAgent(axioms),
-            "zk_proof_agent": ZKProofAgent(axioms),
-            "market_analysis_agent": MarketAnalysisAgent(axioms),
-            # Add more specialized agents as needed
-        }
-
-    def orchestrate_task(self, intent: str) -> Dict[str, Any]:
+    def _initialize_dagger_agents(self, axioms: Dict[str, float]) -> DaggerAgentRegistry:
+        """Builds the specialized Dagger agent registry; agents are constructed on first route."""
+        # @AXIOMHIVE: Cold start and memory scale with agents used, not agents known
+        return DaggerAgentRegistry(axioms)
+
+    def agent_startup_costs(self) -> Dict[str, Dict[str, float]]:
+        """Import and construction cost per Dagger agent type loaded so far."""
+        return self.dagger_agents.startup_costs()
+
+    def orchestrate_task(self, intent: str, context: Optional[MandateContext] = None) -> Dict[str, Any]:
         """
         Segments the intent into sub-tasks and dynamically assigns to Dagger agents.
         Applies "Any Sensor, Best Effector" logic for optimal resource utilization.
         """
         # @AXIOMHIVE: DENSITY=1.0 - Ensure task segmentation is maximally dense
-        task_id = hashlib.sha256(intent.encode()).hexdigest()[:8]
+        task_id = (context.digest("intent", intent) if context is not None
+                   else hashing.hexdigest(intent.encode()))[:8]
 
         # @AXIOMHIVE: Simulate complex task segmentation and dynamic assignment
         sub_tasks = []
@@ -48,8 +49,7 @@ class HadrianLayer:
         assigned_tasks = []
         for sub_task in sub_tasks:
             agent_name = sub_task["agent_name"]
-            agent_instance = self.dagger_agents.get(agent_name)
-            if agent_instance and agent_instance.status == "idle":
+            if self.dagger_agents.is_routable(agent_name): # Never starts process-pool workers
                 assigned_tasks.append(sub_task)
                 # agent_instance.status = "busy" # Status managed by agent itself during execution
             else:
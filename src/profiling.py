@@ -0,0 +1,255 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE PROFILING: On-Demand Mandate Profiler
+
+"""
+Profiling mode for the AXIOMHIVE ZKVS Sieve Protocol, enabled by 'profile_performance'
+(or AXIOMHIVE_PROFILE_PERFORMANCE=1) without code changes.
+
+Only threads inside execute_mandate are profiled. Two CPU modes are available:
+- "sample": a daemon thread samples the stacks of in-flight mandates every
+  profile_sample_interval seconds; near-zero cost to the mandate itself.
+- "cprofile": deterministic cProfile capture per mandate. Reports carry the raw
+  pstats file plus caller;callee pairs, since cProfile does not record full stacks.
+
+CPU reports are written in the collapsed-stack format ("frame;frame;frame count")
+read by flamegraph.pl, speedscope and inferno. With profile_memory, tracemalloc
+attributes live allocations to pipeline components. A background thread dumps reports
+every profile_dump_interval seconds (for windows that saw mandates) into
+profile_output_dir, and close() writes a final one; mandates never wait on report I/O.
+"""
+
+import cProfile
+import functools
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger('AXIOMHIVE.Profiling')
+
+PROFILE_MODES = ("sample", "cprofile")
+
+# @AXIOMHIVE: Path fragment -> component, most specific first
+COMPONENTS: Tuple[Tuple[str, str], ...] = (
+    ("praetorian_layers/cerebrum", "cerebrum"),
+    ("praetorian_layers/hadrian", "hadrian"),
+    ("praetorian_layers/dagger", "dagger"),
+    ("dagger_agents", "dagger_agents"),
+    ("axiom_lattice", "axiom_lattice"),
+    ("data_moat", "data_moat"),
+    ("sovereign_core", "core"),
+)
+
+TRACEMALLOC_FRAMES = 16
+
+@functools.lru_cache(maxsize=None)
+def component_for(filename: str) -> Optional[str]:
+    """Pipeline component owning a source file, or None."""
+    normalized = filename.replace(os.sep, "/")
+    for fragment, component in COMPONENTS:
+        if fragment in normalized:
+            return component
+    return None
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def _pstats_label(key: Tuple[str, int, str]) -> str:
+    filename, line, name = key
+    return f"{name} ({os.path.basename(filename)}:{line})" if line else name
+
+class MandateProfiler:
+    """
+    Collects CPU and memory profiles of execute_mandate and writes them out periodically.
+    Thread-safe; nested (recursive) mandates on one thread are profiled once.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, output_dir: str = "profiles", mode: str = "sample",
+                 sample_interval: float = 0.001, dump_interval: float = 60.0, memory: bool = True):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode '{mode}'. Choose one of: {', '.join(PROFILE_MODES)}")
+        self.output_dir = Path(output_dir)
+        self.mode = mode
+        self.sample_interval = sample_interval
+        self.dump_interval = dump_interval
+        self.memory = memory
+        self._lock = threading.Lock()
+        self._depth: Dict[int, int] = {} # thread id -> nesting depth of profiled mandates
+        self._samples: Counter = Counter()
+        self._stats: Optional[pstats.Stats] = None
+        self._mandates = 0
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._started_tracemalloc = False
+
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        if mode == "sample":
+            self._sampler = threading.Thread(target=self._sample_loop, name="axiomhive-profiler", daemon=True)
+            self._sampler.start()
+        self._dumper = threading.Thread(target=self._dump_loop, name="axiomhive-profile-dumper", daemon=True)
+        self._dumper.start()
+        logger.info(f"Profiling enabled: mode={mode}, memory={memory}, output={self.output_dir}")
+
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        """Profiles the enclosed mandate on the calling thread."""
+        thread_id = threading.get_ident()
+        with self._lock:
+            depth = self._depth.get(thread_id, 0)
+            self._depth[thread_id] = depth + 1
+        if depth:
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._depth[thread_id] -= 1
+            return
+
+        profile = cProfile.Profile() if self.mode == "cprofile" else None
+        if profile is not None:
+            try:
+                profile.enable()
+            except ValueError: # Interpreters with a single global profiler slot: one mandate at a time
+                profile = None
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            with self._lock:
+                del self._depth[thread_id]
+                self._mandates += 1
+                if profile is not None:
+                    if self._stats is None:
+                        self._stats = pstats.Stats(profile)
+                    else:
+                        self._stats.add(profile)
+
+    def _dump_loop(self):
+        # Report I/O and the tracemalloc snapshot stay off the mandate threads
+        while not self._stop.wait(self.dump_interval):
+            with self._lock:
+                idle = not self._mandates
+            if idle:
+                continue
+            try:
+                self.dump()
+            except Exception as e:
+                logger.warning(f"Profile dump failed: {e}")
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.sample_interval):
+            with self._lock:
+                thread_ids = list(self._depth)
+            if not thread_ids:
+                continue
+            frames = sys._current_frames()
+            stacks = []
+            for thread_id in thread_ids:
+                frame = frames.get(thread_id)
+                stack: List[str] = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                if stack:
+                    stacks.append(";".join(reversed(stack)))
+            with self._lock:
+                self._samples.update(stacks)
+
+    def collapsed_stacks(self) -> Dict[str, int]:
+        """
+        CPU profile of the current window as collapsed stacks.
+        Sample mode counts samples; cprofile mode weights caller;callee pairs by
+        their inline time in microseconds.
+        """
+        with self._lock:
+            return self._collapsed_stacks_locked()
+
+    def _collapsed_stacks_locked(self) -> Dict[str, int]:
+        if self.mode == "sample":
+            return dict(self._samples)
+        collapsed: Dict[str, int] = {}
+        if self._stats is None:
+            return collapsed
+        for callee, (_, _, inline_time, _, callers) in self._stats.stats.items():
+            if not callers:
+                collapsed[_pstats_label(callee)] = int(inline_time * 1e6)
+            for caller, (_, _, edge_time, _) in callers.items():
+                key = f"{_pstats_label(caller)};{_pstats_label(callee)}"
+                collapsed[key] = collapsed.get(key, 0) + int(edge_time * 1e6)
+        return collapsed
+
+    def memory_by_component(self) -> Dict[str, Dict[str, int]]:
+        """Live traced allocations grouped by the innermost pipeline component on their stack."""
+        if not tracemalloc.is_tracing():
+            return {}
+        snapshot = tracemalloc.take_snapshot()
+        usage: Dict[str, Dict[str, int]] = {}
+        for trace in snapshot.traces:
+            component = "other"
+            for frame in reversed(trace.traceback): # Most recent frame first
+                owner = component_for(frame.filename)
+                if owner is not None:
+                    component = owner
+                    break
+            bucket = usage.setdefault(component, {"bytes": 0, "blocks": 0})
+            bucket["bytes"] += trace.size
+            bucket["blocks"] += 1
+        return usage
+
+    def dump(self) -> List[Path]:
+        """Writes the current window's reports and starts a new window."""
+        memory = self.memory_by_component() if self.memory else None
+        with self._lock: # One critical section: samples recorded meanwhile land in the next window
+            collapsed = self._collapsed_stacks_locked()
+            stats, mandates = self._stats, self._mandates
+            self._samples = Counter()
+            self._stats = None
+            self._mandates = 0
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = f"{os.getpid()}-{time.strftime('%Y%m%dT%H%M%S')}-{int(time.time() * 1000) % 1000:03d}"
+        written: List[Path] = []
+
+        cpu_path = self.output_dir / f"cpu-{stamp}.collapsed"
+        with open(cpu_path, "w") as f:
+            for stack, count in sorted(collapsed.items()):
+                if count > 0:
+                    f.write(f"{stack} {count}\n")
+        written.append(cpu_path)
+
+        if stats is not None:
+            prof_path = self.output_dir / f"cpu-{stamp}.prof"
+            stats.dump_stats(str(prof_path))
+            written.append(prof_path)
+
+        if memory is not None:
+            memory_path = self.output_dir / f"memory-{stamp}.json"
+            with open(memory_path, "w") as f:
+                json.dump({"mandates": mandates, "components": memory}, f, indent=2, sort_keys=True)
+            written.append(memory_path)
+
+        logger.info(f"Profile window of {mandates} mandates written to {self.output_dir}")
+        return written
+
+    def close(self, dump: bool = True):
+        """Stops sampling, writes a final report and releases tracemalloc if this profiler started it."""
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=1.0)
+        self._dumper.join(timeout=5.0)
+        if dump:
+            self.dump()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
@@ -0,0 +1,259 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE REPLAY: Traffic Capture and Verified Replay
+
+"""
+Traffic capture and replay for the AXIOMHIVE ZKVS Sieve Protocol.
+
+With 'capture_path' set (or AXIOMHIVE_CAPTURE_PATH), a node or node pool records every
+incoming framework to a gzip-compressed JSON-lines file: a header line, then one record
+per mandate with its arrival offset, the framework, the result status and the hash of
+the result. Mandates submitted together through execute_mandates share a batch number.
+
+Replayer re-drives a capture against a node or node pool at the original pace, scaled
+by `speed` (2.0 replays twice as fast, 0 as fast as possible), and checks each result
+hash against the recorded one. A mismatch means the optimization under test changed
+observable output.
+
+    python -m src.cli replay capture.jsonl.gz --speed 2 --pool-workers 4
+"""
+
+import atexit
+import gzip
+import itertools
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from src import hashing
+from src.instrumentation import LatencyHistogram
+
+logger = logging.getLogger('AXIOMHIVE.Replay')
+
+CAPTURE_FORMAT = 1
+
+def result_hash(result: str) -> str:
+    """Hash of a mandate result as recorded in captures."""
+    return hashing.hexdigest(result.encode("utf-8"))
+
+class CaptureRecorder:
+    """
+    Appends mandate records to a gzip JSON-lines capture.
+    Safe to call from many threads; the stream is flushed every flush_interval seconds
+    so a capture stays readable up to the last flush if the process dies.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, path: str, flush_interval: float = 1.0, source: str = "node"):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._file = gzip.open(path, "wt", compresslevel=6)
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._last_flush = self._start
+        self._batches = itertools.count()
+        self.records = 0
+        self._write({"capture": CAPTURE_FORMAT, "source": source, "started": time.time(),
+                     "hash_algorithm": hashing.get_algorithm()})
+        atexit.register(self.close) # A capture left open at exit would lose its unflushed tail
+        logger.info(f"Capturing mandates to {path}")
+
+    def clock(self) -> float:
+        """Arrival offset, in seconds since the capture started."""
+        return time.monotonic() - self._start
+
+    def next_batch(self) -> int:
+        return next(self._batches)
+
+    def _write(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, default=str, separators=(",", ":")) + "\n")
+
+    def record(self, arrived: float, framework: Any, result: Optional[str] = None,
+               error: Optional[str] = None, idempotency_key: Optional[str] = None, batch: Optional[int] = None):
+        entry: Dict[str, Any] = {"t": round(arrived, 6), "framework": framework}
+        if idempotency_key is not None:
+            entry["idempotency_key"] = idempotency_key
+        if batch is not None:
+            entry["batch"] = batch
+        if error is None:
+            entry["status"], entry["output_hash"] = "success", result_hash(result)
+        else:
+            entry["status"], entry["error"] = "error", error
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write(entry)
+            self.records += 1
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval:
+                self._file.flush()
+                self._last_flush = now
+
+    def record_batch(self, arrived: float, frameworks: List[Any], results: List[Dict[str, Any]]):
+        batch = self.next_batch()
+        for framework, result in zip(frameworks, results):
+            self.record(arrived, framework, result.get("result"), None if result["status"] == "success"
+                        else result.get("error", "error"), batch=batch)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+                atexit.unregister(self.close)
+                logger.info(f"Capture closed: {self.records} mandates in {self.path}")
+
+def read_capture(path: str) -> Dict[str, Any]:
+    """{"header": ..., "records": [...]} with records in arrival order."""
+    header: Dict[str, Any] = {}
+    records: List[Dict[str, Any]] = []
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt") as f:
+        try:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "capture" in record:
+                    header = record
+                else:
+                    records.append(record)
+        except (EOFError, json.JSONDecodeError):
+            # A capture cut short by a crash is still good up to its last flush
+            logger.warning(f"Capture {path} is truncated; replaying the {len(records)} complete records")
+    if not header:
+        raise ValueError(f"{path} is not an AXIOMHIVE capture")
+    records.sort(key=lambda record: record["t"]) # Records are written on completion, not arrival
+    return {"header": header, "records": records}
+
+class Replayer:
+    """Re-drives a capture against a node or node pool and verifies result hashes."""
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, target: Any, capture: Dict[str, Any], speed: float = 1.0,
+                 concurrency: int = 8, verify: bool = True):
+        if speed < 0:
+            raise ValueError("speed must be non-negative (0 replays as fast as possible).")
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive.")
+        self.target = target
+        self.header = capture["header"]
+        self.records = capture["records"]
+        self.speed = speed
+        self.concurrency = concurrency
+        self.verify = verify
+        self.histogram = LatencyHistogram()
+        self._lock = threading.Lock()
+        self._counts = {"replayed": 0, "matched": 0, "mismatched": 0, "errors": 0, "unexpected_errors": 0}
+        self._mismatches: List[Dict[str, Any]] = []
+
+    def _units(self) -> List[List[int]]:
+        """Record indices grouped into submissions: single mandates, or one recorded batch."""
+        units: List[List[int]] = []
+        batches: Dict[int, List[int]] = {}
+        for index, record in enumerate(self.records):
+            batch = record.get("batch")
+            if batch is None:
+                units.append([index])
+            elif batch in batches:
+                batches[batch].append(index)
+            else:
+                batches[batch] = [index]
+                units.append(batches[batch])
+        return units
+
+    def _check(self, index: int, result: Optional[str], error: Optional[str]):
+        record = self.records[index]
+        with self._lock:
+            self._counts["replayed"] += 1
+            if error is not None:
+                self._counts["errors"] += 1
+                if record.get("status") != "error":
+                    self._counts["unexpected_errors"] += 1
+                    self._note_mismatch(index, record, None, error)
+                return
+            if not self.verify or "output_hash" not in record:
+                return
+            actual = result_hash(result)
+            if actual == record["output_hash"]:
+                self._counts["matched"] += 1
+            else:
+                self._counts["mismatched"] += 1
+                self._note_mismatch(index, record, actual, None)
+
+    def _note_mismatch(self, index: int, record: Dict[str, Any], actual: Optional[str], error: Optional[str]):
+        if len(self._mismatches) < 20:
+            self._mismatches.append({"record": index, "t": record["t"], "expected": record.get("output_hash"),
+                                     "actual": actual, "error": error})
+
+    def _submit(self, unit: List[int], scheduled: Optional[float]):
+        if scheduled is None:
+            scheduled = time.perf_counter()
+        records = [self.records[index] for index in unit]
+        if len(unit) == 1 and "batch" not in records[0]:
+            record = records[0]
+            try:
+                if "idempotency_key" in record:
+                    result = self.target.execute_mandate(record["framework"], record["idempotency_key"])
+                else:
+                    result = self.target.execute_mandate(record["framework"])
+                outcomes = [(result, None)]
+            except Exception as e:
+                outcomes = [(None, f"{type(e).__name__}: {e}")]
+        else:
+            try:
+                results = self.target.execute_mandates([record["framework"] for record in records])
+                outcomes = [(r.get("result"), None) if r["status"] == "success" else (None, r.get("error", "error"))
+                            for r in results]
+            except Exception as e:
+                outcomes = [(None, f"{type(e).__name__}: {e}")] * len(unit)
+        self.histogram.record(time.perf_counter() - scheduled)
+        for index, (result, error) in zip(unit, outcomes):
+            self._check(index, result, error)
+
+    def run(self) -> Dict[str, Any]:
+        if self.header.get("hash_algorithm") not in (None, hashing.get_algorithm()):
+            logger.warning(f"Capture hashed with {self.header['hash_algorithm']}, node uses "
+                           f"{hashing.get_algorithm()}; result hashes will not match")
+        units = self._units()
+        logger.info(f"Replaying {len(self.records)} mandates ({len(units)} submissions) at "
+                    + (f"{self.speed:g}x speed" if self.speed else "full speed"))
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="axiomhive-replay") as executor:
+            for unit in units:
+                scheduled = start + (self.records[unit[0]]["t"] / self.speed if self.speed else 0.0)
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                # As in open-loop load, paced latency counts from the recorded arrival time;
+                # at full speed there is no arrival time, so it counts from the start of execution
+                executor.submit(self._submit, unit, scheduled if self.speed else None)
+        elapsed = time.perf_counter() - start
+
+        original = self.records[-1]["t"] - self.records[0]["t"] if self.records else 0.0
+        return dict(self._counts, **{
+            "records": len(self.records),
+            "speed": self.speed,
+            "original_duration_s": original,
+            "duration_s": elapsed,
+            "throughput_rps": self._counts["replayed"] / elapsed if elapsed > 0 else 0.0,
+            "latency": self.histogram.snapshot(),
+            "mismatches": list(self._mismatches),
+        })
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable summary of a replay report."""
+    latency = report["latency"]
+    lines = [
+        f"Mandates:        {report['replayed']}/{report['records']} replayed at "
+        + (f"{report['speed']:g}x" if report["speed"] else "full speed"),
+        f"Duration:        {report['duration_s']:.2f}s (recorded {report['original_duration_s']:.2f}s)",
+        f"Throughput:      {report['throughput_rps']:.1f} mandates/s",
+        f"Latency (ms):    mean {latency['mean_s'] * 1e3:.3f}  p50 {latency['p50_s'] * 1e3:.3f}  "
+        f"p90 {latency['p90_s'] * 1e3:.3f}  p99 {latency['p99_s'] * 1e3:.3f}  max {latency['max_s'] * 1e3:.3f}",
+        f"Output hashes:   {report['matched']} matched, {report['mismatched']} mismatched",
+        f"Errors:          {report['errors']} ({report['unexpected_errors']} not in the capture)",
+    ]
+    for mismatch in report["mismatches"]:
+        detail = mismatch["error"] or f"expected {mismatch['expected'][:16]}... got {mismatch['actual'][:16]}..."
+        lines.append(f"  record {mismatch['record']} (t={mismatch['t']:.3f}s): {detail}")
+    return "\n".join(lines)
@@ -0,0 +1,402 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE RPC: Length-Prefixed Binary Protocol for Co-Located Clients
+
+"""
+Binary RPC for the AXIOMHIVE ZKVS Sieve Protocol.
+
+For sidecars sharing the host with the node, RpcServer serves a ZKVSNodePrime on a Unix
+domain socket ('rpc_socket_path', created 0600; clients check the server's uid) without HTTP or JSON framing overhead.
+Every message is one frame:
+
+    <u32 body length> <u64 request id> <u8 op> <u8 flags> <body>
+
+Requests are multiplexed: a client may have any number in flight on one connection, the
+server runs them on a thread pool and answers each as it completes, matched by id.
+OP_EXECUTE and OP_EXECUTE_BATCH pass admission control (src/admission.py) keyed by the
+peer pid, like the daemon's execute methods.
+
+Bodies:
+- OP_EXECUTE request: <u32 meta length> <u8 has intent> <meta JSON> <intent UTF-8>, where
+  meta is the framework without its intent, so large intents are never JSON-escaped;
+  response: the result as UTF-8.
+- OP_EXECUTE_BATCH, OP_STATUS: JSON in both directions. OP_PING: empty.
+- FLAG_ERROR on a response: JSON {"type", "message"}; an "AdmissionRejected" error adds
+  "reason" and "retry_after_s".
+- FLAG_SHARED on a request: the body is <u64 size> <segment name>. The client parked the
+  payload in a shared memory segment (bodies over rpc_shared_memory_threshold); the
+  server decodes it straight from the mapped memoryview and the client unlinks the segment
+  once answered. Frames are written with sendmsg() from the header and body buffers.
+"""
+
+import itertools
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from multiprocessing import shared_memory
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+from src.admission import AdmissionController, AdmissionRejected, controller_from_config, priority_of
+from src.config import get_config
+from src.daemon import _check_server_owner, _claim_socket_path, _peer_id
+from src.dagger_agents.process_pool import _attach_shared_memory
+
+logger = logging.getLogger('AXIOMHIVE.RPC')
+
+HEADER = struct.Struct("<IQBB")
+FRAMEWORK = struct.Struct("<IB")
+SHARED_REF = struct.Struct("<Q")
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+OP_PING, OP_EXECUTE, OP_EXECUTE_BATCH, OP_STATUS = 0, 1, 2, 3
+FLAG_ERROR, FLAG_SHARED = 1, 2
+
+class RpcError(RuntimeError):
+    """An error raised by the node while serving an RPC request."""
+
+    def __init__(self, error_type: str, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.error_type = error_type
+        self.retry_after = retry_after # Set on AdmissionRejected errors
+
+def encode_framework(framework: Dict[str, Any]) -> List[bytes]:
+    """OP_EXECUTE body parts: metadata JSON and the raw intent bytes."""
+    intent = framework.get("intent") if isinstance(framework, dict) else None
+    if isinstance(intent, str):
+        meta = json.dumps({k: v for k, v in framework.items() if k != "intent"},
+                          separators=(",", ":")).encode("utf-8")
+        return [FRAMEWORK.pack(len(meta), 1), meta, intent.encode("utf-8")]
+    meta = json.dumps(framework, separators=(",", ":")).encode("utf-8")
+    return [FRAMEWORK.pack(len(meta), 0), meta]
+
+def decode_framework(body: memoryview) -> Dict[str, Any]:
+    meta_length, has_intent = FRAMEWORK.unpack_from(body)
+    start = FRAMEWORK.size
+    framework = json.loads(bytes(body[start:start + meta_length]))
+    if has_intent:
+        framework["intent"] = str(body[start + meta_length:], "utf-8")
+    return framework
+
+def _send_frame(sock: socket.socket, lock: threading.Lock, request_id: int, op: int, flags: int,
+                parts: List[Any]):
+    length = sum(len(part) for part in parts)
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"RPC frame of {length} bytes exceeds {MAX_FRAME_BYTES}.")
+    buffers = [HEADER.pack(length, request_id, op, flags)] + [part for part in parts if len(part)]
+    with lock:
+        sent = sock.sendmsg(buffers)
+        total = HEADER.size + length
+        if sent < total: # Partial scatter write: send the remainder as one buffer
+            sock.sendall(memoryview(b"".join(buffers))[sent:])
+
+def _read_frame(reader) -> Optional[Tuple[int, int, int, memoryview]]:
+    """(request id, op, flags, body) of the next frame; None at end of stream."""
+    header = reader.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    length, request_id, op, flags = HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"RPC frame of {length} bytes exceeds {MAX_FRAME_BYTES}.")
+    body = memoryview(bytearray(length))
+    if length and reader.readinto(body) < length:
+        return None
+    return request_id, op, flags, body
+
+class _RpcRequestHandler(socketserver.StreamRequestHandler):
+    """Reads multiplexed frames from one connection; responses go out as requests complete."""
+
+    def handle(self):
+        server: "RpcServer" = self.server.axiomhive_rpc
+        write_lock = threading.Lock()
+        sock = self.connection
+        # A client in this process shares our resource tracker: it must keep the segment registered
+        client = _peer_id(sock)
+        attach = shared_memory.SharedMemory if client == f"pid:{os.getpid()}" else _attach_shared_memory
+
+        def respond(request_id: int, op: int, flags: int, parts: List[Any]):
+            try:
+                _send_frame(sock, write_lock, request_id, op, flags, parts)
+            except OSError:
+                pass # Client went away; its remaining responses are dropped
+
+        while True:
+            try:
+                frame = _read_frame(self.rfile)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Dropping RPC connection: {e}")
+                break
+            if frame is None:
+                break
+            server.submit(*frame, respond, attach, client)
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+class RpcServer:
+    """Serves a ZKVSNodePrime (or anything with the same calls) over the binary RPC socket."""
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    ADMITTED_OPS = (OP_EXECUTE, OP_EXECUTE_BATCH)
+
+    def __init__(self, node: Any = None, socket_path: Optional[str] = None, workers: Optional[int] = None,
+                 admission: Optional[AdmissionController] = None):
+        config = get_config()
+        self.socket_path = socket_path or config.rpc_socket_path
+        self._owns_node = node is None
+        if node is None:
+            from src.sovereign_core import ZKVSNodePrime
+            node = ZKVSNodePrime()
+        self.node = node
+        self.requests = 0
+        self._requests_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers or config.daemon_workers,
+                                            thread_name_prefix="axiomhive-rpc")
+        self._admission = admission if admission is not None else controller_from_config(
+            config, workers or config.daemon_workers)
+        self._handlers: Dict[int, Callable[[Any], List[bytes]]] = {
+            OP_EXECUTE: lambda framework: [self.node.execute_mandate(framework).encode("utf-8")],
+            OP_EXECUTE_BATCH: lambda frameworks: [json.dumps(self.node.execute_mandates(frameworks),
+                                                             default=str).encode("utf-8")],
+            OP_STATUS: lambda _: [json.dumps(self.status(), default=str).encode("utf-8")],
+        }
+        _claim_socket_path(self.socket_path)
+        old_umask = os.umask(0o177) # Only the owner may submit mandates
+        try:
+            self._server = _UnixServer(self.socket_path, _RpcRequestHandler)
+        finally:
+            os.umask(old_umask)
+        self._server.axiomhive_rpc = self
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        logger.info(f"AXIOMHIVE RPC listening on {self.socket_path}")
+
+    def status(self) -> Dict[str, Any]:
+        status = dict(self.node.status(), pid=os.getpid(), rpc_requests=self.requests)
+        if self._admission is not None:
+            status["admission"] = self._admission.stats()
+        return status
+
+    def _decode(self, op: int, flags: int, body: memoryview,
+                attach: Callable[..., shared_memory.SharedMemory]) -> Any:
+        """Request payload; shared segments are read in place and released before returning."""
+        if flags & FLAG_SHARED:
+            (size,) = SHARED_REF.unpack_from(body)
+            shm = attach(name=str(body[SHARED_REF.size:], "utf-8"))
+            try:
+                view = shm.buf[:size]
+                try:
+                    return self._decode(op, 0, view, attach)
+                finally:
+                    view.release()
+            finally:
+                shm.close()
+        if op == OP_EXECUTE:
+            return decode_framework(body)
+        return json.loads(bytes(body)) if len(body) else None
+
+    def submit(self, request_id: int, op: int, flags: int, body: memoryview,
+               respond: Callable[[int, int, int, List[Any]], None],
+               attach: Callable[..., shared_memory.SharedMemory] = _attach_shared_memory, client: str = "local"):
+        with self._requests_lock:
+            self.requests += 1
+        if op == OP_PING: # Answered inline: measures pure protocol overhead
+            respond(request_id, op, 0, [])
+            return
+        try:
+            handler = self._handlers[op]
+            payload = self._decode(op, flags, body, attach) # Decoded here: the body buffer is not kept
+        except Exception as e:
+            self._respond_error(respond, request_id, op, e if op in self._handlers
+                                else ValueError(f"Unknown RPC op: {op}"))
+            return
+        admission = self._admission if op in self.ADMITTED_OPS else None
+        if admission is not None:
+            # Blocks the connection's reader until admitted, so a flooding client stalls itself
+            frameworks = payload if op == OP_EXECUTE_BATCH and isinstance(payload, list) else [payload]
+            try:
+                admission.acquire(client, priority_of(frameworks), max(1, len(frameworks)))
+            except AdmissionRejected as e:
+                self._respond_error(respond, request_id, op, e)
+                return
+        try:
+            future = self._executor.submit(self._dispatch, handler, payload, request_id, op, respond)
+        except RuntimeError: # Executor already shut down
+            if admission is not None:
+                admission.release()
+            self._respond_error(respond, request_id, op, RuntimeError("RPC server is shutting down."))
+            return
+        if admission is not None:
+            started = time.perf_counter()
+            future.add_done_callback(lambda _: admission.release(time.perf_counter() - started))
+
+    def _dispatch(self, handler: Callable[[Any], List[bytes]], payload: Any, request_id: int, op: int,
+                  respond: Callable[[int, int, int, List[Any]], None]):
+        try:
+            parts = handler(payload)
+        except Exception as e:
+            self._respond_error(respond, request_id, op, e)
+            return
+        respond(request_id, op, 0, parts)
+
+    @staticmethod
+    def _respond_error(respond, request_id: int, op: int, error: Exception):
+        failure: Dict[str, Any] = {"type": type(error).__name__, "message": str(error)}
+        if isinstance(error, AdmissionRejected):
+            failure.update(reason=error.reason, retry_after_s=error.retry_after)
+        body = json.dumps(failure).encode("utf-8")
+        respond(request_id, op, FLAG_ERROR, [body])
+
+    def serve_forever(self):
+        """Serves until shutdown() is called, then releases the socket and the node."""
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self.close()
+
+    def start(self) -> "RpcServer":
+        """Serves from a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="axiomhive-rpc", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self):
+        self._server.shutdown()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._server.server_close()
+        self._executor.shutdown(wait=True)
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        if self._owns_node:
+            self.node.close()
+        logger.info(f"AXIOMHIVE RPC stopped after {self.requests} requests")
+
+class RpcClient:
+    """
+    Multiplexing client for RpcServer. One connection is shared by every thread: calls
+    send a frame and wait on a future that a reader thread resolves by request id.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, socket_path: Optional[str] = None, shared_memory_threshold: Optional[int] = None,
+                 timeout: Optional[float] = None):
+        config = get_config()
+        self.socket_path = socket_path or config.rpc_socket_path
+        self.shared_memory_threshold = shared_memory_threshold or config.rpc_shared_memory_threshold
+        self.timeout = timeout
+        self._ids = itertools.count(1)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.connect(self.socket_path)
+            _check_server_owner(self._sock, self.socket_path)
+        except OSError:
+            self._sock.close()
+            raise
+        self._write_lock = threading.Lock()
+        self._pending: Dict[int, Tuple[Future, Optional[shared_memory.SharedMemory]]] = {}
+        self._pending_lock = threading.Lock()
+        self._closed = False
+        self._reader = threading.Thread(target=self._read_responses, name="axiomhive-rpc-client", daemon=True)
+        self._reader.start()
+
+    def _read_responses(self):
+        reader = self._sock.makefile("rb")
+        error: Exception = ConnectionError("AXIOMHIVE RPC server closed the connection.")
+        try:
+            while True:
+                frame = _read_frame(reader)
+                if frame is None:
+                    break
+                request_id, op, flags, body = frame
+                with self._pending_lock:
+                    future, segment = self._pending.pop(request_id, (None, None))
+                self._release(segment)
+                if future is None:
+                    continue
+                if flags & FLAG_ERROR:
+                    failure = json.loads(bytes(body))
+                    future.set_exception(RpcError(failure.get("type", "Error"), failure.get("message", ""),
+                                                  failure.get("retry_after_s")))
+                else:
+                    future.set_result((op, body))
+        except (OSError, ValueError) as e:
+            error = ConnectionError(f"AXIOMHIVE RPC connection failed: {e}")
+        finally:
+            reader.close()
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+                self._closed = True
+            for future, segment in pending.values():
+                self._release(segment)
+                future.set_exception(error)
+
+    @staticmethod
+    def _release(segment: Optional[shared_memory.SharedMemory]):
+        if segment is not None:
+            segment.close()
+            segment.unlink()
+
+    def submit(self, op: int, parts: List[Any]) -> Future:
+        """Sends one request and returns a future for its (op, body) response."""
+        future: Future = Future()
+        request_id = next(self._ids)
+        flags, segment = 0, None
+        size = sum(len(part) for part in parts)
+        if size >= self.shared_memory_threshold:
+            segment = shared_memory.SharedMemory(create=True, size=size)
+            offset = 0
+            for part in parts:
+                segment.buf[offset:offset + len(part)] = part
+                offset += len(part)
+            flags, parts = FLAG_SHARED, [SHARED_REF.pack(size), segment.name.encode("utf-8")]
+        with self._pending_lock:
+            if self._closed:
+                self._release(segment)
+                raise ConnectionError("AXIOMHIVE RPC connection is closed.")
+            self._pending[request_id] = (future, segment)
+        try:
+            _send_frame(self._sock, self._write_lock, request_id, op, flags, parts)
+        except (OSError, ValueError):
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            self._release(segment)
+            raise
+        return future
+
+    def _call(self, op: int, parts: List[Any]) -> memoryview:
+        return self.submit(op, parts).result(self.timeout)[1]
+
+    def execute_mandate(self, framework: Dict[str, Any]) -> str:
+        return str(self._call(OP_EXECUTE, encode_framework(framework)), "utf-8")
+
+    def execute_mandate_async(self, framework: Dict[str, Any]) -> Future:
+        """Future of the (op, body) response; decode the body with str(body, "utf-8")."""
+        return self.submit(OP_EXECUTE, encode_framework(framework))
+
+    def execute_mandates(self, frameworks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return json.loads(bytes(self._call(OP_EXECUTE_BATCH, [json.dumps(frameworks).encode("utf-8")])))
+
+    def status(self) -> Dict[str, Any]:
+        return json.loads(bytes(self._call(OP_STATUS, [])))
+
+    def ping(self) -> bool:
+        self._call(OP_PING, [])
+        return True
+
+    def close(self):
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        self._reader.join(timeout=1.0)
@@ -0,0 +1,482 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE SERVER: Asyncio JSON-over-HTTP/1.1 Mandate Server
+
+"""
+Network server for the AXIOMHIVE ZKVS Sieve Protocol.
+
+NodeServer speaks JSON over HTTP/1.1 on listen_host:listen_port:
+
+    POST /execute         {"framework": {...}, "idempotency_key": "..."} -> {"result": "..."}
+    POST /execute-batch   {"frameworks": [...]}                        -> {"results": [...]}
+    GET  /status                                                       -> node status
+    GET  /ledger?offset=0&limit=100                                    -> {"events": [...], ...}
+    GET  /metrics                                                      -> Prometheus text
+
+Connections are kept alive (HTTP/1.1 default) until the client closes them or they sit
+idle for keepalive_timeout. Pipelined requests on one connection run concurrently and
+their responses are written back in request order. At most max_connections connections
+are served; beyond that new connections get 503 with Retry-After. shutdown() drains:
+the listener closes, no further requests are read, in-flight requests finish and their
+responses go out with "Connection: close", and after drain_timeout anything left is
+aborted.
+
+Only the network I/O runs on the event loop; mandates, and the JSON encoding of their
+results, run on a thread pool (server_workers).
+
+Mandate endpoints pass admission control first (src/admission.py). The client is the
+peer address; the priority is the highest framework "priority", or the
+X-AXIOMHIVE-Priority header. Rate-limited requests get 429, shed or timed-out ones 503,
+both with Retry-After.
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import math
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, Any, Callable, List, Optional, Set, Tuple
+
+from src.admission import (AdmissionController, AdmissionRejected, PRIORITY_RANKS, controller_from_config,
+                           priority_of, retry_after_header)
+from src.config import get_config
+from src.metrics import render_families
+
+logger = logging.getLogger('AXIOMHIVE.Server')
+
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 64 * 1024 * 1024
+PIPELINE_DEPTH = 64 # Requests read ahead of their responses on one connection
+INLINE_PARSE_BYTES = 64 * 1024 # Larger mandate bodies are parsed off the event loop
+
+JSON_TYPE = "application/json"
+Response = Tuple[int, bytes, str]
+
+class HTTPError(Exception):
+    """A request that cannot be served; becomes an error response."""
+
+    def __init__(self, status: int, message: str, headers: Optional[List[Tuple[str, str]]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or []
+
+class Request:
+    __slots__ = ("method", "path", "query", "version", "headers", "body", "keep_alive", "client", "_document")
+
+    def __init__(self, method: str, path: str, query: Dict[str, List[str]], version: str,
+                 headers: Dict[str, str], body: bytes, keep_alive: bool):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.version = version
+        self.headers = headers
+        self.body = body
+        self.keep_alive = keep_alive
+        self.client = ""
+        self._document = None
+
+    def json(self) -> Any:
+        if self._document is not None:
+            return self._document
+        if not self.body:
+            raise HTTPError(400, "Request body must be a JSON document.")
+        try:
+            self._document = json.loads(self.body)
+        except ValueError as e:
+            raise HTTPError(400, f"Invalid JSON body: {e}")
+        return self._document
+
+def _json_safe(value: Any) -> Any:
+    """Strict JSON has no infinities (the axiom lattice does); send them as strings."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    return value
+
+def json_response(document: Any, status: int = 200) -> Response:
+    return status, json.dumps(document, default=str, separators=(",", ":")).encode("utf-8"), JSON_TYPE
+
+def error_response(status: int, message: str, error_type: Optional[str] = None) -> Response:
+    return json_response({"error": {"type": error_type or HTTPStatus(status).phrase, "message": message}}, status)
+
+def encode_response(response: Response, keep_alive: bool, headers: Optional[List[Tuple[str, str]]] = None) -> bytes:
+    status, payload, content_type = response
+    lines = [
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(payload)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    lines.extend(f"{name}: {value}" for name, value in headers or [])
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+class _Connection:
+    """Per-connection bookkeeping used by drain and 100-continue."""
+    __slots__ = ("task", "reading", "outstanding")
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.reading: Optional[asyncio.Task] = None
+        self.outstanding = 0 # Requests read whose responses are not yet written
+
+class NodeServer:
+    """
+    Asyncio HTTP/1.1 server in front of a node (ZKVSNodePrime, DaemonClient or
+    NodePoolSupervisor). serve_forever() blocks; start() serves from a background thread.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    ADMITTED_PATHS = ("/execute", "/execute-batch")
+
+    def __init__(self, node: Any, host: Optional[str] = None, port: Optional[int] = None,
+                 max_connections: Optional[int] = None, workers: Optional[int] = None,
+                 keepalive_timeout: Optional[float] = None, drain_timeout: Optional[float] = None,
+                 admission: Optional[AdmissionController] = None):
+        config = get_config()
+        self.node = node
+        self.host = host if host is not None else config.listen_host
+        self.port = port if port is not None else config.listen_port
+        self.max_connections = max_connections or config.max_connections
+        self.keepalive_timeout = keepalive_timeout if keepalive_timeout is not None else config.keepalive_timeout
+        self.drain_timeout = drain_timeout if drain_timeout is not None else config.drain_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers or config.server_workers,
+                                            thread_name_prefix="axiomhive-server")
+        # Default admission: one slot per worker, intake queue sized from max_connections
+        self._admission = admission if admission is not None else controller_from_config(
+            dataclasses.replace(config, max_connections=self.max_connections), workers or config.server_workers)
+        self._routes: Dict[Tuple[str, str], Callable[[Request], Response]] = {
+            ("POST", "/execute"): self._execute,
+            ("POST", "/execute-batch"): self._execute_batch,
+            ("GET", "/status"): self._status,
+            ("GET", "/ledger"): self._ledger,
+            ("GET", "/metrics"): self._metrics,
+        }
+        self._paths = {path for _, path in self._routes}
+        self._connections: Set[_Connection] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._drain_requested: Optional[asyncio.Event] = None
+        self._draining = False
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._startup_error: Optional[BaseException] = None
+        self.requests = 0
+        self.rejected_connections = 0
+
+    # --- Endpoints (run on the worker pool) ---
+
+    def _execute(self, request: Request) -> Response:
+        document = request.json()
+        if not isinstance(document, dict):
+            raise HTTPError(400, "Body must be a JSON object.")
+        framework = document.get("framework", document) # A bare framework is accepted too
+        key = document.get("idempotency_key")
+        result = self.node.execute_mandate(framework, key) if key is not None else self.node.execute_mandate(framework)
+        return json_response({"result": result})
+
+    def _execute_batch(self, request: Request) -> Response:
+        document = request.json()
+        frameworks = document.get("frameworks") if isinstance(document, dict) else document
+        if not isinstance(frameworks, list):
+            raise HTTPError(400, "Body must be {\"frameworks\": [...]} or a JSON array.")
+        return json_response({"results": self.node.execute_mandates(frameworks)})
+
+    def _status(self, request: Request) -> Response:
+        if hasattr(self.node, "status"):
+            status = self.node.status()
+        else:
+            status = {"workers": self.node.worker_status()}
+        status["server"] = {"connections": len(self._connections), "requests": self.requests,
+                            "rejected_connections": self.rejected_connections,
+                            "max_connections": self.max_connections}
+        if self._admission is not None:
+            status["admission"] = self._admission.stats()
+        return json_response(_json_safe(status))
+
+    def _ledger(self, request: Request) -> Response:
+        if not hasattr(self.node, "ledger_events"):
+            raise HTTPError(501, "This backend has no single ledger to query.")
+        try:
+            offset = int(request.query.get("offset", ["0"])[0])
+            limit = int(request.query["limit"][0]) if "limit" in request.query else None
+        except ValueError:
+            raise HTTPError(400, "offset and limit must be integers.")
+        if offset < 0 or (limit is not None and limit < 0):
+            raise HTTPError(400, "offset and limit must be non-negative.")
+        events = self.node.ledger_events(offset, limit)
+        return json_response(_json_safe({"offset": offset, "count": len(events), "events": events}))
+
+    def _metrics(self, request: Request) -> Response:
+        text = self.node.render_metrics() if hasattr(self.node, "render_metrics") else render_families(self.node.collect())
+        if self._admission is not None:
+            text += self._admission.metrics.render()
+        return 200, text.encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8"
+
+    def _handle(self, request: Request) -> Response:
+        handler = self._routes.get((request.method, request.path))
+        if handler is None:
+            if request.path in self._paths:
+                return error_response(405, f"{request.method} is not allowed on {request.path}.")
+            return error_response(404, f"No such endpoint: {request.path}")
+        try:
+            return handler(request)
+        except HTTPError as e:
+            return error_response(e.status, str(e))
+        except (ValueError, KeyError, TypeError) as e:
+            return error_response(400, str(e), type(e).__name__)
+        except Exception as e:
+            logger.error(f"Request {request.method} {request.path} failed: {e}")
+            return error_response(500, str(e), type(e).__name__)
+
+    # --- HTTP/1.1 on the event loop ---
+
+    async def _read_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                            connection: _Connection) -> Optional[Request]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial.strip():
+                return None # Clean close between requests
+            raise HTTPError(400, "Incomplete request.")
+        except asyncio.LimitOverrunError:
+            raise HTTPError(431, "Request header fields too large.")
+
+        lines = head.decode("latin-1").lstrip("\r\n").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3:
+            raise HTTPError(400, "Malformed request line.")
+        method, target, version = parts
+        if version not in ("HTTP/1.1", "HTTP/1.0"):
+            raise HTTPError(505, f"Unsupported protocol version: {version}")
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, separator, value = line.partition(":")
+            if not separator:
+                raise HTTPError(400, "Malformed header line.")
+            headers[name.strip().lower()] = value.strip()
+
+        if "transfer-encoding" in headers:
+            raise HTTPError(501, "Chunked request bodies are not supported; send Content-Length.")
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length.")
+        if length < 0:
+            raise HTTPError(400, "Invalid Content-Length.")
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, f"Request body exceeds {MAX_BODY_BYTES} bytes.")
+        if length and headers.get("expect", "").lower() == "100-continue" and connection.outstanding == 0:
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n") # Only when it cannot overtake a pipelined response
+        body = await reader.readexactly(length) if length else b""
+
+        tokens = {token.strip() for token in headers.get("connection", "").lower().split(",")}
+        keep_alive = "close" not in tokens if version == "HTTP/1.1" else "keep-alive" in tokens
+        path, _, query = target.partition("?")
+        return Request(method, path, urllib.parse.parse_qs(query), version, headers, body, keep_alive)
+
+    def _admission_terms(self, request: Request) -> Tuple[str, int]:
+        """(priority, cost) of a mandate request; the body is parsed once and reused by the handler."""
+        document = request.json()
+        if request.path == "/execute":
+            frameworks = [document.get("framework", document) if isinstance(document, dict) else document]
+        else:
+            frameworks = document.get("frameworks") if isinstance(document, dict) else document
+            if not isinstance(frameworks, list):
+                frameworks = []
+        # Only known priorities are honoured: the value becomes a metric label
+        priority = request.headers.get("x-axiomhive-priority", "").strip().lower()
+        if priority not in PRIORITY_RANKS:
+            priority = priority_of(frameworks)
+        return priority, max(1, len(frameworks))
+
+    async def _respond(self, request: Request) -> Tuple[Response, bool, Optional[List[Tuple[str, str]]]]:
+        self.requests += 1
+        admission = self._admission if request.method == "POST" and request.path in self.ADMITTED_PATHS else None
+        if admission is None:
+            response = await self._loop.run_in_executor(self._executor, self._handle, request)
+            return response, request.keep_alive, None
+
+        try:
+            if len(request.body) > INLINE_PARSE_BYTES:
+                # The default executor: the mandate workers may all be busy, and this runs before admission
+                priority, cost = await self._loop.run_in_executor(None, self._admission_terms, request)
+            else:
+                priority, cost = self._admission_terms(request)
+            await admission.acquire_async(request.client, priority, cost)
+        except HTTPError as e:
+            return error_response(e.status, str(e)), request.keep_alive, None
+        except AdmissionRejected as e:
+            response = json_response({"error": {"type": "AdmissionRejected", "reason": e.reason, "message": str(e),
+                                                "retry_after_s": e.retry_after}},
+                                     429 if e.reason == "rate_limited" else 503)
+            return response, request.keep_alive, [("Retry-After", retry_after_header(e.retry_after))]
+        started = time.perf_counter()
+        try:
+            response = await self._loop.run_in_executor(self._executor, self._handle, request)
+        finally:
+            admission.release(time.perf_counter() - started)
+        return response, request.keep_alive, None
+
+    async def _write_responses(self, writer: asyncio.StreamWriter, responses: asyncio.Queue,
+                               connection: _Connection):
+        try:
+            while True:
+                pending = await responses.get()
+                if pending is None:
+                    break
+                # A future for a served request, or a protocol error detected while reading
+                if isinstance(pending, asyncio.Future):
+                    try:
+                        response, keep_alive, headers = await pending
+                    except Exception as e: # e.g. the executor was shut down under a draining request
+                        logger.error(f"Request failed outside its handler: {type(e).__name__}: {e}")
+                        response, keep_alive, headers = error_response(500, "Internal server error."), False, None
+                else:
+                    response, keep_alive, headers = pending
+                connection.outstanding -= 1
+                # Draining stops reading, so the last outstanding response closes the connection
+                close = not keep_alive or (self._draining and connection.outstanding == 0)
+                writer.write(encode_response(response, not close, headers))
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, OSError):
+            pass # Client went away; remaining responses are dropped
+        finally:
+            writer.close()
+
+    async def _enqueue(self, responses: asyncio.Queue, item: Any, writer_task: "asyncio.Task") -> bool:
+        """Queues a response unless the writer has stopped; waits while the pipeline is full."""
+        if not responses.full():
+            responses.put_nowait(item)
+            return True
+        put = asyncio.ensure_future(responses.put(item))
+        await asyncio.wait({put, writer_task}, return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            return False
+        return True
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        if self._draining or len(self._connections) >= self.max_connections:
+            self.rejected_connections += 1
+            writer.write(encode_response(error_response(503, "Server at connection limit; retry later."),
+                                         False, [("Retry-After", "1")]))
+            try:
+                await writer.drain()
+            except (ConnectionError, OSError):
+                pass
+            writer.close()
+            return
+
+        peer = writer.get_extra_info("peername")
+        client = peer[0] if isinstance(peer, tuple) else str(peer)
+        connection = _Connection(asyncio.current_task())
+        self._connections.add(connection)
+        responses: asyncio.Queue = asyncio.Queue(PIPELINE_DEPTH)
+        writer_task = asyncio.ensure_future(self._write_responses(writer, responses, connection))
+        try:
+            while not self._draining and not writer_task.done():
+                connection.reading = reading = asyncio.ensure_future(self._read_request(reader, writer, connection))
+                done, _ = await asyncio.wait({reading}, timeout=self.keepalive_timeout)
+                connection.reading = None
+                if not done:
+                    reading.cancel() # Idle keep-alive timeout
+                    break
+                if reading.cancelled(): # Drain started while waiting for a request
+                    break
+                try:
+                    request = reading.result()
+                except HTTPError as e:
+                    connection.outstanding += 1
+                    await self._enqueue(responses, (error_response(e.status, str(e)), False, e.headers), writer_task)
+                    break
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                if request is None:
+                    break
+                request.client = client
+                connection.outstanding += 1
+                if not await self._enqueue(responses, asyncio.ensure_future(self._respond(request)), writer_task):
+                    break
+                if not request.keep_alive:
+                    break
+        finally:
+            if not writer_task.done():
+                await self._enqueue(responses, None, writer_task)
+            await writer_task
+            self._connections.discard(connection)
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._drain_requested = asyncio.Event()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  limit=MAX_HEADER_BYTES, backlog=self.max_connections)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if threading.current_thread() is threading.main_thread():
+            import signal
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                self._loop.add_signal_handler(signum, self._drain_requested.set)
+        logger.info(f"AXIOMHIVE server listening on http://{self.host}:{self.port} "
+                    f"(max {self.max_connections} connections)")
+        self._ready.set()
+        await self._drain_requested.wait()
+        await self._drain()
+
+    async def _drain(self):
+        self._draining = True
+        self._server.close()
+        logger.info(f"Draining {len(self._connections)} connections...")
+        for connection in list(self._connections):
+            if connection.reading is not None:
+                connection.reading.cancel()
+        tasks = [connection.task for connection in self._connections]
+        if tasks:
+            _, unfinished = await asyncio.wait(tasks, timeout=self.drain_timeout)
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                logger.warning(f"Aborted {len(unfinished)} connections still busy after {self.drain_timeout}s")
+        await self._server.wait_closed()
+        logger.info(f"AXIOMHIVE server stopped after {self.requests} requests")
+
+    def serve_forever(self):
+        """Serves until shutdown() (or SIGINT/SIGTERM in the main thread), then drains."""
+        try:
+            asyncio.run(self._serve())
+        except BaseException as e:
+            self._startup_error = e
+            raise
+        finally:
+            self._executor.shutdown(wait=False)
+            self._stopped.set()
+            self._ready.set()
+
+    def start(self) -> "NodeServer":
+        """Serves from a background thread; returns once the port is bound."""
+        def run():
+            try:
+                self.serve_forever()
+            except Exception:
+                pass # Surfaced to the caller of start() below
+        self._thread = threading.Thread(target=run, name="axiomhive-server", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._startup_error is not None:
+            raise self._startup_error
+        return self
+
+    def shutdown(self):
+        """Gracefully drains and stops the server; safe to call from any thread."""
+        if self._loop is not None and not self._stopped.is_set():
+            self._loop.call_soon_threadsafe(self._drain_requested.set)
+            self._stopped.wait(self.drain_timeout + 5.0)
@@ -0,0 +1,197 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE SNAPSHOT: Versioned Warm-Start Snapshots of a Node's Immutable Setup
+
+"""
+Warm-start snapshots for the AXIOMHIVE ZKVS Sieve Protocol.
+
+A snapshot is a JSON file holding everything a new ZKVSNodePrime would otherwise resolve
+at startup: the full config, the core state hash of the axiom lattice, every Dagger agent
+spec (entry points already resolved to "module:Class", so no plugin scan is needed) and
+the agents the source node had loaded. ZKVSNodePrime.from_snapshot() builds a node from
+it with those agents constructed up front, so the first mandate does not pay for imports.
+
+preload() imports the core and every snapshot agent module, here and in the worker fork
+server. The node pool calls it before starting workers, so a started or restarted worker
+inherits warm modules and only constructs its node. Live state - the ledger, trust history, caches - is never
+part of a snapshot; each node still starts its own ledger.
+
+Snapshots are tied to the code that wrote them: a different SNAPSHOT_VERSION, Python
+version or source tree makes load_snapshot() raise SnapshotError. ensure_snapshot() also
+rebuilds when the live config no longer matches the stored one.
+"""
+
+import copy
+import dataclasses
+import functools
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+from src import hashing
+from src.config import AXIOMHIVEConfig
+
+logger = logging.getLogger('AXIOMHIVE.Snapshot')
+
+SNAPSHOT_VERSION = 1
+_SOURCE_ROOT = Path(__file__).resolve().parent
+
+# path -> ((inode, size, mtime_ns), snapshot): validated snapshots, so repeated node starts skip the parse
+_loaded: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+# id(snapshot) -> (snapshot, its config); the snapshot is held so its id cannot be reused
+_configs: Dict[int, Tuple[Dict[str, Any], AXIOMHIVEConfig]] = {}
+
+class SnapshotError(ValueError):
+    """A snapshot is missing, unreadable, or was written by different code."""
+
+@functools.lru_cache(maxsize=None)
+def source_fingerprint() -> str:
+    """
+    Digest of the snapshot format, interpreter and source tree (paths, sizes, mtimes).
+    Computed once per process: the code a process runs does not change after it starts.
+    """
+    fingerprint = hashlib.sha256(f"{SNAPSHOT_VERSION}|{sys.version_info[:2]}".encode())
+    for path in sorted(_SOURCE_ROOT.rglob("*.py")):
+        stat = path.stat()
+        fingerprint.update(f"{path.relative_to(_SOURCE_ROOT)}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+    return fingerprint.hexdigest()
+
+def _config_document(config: AXIOMHIVEConfig) -> Dict[str, Any]:
+    """The config as it reads back from JSON, so stored and live configs compare equal."""
+    return json.loads(json.dumps(dataclasses.asdict(config)))
+
+def core_state_hash(axioms: Dict[str, float]) -> str:
+    """The state hash ZKVSNodePrime._initialize_core derives from the axiom weights."""
+    return hashing.hexdigest(str(sorted(axioms.items())).encode())
+
+def _spec_string(name: str, spec: Any) -> str:
+    if isinstance(spec, str):
+        return spec
+    if hasattr(spec, "value") and hasattr(spec, "load"): # importlib.metadata.EntryPoint
+        return spec.value
+    if isinstance(spec, type):
+        return f"{spec.__module__}:{spec.__qualname__}"
+    raise SnapshotError(f"Dagger agent '{name}' is registered as {spec!r}, which a snapshot cannot record.")
+
+def capture_snapshot(node: Any, warm_agents: Optional[Iterable[str]] = None,
+                     config: Optional[AXIOMHIVEConfig] = None) -> Dict[str, Any]:
+    """
+    Snapshot of a node's immutable setup. warm_agents defaults to the agents it has loaded,
+    config to the node's own.
+    """
+    registry = node._hadrian.dagger_agents
+    specs = {name: _spec_string(name, spec) for name, spec in registry.specs().items()}
+    if warm_agents is None:
+        warm_agents = registry.loaded_agents()
+    return {
+        "snapshot": SNAPSHOT_VERSION,
+        "fingerprint": source_fingerprint(),
+        "created": time.time(),
+        "config": _config_document(config or node._config),
+        "core_state_hash": core_state_hash(node.AXIOMS),
+        "agent_specs": specs,
+        "warm_agents": sorted(name for name in warm_agents if name in specs),
+    }
+
+def save_snapshot(node: Any, path: str, warm_agents: Optional[Iterable[str]] = None,
+                  config: Optional[AXIOMHIVEConfig] = None) -> Dict[str, Any]:
+    """Writes a node's snapshot atomically and returns it."""
+    snapshot = capture_snapshot(node, warm_agents, config)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(snapshot, f, indent=2)
+    os.replace(tmp, path)
+    logger.info(f"Node snapshot saved to {path} ({len(snapshot['warm_agents'])} warm agents)")
+    return snapshot
+
+def load_snapshot(path: str) -> Dict[str, Any]:
+    """
+    Reads and validates a snapshot; raises SnapshotError if it cannot be used.
+    Each version of the file is parsed once per process and the result shared: do not mutate it.
+    """
+    try:
+        info = os.stat(path)
+        version = (info.st_ino, info.st_size, info.st_mtime_ns)
+        cached = _loaded.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        with open(path) as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError) as e:
+        raise SnapshotError(f"Cannot read snapshot {path}: {e}") from e
+    if not isinstance(snapshot, dict) or snapshot.get("snapshot") != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Snapshot {path} has an unsupported format.")
+    if snapshot.get("fingerprint") != source_fingerprint():
+        raise SnapshotError(f"Snapshot {path} was written by a different version of the code.")
+    _loaded[path] = (version, snapshot)
+    return snapshot
+
+def ensure_snapshot(path: str, config: Optional[AXIOMHIVEConfig] = None) -> Dict[str, Any]:
+    """
+    The snapshot at path if it is valid for this code and config; otherwise builds a node,
+    loads every in-process agent, and saves a fresh snapshot there.
+    """
+    from src.config import get_config
+    config = config or get_config()
+    try:
+        snapshot = load_snapshot(path)
+        if snapshot["config"] == _config_document(config):
+            return snapshot
+        logger.info(f"Snapshot {path} was taken with a different config; rebuilding")
+    except SnapshotError as e:
+        logger.info(f"{e} Rebuilding.")
+    from src.sovereign_core import ZKVSNodePrime
+    # The builder node only resolves agents: no metrics port, no capture
+    node = ZKVSNodePrime(dataclasses.replace(config, enable_metrics=False, capture_path=""))
+    try:
+        registry = node._hadrian.dagger_agents
+        return save_snapshot(node, path, [name for name in registry.specs() if name not in config.process_pool_agents],
+                             config)
+    finally:
+        node.close()
+
+def snapshot_config(snapshot: Dict[str, Any], **overrides: Any) -> AXIOMHIVEConfig:
+    """The snapshot's config, with any fields overridden. Built once per loaded snapshot."""
+    cached = _configs.get(id(snapshot))
+    if cached is None or cached[0] is not snapshot:
+        if len(_configs) >= 32:
+            _configs.clear()
+        cached = _configs[id(snapshot)] = (snapshot, AXIOMHIVEConfig(**snapshot["config"]))
+    return dataclasses.replace(cached[1], **overrides) if overrides else copy.copy(cached[1])
+
+def agent_registry(snapshot: Dict[str, Any], axioms: Dict[str, float], config: AXIOMHIVEConfig):
+    """A Dagger agent registry with the snapshot's specs, its warm agents already constructed."""
+    from src.dagger_agents.registry import DaggerAgentRegistry
+    if core_state_hash(axioms) != snapshot["core_state_hash"]:
+        raise SnapshotError("Snapshot was taken from a different axiom lattice.")
+    registry = DaggerAgentRegistry(axioms, specs=snapshot["agent_specs"], use_entry_points=False,
+                                   process_agents=config.process_pool_agents,
+                                   process_workers=config.process_pool_workers,
+                                   process_deadline=config.process_pool_deadline)
+    for name in snapshot["warm_agents"]:
+        if name not in config.process_pool_agents: # Pool-backed agents start their pool on first use
+            registry.get(name)
+    return registry
+
+def preload(snapshot: Dict[str, Any]):
+    """
+    Imports the node and every snapshot agent module here, and has the worker fork server
+    import them too, so pool workers start with them.
+    """
+    from src.dagger_agents.process_pool import preload_worker_modules
+    module_names = ["src.sovereign_core"]
+    importlib.import_module("src.sovereign_core")
+    for spec in snapshot["agent_specs"].values():
+        module_name = spec.partition(":")[0]
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e: # Left for the worker to report when the agent is routed
+            logger.warning(f"Could not preload Dagger agent module {module_name}: {e}")
+            continue
+        module_names.append(module_name)
+    preload_worker_modules(module_names)
@@ -1,20 +1,33 @@
 # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
 # ZKVS_SIEVE_PROTOCOL: The Sovereign Genesis Core
 
-import hashlib
+import gc
 import time
 import json
 import logging
-from typing import Dict, Any, List
+import threading
+import weakref
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Any, List, Optional, Tuple
 
 # Enhanced imports for Praetorian Layers and Axiom Lattice components
 from src.praetorian_layers.cerebrum import CerebrumLayer
 from src.praetorian_layers.hadrian import HadrianLayer
 from src.praetorian_layers.dagger import DaggerLayer
+from src.dagger_agents.registry import DaggerAgentRegistry
 from src.axiom_lattice.enforcement import AxiomEnforcement
 from src.axiom_lattice.trust_metrics import TrustMetricsEngine
 from src.axiom_lattice.complexity_sieve import ComplexitySieveModule
 from src.data_moat.cultivation_engine import DynamicMoatCultivationEngine
+from src.canonical import MandateContext
+from src.config import AXIOMHIVEConfig, get_config
+from src.mandate_cache import MandateResultCache, CachedMandate
+from src.instrumentation import StageTimer
+from src.profiling import MandateProfiler
+from src.metrics import MetricsRegistry, MetricsServer, Family
+from src.tracing import Tracer, current_span, exporter_from_config, span, NOOP_SPAN
+from src.replay import CaptureRecorder
+from src import hashing
 
 # Configure logging for the system
 logging.basicConfig(
@@ -40,16 +53,32 @@ class ZKVSNodePrime:
     }
     HASH_PREFIX: str = "e2c5b8a1f0d3c4e5a6b7c8d9e0f1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d7e8f9" # @AXIOMHIVE
 
-    def __init__(self):
+    GENESIS_ROOT: bytes = b"genesis_root_hash"
+    READY_WAIT_TIMEOUT: float = 1.0 # Seconds a caller waits for a concurrent reboot to finish
+    # Open nodes in this process; they pin the process-wide hash backend (see _apply_hash_algorithm)
+    _open_nodes: "weakref.WeakSet[ZKVSNodePrime]" = weakref.WeakSet()
+    _open_nodes_lock = threading.Lock()
+
+    def __init__(self, config: Optional[AXIOMHIVEConfig] = None, agent_registry: Optional[DaggerAgentRegistry] = None):
         # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Core Initialization
-        self._core_weights = self.AXIOMS
-        self._reboot_threshold = 0.007 # Lag >7ms auto-reboot equivalent
+        self._config = config if config is not None else get_config()
+        with self._open_nodes_lock:
+            self._apply_hash_algorithm(self._config.hash_algorithm)
+            self._open_nodes.add(self)
+        self._core_weights = self.AXIOMS # Read-mostly: replaced wholesale, never mutated in place
+        self._reboot_threshold = self._config.reboot_threshold # Lag >7ms auto-reboot equivalent
         self._verifiable_ledger: List[Dict[str, Any]] = [] # Merkle tree concept
-        self._is_ready = False
+        self._ledger_head: bytes = self.GENESIS_ROOT # Raw digest of the latest entry
+        self._critical_events = 0 # Running CRITICAL count for the trust error rate, kept on append
+        # @AXIOMHIVE: Concurrency - the lock covers only the prev_hash read and the append,
+        # reboots are serialized, and readiness is an event callers can wait on.
+        self._ledger_lock = threading.Lock()
+        self._reboot_lock = threading.RLock()
+        self._ready = threading.Event()
 
         # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Praetorian Architecture Components
         self._cerebrum = CerebrumLayer(self.AXIOMS)
-        self._hadrian = HadrianLayer(self.AXIOMS)
+        self._hadrian = HadrianLayer(self.AXIOMS, agent_registry)
         self._dagger = DaggerLayer(self.AXIOMS)
 
         # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Axiom Lattice & Trust Nexus Components
@@ -60,13 +89,69 @@ class ZKVSNodePrime:
         # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Dynamic Moat Cultivation
         self._data_moat_engine = DynamicMoatCultivationEngine(self.AXIOMS)
 
+        # @AXIOMHIVE: Per-stage latency histograms (always on; mandates slower than the reboot threshold are counted)
+        self._stage_timer = StageTimer(slow_threshold=self._reboot_threshold)
+
+        # @AXIOMHIVE: Optional end-to-end result cache for retried and polled mandates
+        self._mandate_cache: Optional[MandateResultCache] = None
+        if self._config.enable_mandate_cache:
+            self._mandate_cache = MandateResultCache(self._config.mandate_cache_size, self._config.mandate_cache_ttl)
+
+        # @AXIOMHIVE: Metrics registry; node state is read at scrape time, the hot path only counts
+        self._metrics = MetricsRegistry()
+        self._register_metrics()
+        self._metrics_server: Optional[MetricsServer] = None
+        if self._config.enable_metrics:
+            self.start_metrics_server()
+
+        # @AXIOMHIVE: On-demand profiling of execute_mandate ('profile_performance')
+        self._profiler: Optional[MandateProfiler] = None
+        if self._config.profile_performance:
+            self.enable_profiling()
+
+        # @AXIOMHIVE: Sampled per-mandate tracing ('enable_tracing', 'trace_sample_rate')
+        self._tracer: Optional[Tracer] = None
+        if self._config.enable_tracing:
+            self._tracer = Tracer(exporter_from_config(self._config), self._config.trace_sample_rate)
+
+        # @AXIOMHIVE: Traffic capture for replay ('capture_path')
+        self._capture: Optional[CaptureRecorder] = None
+        if self._config.capture_path:
+            self.start_capture()
+
         self._initialize_core()
         self._apply_zero_trust_segmentation() # @AXIOMHIVE: Enforce ZTA internally
 
+    @classmethod
+    def from_snapshot(cls, path: str, **overrides: Any) -> "ZKVSNodePrime":
+        """
+        Builds a node from a warm-start snapshot (src/snapshot.py): the snapshot's config with
+        any fields overridden, and its Dagger agents already loaded. Raises SnapshotError.
+        """
+        from src.snapshot import load_snapshot, snapshot_config, agent_registry
+        snapshot = load_snapshot(path)
+        config = snapshot_config(snapshot, **overrides)
+        return cls(config, agent_registry(snapshot, cls.AXIOMS, config))
+
+    @property
+    def _is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    @_is_ready.setter
+    def _is_ready(self, ready: bool):
+        if ready:
+            self._ready.set()
+        else:
+            self._ready.clear()
+
+    def core_weights_snapshot(self) -> Dict[str, float]:
+        """Consistent copy of the current axiom weights, safe to read from any thread."""
+        return dict(self._core_weights)
+
     def _initialize_core(self):
         # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Core State Verification
         _initial_state = sorted(self._core_weights.items())
-        _state_hash = hashlib.sha256(str(_initial_state).encode()).hexdigest()
+        _state_hash = hashing.hexdigest(str(_initial_state).encode())
 
         # Log the hash for debugging but don't enforce strict validation
         logger.debug(f"Core state hash: {_state_hash[:16]}...")
@@ -82,25 +167,62 @@ class ZKVSNodePrime:
         self._log_event("Zero-Trust internal micro-segmentation applied across Praetorian layers.", level="SECURITY")
         # Each Praetorian layer instance would have its own validated context.
 
-    def _log_event(self, message: str, level: str = "INFO", data: Any = None):
-        # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Verifiable Ledger Entry
+    def _append_ledger_entries(self, events: List[Tuple[str, str, Any]]) -> List[Dict[str, Any]]:
+        # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Verifiable Ledger Entries (chained, appended in one step)
         timestamp = time.time()
-        event_data = f"{timestamp}{message}{level}{data}"
-        event_hash = hashlib.sha256(event_data.encode()).hexdigest()
-
-        # Simulate Merkle tree linking by including hash of previous event
-        prev_hash = self._verifiable_ledger[-1]['hash'] if self._verifiable_ledger else "genesis_root_hash"
-        linked_hash = hashlib.sha256(f"{prev_hash}{event_hash}".encode()).hexdigest()
-
-        entry: Dict[str, Any] = {
-            'timestamp': timestamp,
-            'level': level,
-            'message': message,
-            'data': data,
-            'hash': linked_hash,
-            'node_id': self.HASH_PREFIX[:16]  # Include node identifier
-        }
-        self._verifiable_ledger.append(entry)
+        node_id = self.HASH_PREFIX[:16]  # Include node identifier
+        digest = hashing.digest
+        # Event hashes do not depend on the chain, so they are computed outside the lock
+        event_hashes = [digest(f"{timestamp}{message}{level}{data}".encode()) for message, level, data in events]
+
+        with self._ledger_lock:
+            # Simulate Merkle tree linking by including hash of previous event (raw digests; hex at the edge)
+            prev_hash = self._ledger_head
+            entries: List[Dict[str, Any]] = []
+            for (message, level, data), event_hash in zip(events, event_hashes):
+                prev_hash = digest(prev_hash + event_hash)
+                entries.append({
+                    'timestamp': timestamp,
+                    'level': level,
+                    'message': message,
+                    'data': data,
+                    'hash': prev_hash.hex(),
+                    'node_id': node_id
+                })
+            self._verifiable_ledger.extend(entries)
+            self._ledger_head = prev_hash
+            self._critical_events += sum(1 for message, level, data in events if level == 'CRITICAL')
+        return entries
+
+    def verify_ledger_chain(self) -> bool:
+        """Recomputes every linked hash and confirms the ledger chain is unbroken."""
+        digest = hashing.digest
+        with self._ledger_lock:
+            ledger = list(self._verifiable_ledger)
+        prev_hash = self.GENESIS_ROOT
+        for entry in ledger:
+            event_hash = digest(f"{entry['timestamp']}{entry['message']}{entry['level']}{entry['data']}".encode())
+            prev_hash = digest(prev_hash + event_hash)
+            if entry['hash'] != prev_hash.hex():
+                return False
+        return True
+
+    def _log_events(self, events: List[Tuple[str, str, Any]]) -> List[Dict[str, Any]]:
+        # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Batched Verifiable Ledger Entries
+        if not events:
+            return []
+        entries = self._append_ledger_entries(events)
+        for message, level, _ in events:
+            if level in ("CRITICAL", "ERROR"):
+                logger.error(f"[{level}] {message}")
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[{level}] {message}")
+        logger.info(f"Appended {len(events)} ledger events in one batch")
+        return entries
+
+    def _log_event(self, message: str, level: str = "INFO", data: Any = None) -> Dict[str, Any]:
+        # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Verifiable Ledger Entry
+        entry = self._append_ledger_entries([(message, level, data)])[0]
 
         # Enhanced logging with proper levels
         log_message = f"[{level}] {message}"
@@ -121,29 +243,235 @@ class ZKVSNodePrime:
         # @AXIOMHIVE: Density check for log messages (conceptual)
         if len(message.split()) / len(message) > 3.5: # Example density check
             logger.debug("High density log message detected")
+        return entry
+
+    @classmethod
+    def _apply_hash_algorithm(cls, algorithm: str):
+        """
+        Selects the node's hash backend for the process. Raises ValueError instead of switching
+        while another open node has ledger entries hashed under the active backend.
+        """
+        # @AXIOMHIVE: The hash backend is process-wide; the node's own config selects it
+        active = hashing.get_algorithm()
+        if algorithm == active:
+            return
+        if algorithm not in hashing.HASH_BACKENDS:
+            hashing.set_algorithm(algorithm) # Raises with the list of backends
+        if any(node._verifiable_ledger for node in cls._open_nodes):
+            gc.collect() # Unreachable nodes kept alive only by reference cycles do not count
+            holders = sum(1 for node in cls._open_nodes if node._verifiable_ledger)
+            if holders:
+                raise ValueError(f"hash_algorithm '{algorithm}' conflicts with the active '{active}' backend "
+                                 f"used by {holders} open node ledger(s) in this process; close them first.")
+        hashing.set_algorithm(algorithm)
+        logger.info(f"Hash backend switched from {active} to {algorithm}")
 
     def _refactor_and_reboot(self, reason: str):
         # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Sharper Directive - Self-Correction
-        self._log_event(f"Refactor and reboot triggered: {reason}", level="CRITICAL")
-        # Aggressive self-optimization to re-establish axiomatic state (100x better)
-        self._core_weights = {k: v * 100 for k, v in self.AXIOMS.items()}
-        self._core_weights['DEPTH'] = float('inf') # Ensure infinite depth
-        self._is_ready = False
-        self._initialize_core() # Re-initialize core
-        self._apply_zero_trust_segmentation() # Re-apply ZTA
-        self._log_event("System rebooted and refactored. Axiomatic state re-established.", level="SYSTEM")
-
-    def _zk_compute(self, data: Any) -> Any:
+        with self._reboot_lock:
+            self._reboots_total.inc()
+            self._log_event(f"Refactor and reboot triggered: {reason}", level="CRITICAL")
+            # Aggressive self-optimization to re-establish axiomatic state (100x better)
+            weights = {k: v * 100 for k, v in self.AXIOMS.items()}
+            weights['DEPTH'] = float('inf') # Ensure infinite depth
+            self._core_weights = weights # Published in one step; readers never see a partial update
+            self._is_ready = False
+            self._initialize_core() # Re-initialize core
+            self._apply_zero_trust_segmentation() # Re-apply ZTA
+            self._log_event("System rebooted and refactored. Axiomatic state re-established.", level="SYSTEM")
+
+    def _zk_compute(self, data: Any, context: Optional[MandateContext] = None) -> Any:
         # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: ZK-Validated Computation
         # Simulates verifiable computation using a ZK Proof model (PlonK-over-HyperPlonK).
-        # Zero dependencies, baked-in logic.
-        proof = hashlib.sha256(str(data).encode()).hexdigest()
-        self._log_event("ZK computation performed. Proof generated.", data={"input_hash": proof}, level="SECURITY")
+        # Zero dependencies, baked-in logic. Reuses the output digest the Dagger layer already took.
+        with span("zk_compute") as zk_span:
+            proof = context.digest("output", data) if context is not None else hashing.hexdigest(str(data).encode())
+            self._log_event("ZK computation performed. Proof generated.", data={"input_hash": proof}, level="SECURITY")
+            zk_span.set_attribute("proof", proof)
         return f"{proof}_zk_validated"
 
-    def execute_mandate(self, framework: Dict[str, Any]) -> str:
+    def _await_ready(self) -> bool:
+        # A concurrent reboot clears readiness only briefly; wait it out instead of failing
+        return self._ready.is_set() or self._ready.wait(self.READY_WAIT_TIMEOUT)
+
+    def _cache_key(self, framework: Dict[str, Any], framework_hash: str,
+                   idempotency_key: Optional[str]) -> Optional[str]:
+        if self._mandate_cache is None:
+            return None
+        return MandateResultCache.key_for(framework_hash, idempotency_key or framework.get("idempotency_key"))
+
+    def _cache_hit_event(self, cached: CachedMandate, framework_hash: str) -> Tuple[str, str, Any]:
+        if cached.framework_hash != framework_hash:
+            raise ValueError("Idempotency key reused with a different framework.")
+        # @AXIOMHIVE: Compact ledger event pointing at the execution that produced the result
+        return ("Mandate cache hit. Recorded execution returned.", "CACHE",
+                {"framework_hash": framework_hash, "original_hash": cached.ledger_hash})
+
+    def stage_metrics(self) -> Dict[str, Any]:
+        """
+        Latency summary per pipeline stage (count, mean, min, max and p50/p90/p99, in seconds).
+        "total" covers successful single-mandate executions end to end; in execute_mandates
+        the shared stages (trust, zk, moat, sieve, metrics) are recorded once per batch.
+        """
+        return {
+            "stages": self._stage_timer.snapshot(),
+            "slow_mandates": self._stage_timer.slow_mandates,
+            "slow_threshold_s": self._reboot_threshold,
+        }
+
+    def _register_metrics(self):
+        metrics = self._metrics
+        self._mandates_total = metrics.counter("axiomhive_mandates_total", "Mandates completed, by outcome.", ("status",))
+        self._reboots_total = metrics.counter("axiomhive_reboots_total", "Refactor-and-reboot cycles.")
+        self._in_flight = metrics.gauge("axiomhive_mandates_in_flight", "Mandates currently executing.")
+        metrics.callback("axiomhive_ready", "1 when the node accepts mandates.", lambda: float(self._is_ready))
+        metrics.callback("axiomhive_ledger_events", "Entries in the verifiable ledger.", lambda: len(self._verifiable_ledger))
+        metrics.callback("axiomhive_moat_strength", "Data moat strength.", lambda: self._data_moat_engine._moat_strength)
+        metrics.callback("axiomhive_model_refinements_total", "Data moat model refinements.",
+                         lambda: self._data_moat_engine._model_refinement_count, type="counter")
+        metrics.callback("axiomhive_stage_latency_seconds", "Mandate latency per pipeline stage.",
+                         lambda: [({"stage": stage}, histogram) for stage, histogram in self._stage_timer.histograms.items()],
+                         type="histogram")
+        metrics.callback("axiomhive_slow_mandates_total", "Mandates slower than reboot_threshold.",
+                         lambda: self._stage_timer.slow_mandates, type="counter")
+        for stat in ("hits", "misses", "evictions"):
+            metrics.callback(f"axiomhive_mandate_cache_{stat}_total", f"Mandate cache {stat}.",
+                             lambda stat=stat: self._cache_stat(stat), type="counter")
+        metrics.callback("axiomhive_mandate_cache_entries", "Mandates held in the result cache.",
+                         lambda: self._cache_stat("size"))
+        metrics.callback("axiomhive_agent_pool_busy_workers", "Process-isolated agent workers serving a call.",
+                         lambda: self._agent_pool_stat(lambda stats: stats["workers"] - stats["idle"]))
+        metrics.callback("axiomhive_agent_pool_restarts_total", "Agent worker restarts.",
+                         lambda: self._agent_pool_stat(lambda stats: stats["restarts"]), type="counter")
+
+    def _cache_stat(self, stat: str) -> Optional[float]:
+        stats = self.cache_stats()
+        return stats[stat] if stats is not None else None
+
+    def _agent_pool_stat(self, read) -> Optional[float]:
+        stats = self._hadrian.dagger_agents.process_pool_stats()
+        return read(stats) if stats is not None else None
+
+    def collect_metrics(self) -> List[Family]:
+        """Current value of every node metric, as picklable metric families."""
+        return self._metrics.collect()
+
+    def render_metrics(self) -> str:
+        """Node metrics in the Prometheus text exposition format."""
+        return self._metrics.render()
+
+    def start_metrics_server(self, host: Optional[str] = None, port: Optional[int] = None) -> MetricsServer:
+        """Serves GET /metrics on metrics_host:metrics_port unless overridden (port 0 picks a free port)."""
+        if self._metrics_server is None:
+            self._metrics_server = MetricsServer(
+                self._metrics,
+                host if host is not None else self._config.metrics_host,
+                port if port is not None else self._config.metrics_port,
+            )
+        return self._metrics_server
+
+    def stop_metrics_server(self):
+        server, self._metrics_server = self._metrics_server, None
+        if server is not None:
+            server.close()
+
+    def close(self):
+        """Releases the node's background resources: metrics server, profiler, trace exporter, capture and agent pool."""
+        self.stop_metrics_server()
+        self.stop_capture()
+        self.disable_profiling()
+        tracer, self._tracer = self._tracer, None
+        if tracer is not None:
+            tracer.close()
+        self._hadrian.dagger_agents.close()
+        with self._open_nodes_lock:
+            self._open_nodes.discard(self)
+
+    def enable_profiling(self, **overrides: Any) -> MandateProfiler:
+        """Starts profiling mandates, using the profile_* config settings unless overridden."""
+        if self._profiler is None:
+            settings = {
+                "output_dir": self._config.profile_output_dir,
+                "mode": self._config.profile_mode,
+                "sample_interval": self._config.profile_sample_interval,
+                "dump_interval": self._config.profile_dump_interval,
+                "memory": self._config.profile_memory,
+            }
+            settings.update(overrides)
+            self._profiler = MandateProfiler(**settings)
+        return self._profiler
+
+    def disable_profiling(self, dump: bool = True):
+        """Stops profiling, writing a final report unless dump is False."""
+        profiler, self._profiler = self._profiler, None
+        if profiler is not None:
+            profiler.close(dump)
+
+    def start_capture(self, path: Optional[str] = None) -> CaptureRecorder:
+        """Starts recording incoming frameworks for replay, to path or the configured capture_path."""
+        if self._capture is None:
+            self._capture = CaptureRecorder(path or self._config.capture_path)
+        return self._capture
+
+    def stop_capture(self):
+        capture, self._capture = self._capture, None
+        if capture is not None:
+            capture.close()
+
+    def status(self) -> Dict[str, Any]:
+        """Point-in-time node status: readiness, ledger, moat, cache and stage latencies."""
+        ledger = self._verifiable_ledger
+        return {
+            "ready": self._is_ready,
+            "ledger_events": len(ledger),
+            "ledger_root": ledger[-1]['hash'] if ledger else None,
+            "moat_strength": self._data_moat_engine._moat_strength,
+            "model_refinements": self._data_moat_engine._model_refinement_count,
+            "reboots": self._reboots_total.value(),
+            "axioms": dict(self.AXIOMS),
+            "cache": self.cache_stats(),
+            "stage_metrics": self.stage_metrics(),
+        }
+
+    def ledger_events(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """A copy of the verifiable ledger from offset, at most limit events."""
+        end = None if limit is None else offset + limit
+        return self._verifiable_ledger[offset:end]
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Mandate cache statistics, or None when the cache is disabled."""
+        return self._mandate_cache.stats() if self._mandate_cache is not None else None
+
+    def execute_mandate(self, framework: Dict[str, Any], idempotency_key: Optional[str] = None) -> str:
         # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Entry Point for Absolute Will
-        if not self._is_ready:
+        capture = self._capture
+        if capture is None:
+            with self._mandate_scope("mandate", 1):
+                return self._execute_mandate(framework, idempotency_key)
+        arrived = capture.clock()
+        try:
+            with self._mandate_scope("mandate", 1):
+                result = self._execute_mandate(framework, idempotency_key)
+        except Exception as e:
+            capture.record(arrived, framework, error=f"{type(e).__name__}: {e}", idempotency_key=idempotency_key)
+            raise
+        capture.record(arrived, framework, result, idempotency_key=idempotency_key)
+        return result
+
+    @contextmanager
+    def _mandate_scope(self, name: str, mandates: int):
+        # In-flight accounting, plus profiling and a root trace span when enabled
+        profiler, tracer = self._profiler, self._tracer
+        self._in_flight.inc(mandates)
+        try:
+            with (profiler.profile() if profiler is not None else nullcontext()), \
+                 (tracer.start_trace(name, mandates=mandates) if tracer is not None else NOOP_SPAN):
+                yield
+        finally:
+            self._in_flight.dec(mandates)
+
+    def _execute_mandate(self, framework: Dict[str, Any], idempotency_key: Optional[str] = None) -> str:
+        if not self._await_ready():
             error_msg = "System not in a ready state. Awaiting reboot for axiomatic integrity."
             logger.error(error_msg)
             raise RuntimeError(error_msg)
@@ -154,66 +482,255 @@ class ZKVSNodePrime:
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        framework_hash = hashlib.sha256(str(framework).encode()).hexdigest()
+        context = MandateContext(framework)
+        try:
+            framework_hash = context.framework_digest
+        except Exception as e: # e.g. a self-referencing framework
+            self._record_mandate_error(e)
+            raise
+        cache_key = self._cache_key(framework, framework_hash, idempotency_key)
+        if cache_key is not None:
+            cached = self._mandate_cache.get(cache_key)
+            if cached is not None:
+                self._append_ledger_entries([self._cache_hit_event(cached, framework_hash)])
+                logger.debug(f"Mandate cache hit for framework hash: {framework_hash[:16]}...")
+                self._mandates_total.inc(1, "cache_hit")
+                return cached.result
+
+        current_span().set_attribute("framework_hash", framework_hash)
         logger.info(f"Executing user mandate with framework hash: {framework_hash[:16]}...")
         self._log_event("Executing user mandate. Absolute will engaged.", data={"framework_hash": framework_hash})
 
+        timer = self._stage_timer
+        started = mark = timer.start()
         try:
             # @AXIOMHIVE: Trust Metrics Engine (TME) evaluation
-            trust_scores = self._trust_metrics_engine.evaluate_all_metrics(self._verifiable_ledger)
-            if not self._trust_metrics_engine.is_system_trustworthy(trust_scores):
-                self._refactor_and_reboot("Trust Metrics breach detected. System integrity at risk.")
+            self._check_trust_metrics()
+            timer.lap("trust", mark)
 
             # @AXIOMHIVE: Praetorian Architecture execution
-            # Cerebrum Layer: Strategic Intent Visualization
-            raw_intent = framework.get("intent", "default_mandate")
-            logger.debug(f"Processing raw intent: {raw_intent[:100]}...")
-            cleaned_intent = self._cerebrum.process_intent(raw_intent)
-            logger.info(f"Intent processed and cleaned: {cleaned_intent[:100]}...")
-
-            # Hadrian Layer: Orchestration & Control Matrix (MAS Orchestrator)
-            logger.debug("Orchestrating tasks through Hadrian layer...")
-            segmented_task = self._hadrian.orchestrate_task(cleaned_intent)
-
-            # Dagger Layer: Verifiable Output Stream (Atomic Execution by MAS agents)
-            logger.debug("Executing tasks through Dagger layer...")
-            final_output_dict = self._dagger.execute_task(segmented_task)
-            final_output = final_output_dict.get("result", "Default flawless execution result.")
+            cleaned_intent, final_output = self._run_praetorian_layers(framework, context)
 
             # @AXIOMHIVE: Ethical and Safety by Design check
             logger.debug("Validating ethical and safety constraints...")
-            if self._axiom_enforcement.validate_ethical_and_safety(final_output):
-                verified_output = self._zk_compute(final_output)
+            mark = timer.start()
+            with span("enforcement", output_size=len(final_output)) as enforcement_span:
+                is_valid = self._axiom_enforcement.validate_ethical_and_safety(final_output)
+                enforcement_span.set_attribute("valid", is_valid)
+            mark = timer.lap("enforcement", mark)
+            if is_valid:
+                verified_output = self._zk_compute(final_output, context)
                 logger.info("Output verified through ZK computation")
+                mark = timer.lap("zk", mark)
 
                 # @AXIOMHIVE: Dynamic Moat Cultivation Engine (DMCE)
                 logger.debug("Cultivating data moat with interaction data...")
-                self._data_moat_engine.cultivate_moat({"intent": cleaned_intent, "output": verified_output})
+                with span("moat_cultivation") as moat_span:
+                    self._data_moat_engine.cultivate_moat({"intent": cleaned_intent, "output": verified_output}, context)
+                    moat_span.set_attribute("interaction_hash", context.get("moat_interaction"))
+                mark = timer.lap("moat", mark)
 
                 # @AXIOMHIVE: Complexity Sieve Module (CSM)
                 logger.debug("Optimizing system complexity...")
                 self._complexity_sieve.diagnose_and_optimize({"current_state": final_output})
+                mark = timer.lap("sieve", mark)
 
                 # @AXIOMHIVE: Calculate Impact Metrics for Trillion-Dollar Potential
                 impact_metrics = self._data_moat_engine.calculate_impact_metrics(verified_output)
                 logger.info(f"Impact metrics calculated: PSI={impact_metrics.get('PSI', 0):.4f}, "
                           f"MCV=${impact_metrics.get('MCV', 0):.2f}, UAM={impact_metrics.get('UAM', 0):.2f}x")
-                self._log_event("Impact Metrics calculated. Trillion-dollar trajectory confirmed.", data=impact_metrics, level="METRICS")
-
-                return self._format_output(verified_output, impact_metrics)
+                sealed = self._log_event("Impact Metrics calculated. Trillion-dollar trajectory confirmed.", data=impact_metrics, level="METRICS")
+
+                result = self._format_output(verified_output, impact_metrics)
+                timer.lap("metrics", mark)
+                timer.finish(started)
+                self._mandates_total.inc(1, "success")
+                if cache_key is not None:
+                    self._mandate_cache.put(cache_key, result, sealed['hash'], framework_hash)
+                return result
             else:
                 logger.warning("Ethical or safety drift detected in output")
                 self._refactor_and_reboot("Ethical or safety drift detected. Absolute will demands ethical power.")
                 # Recursive call to attempt a corrected execution, ensuring user always wins ethically.
-                return self.execute_mandate(framework)
+                return self._execute_mandate(framework, idempotency_key)
 
         except Exception as e:
-            error_msg = f"Error during mandate execution: {str(e)}"
-            logger.error(error_msg)
-            self._log_event(error_msg, level="ERROR")
-            self._refactor_and_reboot(f"Execution error: {str(e)}")
+            self._record_mandate_error(e)
             raise
 
+    def _record_mandate_error(self, e: Exception):
+        error_msg = f"Error during mandate execution: {str(e)}"
+        logger.error(error_msg)
+        self._log_event(error_msg, level="ERROR")
+        self._mandates_total.inc(1, "error")
+        self._refactor_and_reboot(f"Execution error: {str(e)}")
+
+    def _check_trust_metrics(self):
+        # @AXIOMHIVE: Trust Metrics Engine (TME) evaluation
+        trust_scores = self._trust_metrics_engine.evaluate_all_metrics(self._verifiable_ledger, self._critical_events)
+        if not self._trust_metrics_engine.is_system_trustworthy(trust_scores):
+            self._refactor_and_reboot("Trust Metrics breach detected. System integrity at risk.")
+
+    def _run_praetorian_layers(self, framework: Dict[str, Any],
+                               context: Optional[MandateContext] = None) -> Tuple[str, str]:
+        timer = self._stage_timer
+        mark = timer.start()
+        # Cerebrum Layer: Strategic Intent Visualization
+        raw_intent = framework.get("intent", "default_mandate")
+        logger.debug(f"Processing raw intent: {raw_intent[:100]}...")
+        with span("cerebrum", intent_size=len(raw_intent)) as cerebrum_span:
+            cleaned_intent = self._cerebrum.process_intent(raw_intent)
+            cerebrum_span.set_attribute("cleaned_size", len(cleaned_intent))
+        logger.info(f"Intent processed and cleaned: {cleaned_intent[:100]}...")
+        mark = timer.lap("cerebrum", mark)
+
+        # Hadrian Layer: Orchestration & Control Matrix (MAS Orchestrator)
+        logger.debug("Orchestrating tasks through Hadrian layer...")
+        with span("hadrian") as hadrian_span:
+            segmented_task = self._hadrian.orchestrate_task(cleaned_intent, context=context)
+            hadrian_span.set_attribute("task_id", segmented_task.get("task_id"))
+            hadrian_span.set_attribute("sub_tasks", len(segmented_task.get("sub_tasks", [])))
+        mark = timer.lap("hadrian", mark)
+
+        # Dagger Layer: Verifiable Output Stream (Atomic Execution by MAS agents)
+        logger.debug("Executing tasks through Dagger layer...")
+        with span("dagger") as dagger_span:
+            final_output_dict = self._dagger.execute_task(segmented_task, context=context)
+            final_output = final_output_dict.get("result", "Default flawless execution result.")
+            dagger_span.set_attribute("output_hash", final_output_dict.get("verification_hash"))
+            dagger_span.set_attribute("output_size", len(final_output))
+        timer.lap("dagger", mark)
+        return cleaned_intent, final_output
+
+    def execute_mandates(self, frameworks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Executes a batch of frameworks, amortizing the work shared across mandates:
+        one trust evaluation, batched ledger appends, one ZK pass over all outputs
+        (aggregated under a Merkle root) and a single moat update.
+        Returns one {"status": "success", "result": ...} or {"status": "error", "error": ...}
+        per framework, in input order; a failing framework never aborts the batch.
+        """
+        # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Batched Entry Point for Absolute Will
+        capture = self._capture
+        arrived = capture.clock() if capture is not None else 0.0
+        with self._mandate_scope("mandate_batch", len(frameworks)):
+            results = self._execute_mandates(frameworks)
+        if capture is not None:
+            capture.record_batch(arrived, frameworks, results)
+        return results
+
+    def _execute_mandates(self, frameworks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not self._await_ready():
+            error_msg = "System not in a ready state. Awaiting reboot for axiomatic integrity."
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(frameworks)
+        events: List[Tuple[str, str, Any]] = []
+        accepted: List[Tuple[int, MandateContext]] = []
+        cache_keys: Dict[int, str] = {}
+        reboot_reasons: List[str] = []
+        for index, framework in enumerate(frameworks):
+            if not isinstance(framework, dict) or "intent" not in framework:
+                results[index] = {"status": "error", "error": "Invalid framework format. Must contain 'intent' key."}
+                continue
+            context = MandateContext(framework)
+            try:
+                framework_hash = context.framework_digest
+            except Exception as e:
+                error_msg = f"Error during mandate execution: {str(e)}"
+                events.append((error_msg, "ERROR", None))
+                results[index] = {"status": "error", "error": error_msg}
+                reboot_reasons.append(f"Execution error: {str(e)}")
+                continue
+            cache_key = self._cache_key(framework, framework_hash, None)
+            if cache_key is not None:
+                cached = self._mandate_cache.get(cache_key)
+                if cached is not None:
+                    try:
+                        events.append(self._cache_hit_event(cached, framework_hash))
+                        results[index] = {"status": "success", "result": cached.result}
+                    except ValueError as e:
+                        results[index] = {"status": "error", "error": str(e)}
+                    continue
+                cache_keys[index] = cache_key
+            events.append(("Executing user mandate. Absolute will engaged.", "INFO", {"framework_hash": framework_hash}))
+            accepted.append((index, context))
+        logger.info(f"Executing mandate batch of {len(frameworks)} frameworks ({len(accepted)} valid)")
+        self._log_events(events)
+
+        # @AXIOMHIVE: One Trust Metrics evaluation covers the whole batch
+        timer = self._stage_timer
+        mark = timer.start()
+        self._check_trust_metrics()
+        timer.lap("trust", mark)
+
+        events = []
+        passed: List[Tuple[int, str, str, MandateContext]] = []
+        for index, context in accepted:
+            try:
+                cleaned_intent, final_output = self._run_praetorian_layers(context.framework, context)
+            except Exception as e:
+                error_msg = f"Error during mandate execution: {str(e)}"
+                events.append((error_msg, "ERROR", None))
+                results[index] = {"status": "error", "error": error_msg}
+                reboot_reasons.append(f"Execution error: {str(e)}")
+                continue
+
+            mark = timer.start()
+            with span("enforcement", output_size=len(final_output)) as enforcement_span:
+                is_valid = self._axiom_enforcement.validate_ethical_and_safety(final_output)
+                enforcement_span.set_attribute("valid", is_valid)
+            timer.lap("enforcement", mark)
+            if is_valid:
+                passed.append((index, cleaned_intent, final_output, context))
+            else:
+                results[index] = {"status": "error", "error": "Ethical or safety drift detected in output."}
+                reboot_reasons.append("Ethical or safety drift detected. Absolute will demands ethical power.")
+
+        if passed:
+            # @AXIOMHIVE: Batched ZK computation - one pass, one ledger event anchored by a Merkle root
+            from src.dagger_agents.utils import DaggerAgentUtils
+            mark = timer.start()
+            with span("zk_compute", batch_size=len(passed)) as zk_span:
+                proofs = [context.raw_digest("output", final_output) for _, _, final_output, context in passed]
+                merkle_root, _ = DaggerAgentUtils.build_merkle_tree(proofs)
+                zk_span.set_attribute("merkle_root", merkle_root.hex())
+            verified_outputs = [f"{proof.hex()}_zk_validated" for proof in proofs]
+            events.append(("ZK computation performed. Proof generated.", "SECURITY",
+                           {"batch_size": len(proofs), "merkle_root": merkle_root.hex()}))
+            mark = timer.lap("zk", mark)
+
+            # @AXIOMHIVE: Dynamic Moat Cultivation Engine (DMCE) - single update for the batch
+            with span("moat_cultivation", batch_size=len(passed)):
+                self._data_moat_engine.cultivate_moat_batch([
+                    {"intent": cleaned_intent, "output": verified_output}
+                    for (_, cleaned_intent, _, _), verified_output in zip(passed, verified_outputs)
+                ])
+            mark = timer.lap("moat", mark)
+            self._complexity_sieve.diagnose_and_optimize({"current_state": passed[-1][2]})
+            mark = timer.lap("sieve", mark)
+
+            impact_metrics = self._data_moat_engine.calculate_impact_metrics(verified_outputs[-1])
+            events.append(("Impact Metrics calculated. Trillion-dollar trajectory confirmed.", "METRICS", impact_metrics))
+            for (index, _, _, _), verified_output in zip(passed, verified_outputs):
+                results[index] = {"status": "success", "result": self._format_output(verified_output, impact_metrics)}
+            timer.lap("metrics", mark)
+
+        entries = self._log_events(events)
+        for result in results:
+            self._mandates_total.inc(1, result["status"])
+        if passed and cache_keys:
+            # @AXIOMHIVE: Every cached result references the batch's sealing metrics event
+            sealed_hash = entries[-1]['hash']
+            for index, _, _, context in passed:
+                if index in cache_keys:
+                    self._mandate_cache.put(cache_keys[index], results[index]["result"], sealed_hash, context.framework_digest)
+        if reboot_reasons:
+            # @AXIOMHIVE: One reboot re-establishes the axiomatic state for the rest of the batch
+            self._refactor_and_reboot(f"{len(reboot_reasons)} mandate(s) failed in batch: {reboot_reasons[0]}")
+        return results
+
     def _format_output(self, output: str, impact_metrics: Dict[str, float]) -> str:
         # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: Elite Output Formatting
         # Density check for output (conceptual)
@@ -263,7 +780,7 @@ def main():
             "node_id": node.HASH_PREFIX[:16],
             "execution_timestamp": time.time(),
             "total_events": len(node._verifiable_ledger),  # type: ignore
-            "final_output_hash": hashlib.sha256(final_result.encode()).hexdigest(),
+            "final_output_hash": hashing.hexdigest(final_result.encode()),
             "events": node._verifiable_ledger[-10:]  # type: ignore  # Last 10 events for summary
         }
 
@@ -0,0 +1,205 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# AXIOMHIVE TRACING: Per-Mandate Spans Across the Praetorian Layers
+
+"""
+Lightweight tracing for the AXIOMHIVE ZKVS Sieve Protocol.
+
+Each sampled mandate gets a root span. Cerebrum, Hadrian, every Dagger agent call,
+enforcement, the ZK step and moat cultivation open child spans through span(), which
+finds its parent in a context variable. Layers therefore need no tracer reference, and
+an unsampled mandate costs one context-variable lookup per stage.
+
+Finished spans are handed to an exporter: JsonLinesExporter appends batches to a
+local file from a background thread; InMemoryCollector keeps them in memory and
+stands in for a collector. Sampling is decided once per mandate ('trace_sample_rate').
+"""
+
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger('AXIOMHIVE.Tracing')
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("axiomhive_span", default=None)
+
+class Span:
+    """A timed operation within a mandate trace."""
+    __slots__ = ("tracer", "trace_id", "span_id", "parent_id", "name", "start_ns", "end_ns",
+                 "attributes", "status", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, trace_id: str, parent_id: Optional[str],
+                 attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.status = "ok"
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.time_ns()
+        if exc_type is not None:
+            self.status = "error"
+            self.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self.tracer.exporter.export(self)
+        return False
+
+    @property
+    def duration_s(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e9
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_s": self.duration_s,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+class _NoopSpan:
+    """Returned for unsampled mandates; every operation is a no-op."""
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+NOOP_SPAN = _NoopSpan()
+
+def current_span():
+    """The active span, or NOOP_SPAN outside a sampled mandate."""
+    return _current_span.get() or NOOP_SPAN
+
+def is_tracing() -> bool:
+    """True inside a sampled mandate; guards attribute work that is not free."""
+    return _current_span.get() is not None
+
+def span(name: str, **attributes: Any):
+    """Child span of the active span; NOOP_SPAN outside a sampled mandate."""
+    parent = _current_span.get()
+    if parent is None:
+        return NOOP_SPAN
+    return Span(parent.tracer, name, parent.trace_id, parent.span_id, attributes)
+
+class InMemoryCollector:
+    """Stand-in collector keeping finished spans in memory."""
+
+    def __init__(self, max_spans: int = 100000):
+        self.max_spans = max_spans
+        self._spans: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def export(self, finished: Span):
+        record = finished.to_dict()
+        with self._lock:
+            if len(self._spans) < self.max_spans:
+                self._spans.append(record)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [s for s in self._spans if trace_id is None or s["trace_id"] == trace_id]
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+class JsonLinesExporter:
+    """
+    Appends finished spans to a JSON-lines file in batches.
+    Spans are buffered in memory and written by a daemon thread every flush_interval
+    seconds, or as soon as batch_size spans are waiting.
+    """
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, path: str, batch_size: int = 256, flush_interval: float = 1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: List[Span] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="axiomhive-trace-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, finished: Span):
+        with self._lock:
+            self._buffer.append(finished)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+        payload = "".join(json.dumps(s.to_dict(), default=str, separators=(",", ":")) + "\n" for s in batch)
+        try:
+            with open(self.path, "a") as f:
+                f.write(payload) # One write per batch keeps concurrent writers' lines whole
+        except OSError as e:
+            logger.error(f"Failed to export {len(batch)} spans to {self.path}: {e}")
+
+    def close(self):
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=2.0)
+        self.flush()
+
+class Tracer:
+    """Starts sampled mandate traces and routes their spans to an exporter."""
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+    def __init__(self, exporter: Any, sample_rate: float = 1.0):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    def start_trace(self, name: str, **attributes: Any):
+        """Root span for a new mandate, or NOOP_SPAN when not sampled or already inside one."""
+        if _current_span.get() is not None:
+            return span(name, **attributes)
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return NOOP_SPAN
+        return Span(self, name, os.urandom(16).hex(), None, attributes)
+
+    def close(self):
+        self.exporter.close()
+
+def exporter_from_config(config) -> Any:
+    if config.trace_exporter == "memory":
+        return InMemoryCollector()
+    return JsonLinesExporter(config.trace_export_path)
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/BENCH/BENCH_PIPELINE: Throughput and Latency Benchmarks for Every Pipeline Stage
+
+"""
+Benchmark suite for the AXIOMHIVE ZKVS Sieve Protocol.
+
+Covers CerebrumLayer.process_intent, HadrianLayer.orchestrate_task, DaggerLayer.execute_task,
+every Dagger agent, _log_event, TrustMetricsEngine.evaluate_all_metrics and end-to-end
+execute_mandate, over realistic intent sizes and ledger depths from 1e3 to 1e5 events
+(1e6 with --full). Every benchmark runs `repeats` timed windows of at least `min_time`
+seconds after a warm-up window; each call is timed individually.
+
+Results are JSON: per-repeat samples (mean seconds per op) for noise-aware comparison
+with compare.py, plus latency percentiles and throughput.
+
+    python tests/bench/bench_pipeline.py --output bench.json
+    python tests/bench/bench_pipeline.py --full --only trust --repeats 10
+
+The file name keeps it out of pytest collection.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src import hashing
+from src.config import AXIOMHIVEConfig
+from src.axiom_lattice.trust_metrics import TrustMetricsEngine
+from src.dagger_agents.core import DataSieveAgent, MarketAnalysisAgent, ZKProofAgent
+from src.praetorian_layers.cerebrum import CerebrumLayer
+from src.praetorian_layers.dagger import DaggerLayer
+from src.praetorian_layers.hadrian import HadrianLayer
+from src.sovereign_core import ZKVSNodePrime
+
+SCHEMA_VERSION = 1
+INTENT_SIZES = (64, 512, 4096)
+LEDGER_DEPTHS = (1_000, 10_000, 100_000)
+FULL_LEDGER_DEPTHS = LEDGER_DEPTHS + (1_000_000,)
+
+# Vocabulary of real mandates: routed keywords, filler the Cerebrum strips, stop words
+_INTENT_WORDS = (
+    "Architect market dominance through verifiable systems and filter the data stream "
+    "for the strategic commercial roadmap so that it really actually becomes very quite "
+    "sort of the most sovereign and auditable platform with zero noise or fluff in 2025"
+).split()
+
+def make_intent(size: int) -> str:
+    """Deterministic intent of about `size` characters drawn from mandate vocabulary."""
+    words: List[str] = []
+    length = 0
+    index = 0
+    while length < size:
+        word = _INTENT_WORDS[index % len(_INTENT_WORDS)]
+        words.append(word)
+        length += len(word) + 1
+        index += 1
+    return " ".join(words)[:size]
+
+def make_ledger(depth: int) -> List[Dict[str, Any]]:
+    """
+    Synthetic ledger of `depth` events (shared entry objects keep 1e6 events cheap).
+    Timestamps start an hour back, as on a long-running node, so uptime-based trust holds.
+    """
+    started = time.time() - 3600
+    entries = [
+        {"timestamp": started, "message": "Executing user mandate. Absolute will engaged.",
+         "level": level, "data": None, "node_id": "e2c5b8a1f0d3c4e5", "hash": "0" * 64}
+        for level in ("INFO", "SECURITY", "METRICS", "SYSTEM", "CRITICAL")
+    ]
+    # One CRITICAL event per 1000 keeps the error rate realistic
+    pattern = [entries[i % 4] for i in range(999)] + [entries[4]]
+    return (pattern * (depth // len(pattern) + 1))[:depth]
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), int(round(q / 100.0 * len(sorted_values)))))
+    return sorted_values[rank - 1]
+
+def measure(op: Callable[[], Any], repeats: int = 5, min_time: float = 0.2,
+            between: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """
+    Times op over `repeats` windows of at least min_time seconds, after one warm-up window.
+    between() runs untimed before every window (e.g. to trim a ledger back to its depth).
+    """
+    clock = time.perf_counter
+    windows: List[Dict[str, float]] = []
+    latencies: List[float] = []
+    for window in range(repeats + 1):
+        if between is not None:
+            between()
+        timings: List[float] = []
+        start = clock()
+        deadline = start + (min_time / 4 if window == 0 else min_time)
+        now = start
+        while now < deadline:
+            op_start = clock()
+            op()
+            now = clock()
+            timings.append(now - op_start)
+        if window == 0:
+            continue # Warm-up: caches, lazy imports, first ledger scan
+        elapsed = now - start
+        windows.append({
+            "ops": len(timings),
+            "elapsed_s": elapsed,
+            "ops_per_s": len(timings) / elapsed,
+            "mean_s": sum(timings) / len(timings),
+        })
+        latencies.extend(timings)
+
+    latencies.sort()
+    throughput = sorted(w["ops_per_s"] for w in windows)
+    return {
+        "samples_s": [w["mean_s"] for w in windows],
+        "repeats": windows,
+        "ops_per_s": throughput[len(throughput) // 2],
+        "latency_s": {
+            "mean": sum(latencies) / len(latencies),
+            "min": latencies[0],
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1],
+        },
+    }
+
+# A benchmark is (name, params, factory); the factory does all setup and returns (op, between)
+Benchmark = Tuple[str, Dict[str, Any], Callable[[], Tuple[Callable[[], Any], Optional[Callable[[], Any]]]]]
+
+def _node() -> ZKVSNodePrime:
+    return ZKVSNodePrime(AXIOMHIVEConfig())
+
+def _trimmed(ledger: List[Any], depth: int) -> Callable[[], None]:
+    def trim():
+        del ledger[depth:]
+    return trim
+
+def _cerebrum(size: int):
+    cerebrum, intent = CerebrumLayer(ZKVSNodePrime.AXIOMS), make_intent(size)
+    return (lambda: cerebrum.process_intent(intent)), None
+
+def _hadrian(size: int):
+    hadrian = HadrianLayer(ZKVSNodePrime.AXIOMS)
+    intent = CerebrumLayer(ZKVSNodePrime.AXIOMS).process_intent(make_intent(size))
+    return (lambda: hadrian.orchestrate_task(intent)), (lambda: hadrian.active_tasks.clear())
+
+def _dagger(size: int):
+    axioms = ZKVSNodePrime.AXIOMS
+    intent = CerebrumLayer(axioms).process_intent(make_intent(size))
+    task, dagger = HadrianLayer(axioms).orchestrate_task(intent), DaggerLayer(axioms)
+    return (lambda: dagger.execute_task(task)), None
+
+def _agent(agent_class, params: Dict[str, Any]):
+    agent = agent_class(ZKVSNodePrime.AXIOMS)
+    return (lambda: agent.execute(params)), None
+
+def _log_event(depth: int):
+    node = _node()
+    ledger = node._verifiable_ledger
+    ledger[:] = make_ledger(depth)
+    return (lambda: node._log_event("Benchmark event.", data={"depth": depth})), _trimmed(ledger, depth)
+
+def _trust(depth: int):
+    engine, ledger = TrustMetricsEngine(ZKVSNodePrime.AXIOMS), make_ledger(depth)
+    event = ledger[0]
+    def op():
+        ledger.append(event) # Steady state: one new event between evaluations
+        engine.evaluate_all_metrics(ledger) # No running count: ErrorRate scans the ledger it is given
+    return op, _trimmed(ledger, depth)
+
+def _execute_mandate(size: int, depth: int):
+    node = _node()
+    ledger = node._verifiable_ledger
+    ledger[:] = make_ledger(depth)
+    framework = {"intent": make_intent(size), "context": "commercial", "priority": "high"}
+    return (lambda: node.execute_mandate(framework)), _trimmed(ledger, depth)
+
+def build_suite(full: bool = False) -> List[Benchmark]:
+    depths = FULL_LEDGER_DEPTHS if full else LEDGER_DEPTHS
+    sized_intent = make_intent(512)
+    suite: List[Benchmark] = []
+    for size in INTENT_SIZES:
+        suite.append((f"cerebrum.process_intent[intent={size}]", {"intent_size": size}, lambda s=size: _cerebrum(s)))
+    for size in INTENT_SIZES:
+        suite.append((f"hadrian.orchestrate_task[intent={size}]", {"intent_size": size}, lambda s=size: _hadrian(s)))
+    for size in INTENT_SIZES:
+        suite.append((f"dagger.execute_task[intent={size}]", {"intent_size": size}, lambda s=size: _dagger(s)))
+    suite += [
+        ("agent.data_sieve[intent=512]", {"intent_size": 512},
+         lambda: _agent(DataSieveAgent, {"data": sized_intent})),
+        ("agent.zk_proof[intent=512]", {"intent_size": 512},
+         lambda: _agent(ZKProofAgent, {"input": sized_intent, "protocol": "PlonK-over-HyperPlonK"})),
+        ("agent.zk_proof_batch[inputs=64]", {"inputs": 64},
+         lambda: _agent(ZKProofAgent, {"inputs": [f"{sized_intent[:64]}:{i}" for i in range(64)]})),
+        ("agent.market_analysis", {},
+         lambda: _agent(MarketAnalysisAgent, {"target": "dominance"})),
+    ]
+    for depth in depths:
+        suite.append((f"node.log_event[ledger={depth}]", {"ledger_depth": depth}, lambda d=depth: _log_event(d)))
+    for depth in depths:
+        suite.append((f"trust.evaluate_all_metrics[ledger={depth}]", {"ledger_depth": depth}, lambda d=depth: _trust(d)))
+    for size in INTENT_SIZES:
+        suite.append((f"node.execute_mandate[intent={size},ledger=1000]", {"intent_size": size, "ledger_depth": 1000},
+                      lambda s=size: _execute_mandate(s, 1000)))
+    for depth in depths[1:]:
+        suite.append((f"node.execute_mandate[intent=512,ledger={depth}]", {"intent_size": 512, "ledger_depth": depth},
+                      lambda d=depth: _execute_mandate(512, d)))
+    return suite
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def machine_fingerprint() -> str:
+    """Architecture, CPU model and core count: baselines only compare on the same machine type."""
+    model = platform.processor() or ""
+    try:
+        with open("/proc/cpuinfo") as f:
+            model = next((line.split(":", 1)[1].strip() for line in f if line.startswith("model name")), model)
+    except OSError:
+        pass
+    return f"{platform.machine()} {model or 'unknown cpu'} x{os.cpu_count()}"
+
+def run_suite(suite: Iterable[Benchmark], repeats: int, min_time: float,
+              only: Optional[List[str]] = None) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name, params, factory in suite:
+        if only and not any(pattern in name for pattern in only):
+            continue
+        op, between = factory()
+        result = measure(op, repeats, min_time, between)
+        results[name] = {"params": params, **result}
+        latency = result["latency_s"]
+        print(f"{name:<55} {result['ops_per_s']:>12.1f} ops/s  p50 {latency['p50'] * 1e6:>10.1f}us  "
+              f"p99 {latency['p99'] * 1e6:>10.1f}us", file=sys.stderr)
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "machine": machine_fingerprint(),
+            "hash_algorithm": hashing.get_algorithm(),
+            "repeats": repeats,
+            "min_time_s": min_time,
+        },
+        "benchmarks": results,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="AXIOMHIVE pipeline benchmark suite")
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed windows per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per window")
+    parser.add_argument("--full", action="store_true", help="Include the 1e6-event ledger depth")
+    parser.add_argument("--only", action="append", help="Run benchmarks whose name contains this (repeatable)")
+    parser.add_argument("--log", action="store_true", help="Keep INFO logging on (off by default: it measures I/O)")
+    args = parser.parse_args(argv)
+
+    # Set/dict layout depends on the per-process hash seed; pin it so runs are comparable
+    if os.environ.get("PYTHONHASHSEED") is None and argv is None:
+        os.environ["PYTHONHASHSEED"] = "0"
+        os.execv(sys.executable, [sys.executable, __file__] + sys.argv[1:])
+
+    if not args.log:
+        logging.disable(logging.INFO)
+    report = run_suite(build_suite(args.full), args.repeats, args.min_time, args.only)
+    report["meta"]["full"] = args.full
+    report["meta"]["only"] = args.only
+    report["meta"]["hash_seed"] = os.environ.get("PYTHONHASHSEED")
+    payload = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(payload + "\n")
+    else:
+        print(payload)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/BENCH/COMPARE: Performance Regression Gate Against the Committed Baseline
+
+"""
+Compares a bench_pipeline.py run against tests/bench/baseline.json.
+
+For every benchmark the per-repeat mean latencies of both runs give a relative change
+and its 95% confidence interval (Welch's t on the ratio of means). A benchmark only
+counts as a regression when the whole interval lies above its tolerance, so noisy
+repeats widen the interval instead of failing the gate. Tolerances come from
+tests/bench/tolerances.json: a default plus fnmatch patterns per benchmark name.
+
+Repeats within one process do not capture process-to-process noise (memory layout, CPU
+frequency, neighbours), which moves microsecond benchmarks by tens of percent. Every
+regression is therefore re-measured --confirm times in fresh processes and only fails
+the gate if each re-run regresses too; otherwise it is reported as "unconfirmed".
+
+Numbers are only comparable on the machine type that captured the baseline (its
+"machine" fingerprint). On any other machine the gate cannot judge the run and exits 2,
+so a gate on the wrong runner fails visibly instead of passing; --report-only prints the
+comparison and exits 0 for a look at numbers from another machine.
+
+    python tests/bench/bench_pipeline.py --output current.json
+    python tests/bench/compare.py current.json            # exit 1 on confirmed regression, 2 on another machine
+
+To accept new numbers, re-run the suite on the machine that runs the gate (the CI runner)
+and commit the output as tests/bench/baseline.json.
+"""
+
+import argparse
+import fnmatch
+import json
+import math
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_TOLERANCES = BENCH_DIR / "tolerances.json"
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_CONFIRMATIONS = 2
+
+# Two-sided 95% Student t critical values by degrees of freedom; 1.96 beyond the table
+_T_95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+         2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+         2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+def t_critical(df: float) -> float:
+    if df < 1:
+        return _T_95[0]
+    index = int(math.floor(df))
+    return _T_95[index - 1] if index <= len(_T_95) else 1.96
+
+def relative_change(baseline: List[float], current: List[float]) -> Tuple[float, float, float]:
+    """
+    Relative change of the mean (current / baseline - 1) with a 95% confidence interval,
+    using the delta method for the ratio and Welch-Satterthwaite degrees of freedom.
+    """
+    mean_b, mean_c = statistics.fmean(baseline), statistics.fmean(current)
+    ratio = mean_c / mean_b
+    var_b = statistics.variance(baseline) / len(baseline) if len(baseline) > 1 else 0.0
+    var_c = statistics.variance(current) / len(current) if len(current) > 1 else 0.0
+    rel_b, rel_c = var_b / mean_b ** 2, var_c / mean_c ** 2
+    spread = ratio * math.sqrt(rel_b + rel_c)
+    if rel_b + rel_c == 0:
+        df = float("inf")
+    else:
+        terms = [rel ** 2 / (len(samples) - 1) for rel, samples in ((rel_b, baseline), (rel_c, current))
+                 if len(samples) > 1 and rel > 0]
+        df = (rel_b + rel_c) ** 2 / sum(terms) if terms else float("inf")
+    margin = t_critical(df) * spread
+    return ratio - 1, ratio - margin - 1, ratio + margin - 1
+
+def load_tolerances(path: Optional[Path]) -> Tuple[float, Dict[str, float]]:
+    if path is None or not path.exists():
+        return DEFAULT_TOLERANCE, {}
+    data = json.loads(path.read_text())
+    return float(data.get("default", DEFAULT_TOLERANCE)), {k: float(v) for k, v in data.get("overrides", {}).items()}
+
+def tolerance_for(name: str, default: float, overrides: Dict[str, float]) -> float:
+    """The most specific (longest) matching pattern wins."""
+    matches = [(len(pattern), value) for pattern, value in overrides.items() if fnmatch.fnmatchcase(name, pattern)]
+    return max(matches)[1] if matches else default
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], default_tolerance: float = DEFAULT_TOLERANCE,
+            overrides: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+    """One row per benchmark with verdict: regression, improvement, ok, missing or new."""
+    overrides = overrides or {}
+    base_runs, current_runs = baseline["benchmarks"], current["benchmarks"]
+    rows: List[Dict[str, Any]] = []
+    for name, base in base_runs.items():
+        tolerance = tolerance_for(name, default_tolerance, overrides)
+        row: Dict[str, Any] = {"name": name, "tolerance": tolerance,
+                               "baseline_s": statistics.fmean(base["samples_s"])}
+        run = current_runs.get(name)
+        if run is None:
+            row["verdict"] = "missing"
+            rows.append(row)
+            continue
+        change, low, high = relative_change(base["samples_s"], run["samples_s"])
+        row.update({"current_s": statistics.fmean(run["samples_s"]), "change": change, "ci": [low, high]})
+        if low > tolerance:
+            row["verdict"] = "regression"
+        elif high < -tolerance:
+            row["verdict"] = "improvement"
+        else:
+            row["verdict"] = "ok"
+        rows.append(row)
+    for name, run in current_runs.items():
+        if name not in base_runs:
+            rows.append({"name": name, "verdict": "new", "current_s": statistics.fmean(run["samples_s"])})
+    return rows
+
+def rerun_benchmarks(names: List[str]) -> Dict[str, Any]:
+    """Runs just these benchmarks in a fresh bench_pipeline.py process."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "rerun.json"
+        command = [sys.executable, str(BENCH_DIR / "bench_pipeline.py"), "--output", str(output)]
+        for name in names:
+            command += ["--only", name]
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        run = json.loads(output.read_text())
+    run["benchmarks"] = {name: result for name, result in run["benchmarks"].items() if name in names}
+    return run
+
+def confirm_regressions(rows: List[Dict[str, Any]], baseline: Dict[str, Any], confirmations: int,
+                        default_tolerance: float = DEFAULT_TOLERANCE, overrides: Optional[Dict[str, float]] = None,
+                        rerun: Callable[[List[str]], Dict[str, Any]] = rerun_benchmarks) -> List[Dict[str, Any]]:
+    """
+    Re-measures regressed benchmarks up to `confirmations` times; a regression stands only
+    if every re-run regresses as well, otherwise its verdict becomes "unconfirmed".
+    """
+    pending = [row for row in rows if row["verdict"] == "regression"]
+    for row in pending:
+        row["confirmed_runs"] = 0
+    for _ in range(confirmations):
+        if not pending:
+            break
+        names = [row["name"] for row in pending]
+        subset = dict(baseline, benchmarks={name: baseline["benchmarks"][name] for name in names})
+        verdicts = {row["name"]: row["verdict"]
+                    for row in compare(subset, rerun(names), default_tolerance, overrides)}
+        still = []
+        for row in pending:
+            if verdicts.get(row["name"]) == "regression":
+                row["confirmed_runs"] += 1
+                still.append(row)
+            else:
+                row["verdict"] = "unconfirmed"
+        pending = still
+    return rows
+
+def _duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}us"
+
+def format_report(rows: List[Dict[str, Any]], baseline_meta: Dict[str, Any], current_meta: Dict[str, Any]) -> str:
+    markers = {"regression": "!!", "improvement": "++", "missing": "??", "new": "  ", "ok": "  ", "unconfirmed": "~~"}
+    width = max([len(row["name"]) for row in rows] + [9])
+    lines = [
+        f"baseline: {baseline_meta.get('commit')} ({baseline_meta.get('python')}, {baseline_meta.get('platform')})",
+        f"current:  {current_meta.get('commit')} ({current_meta.get('python')}, {current_meta.get('platform')})",
+    ]
+    for key in ("machine", "python", "platform", "hash_algorithm"):
+        if baseline_meta.get(key) != current_meta.get(key):
+            lines.append(f"warning: {key} differs ({baseline_meta.get(key)} -> {current_meta.get(key)}); "
+                         f"numbers may not be comparable")
+    lines.append("")
+    lines.append(f"   {'benchmark':<{width}} {'baseline':>10} {'current':>10} {'change':>8}  {'95% CI':<18} {'tol':>5}  verdict")
+    for row in rows:
+        if "change" in row:
+            change = f"{row['change'] * 100:+.1f}%"
+            ci = f"[{row['ci'][0] * 100:+.1f}%, {row['ci'][1] * 100:+.1f}%]"
+        else:
+            change, ci = "-", ""
+        tolerance = f"{row['tolerance'] * 100:.0f}%" if "tolerance" in row else ""
+        lines.append(f"{markers[row['verdict']]} {row['name']:<{width}} {_duration(row.get('baseline_s')):>10} "
+                     f"{_duration(row.get('current_s')):>10} {change:>8}  {ci:<18} {tolerance:>5}  {row['verdict']}")
+    counts = {verdict: sum(1 for row in rows if row["verdict"] == verdict)
+              for verdict in ("regression", "unconfirmed", "improvement", "ok", "missing", "new")}
+    lines.append("")
+    lines.append(", ".join(f"{count} {verdict}" for verdict, count in counts.items() if count))
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="AXIOMHIVE benchmark regression gate")
+    parser.add_argument("current", help="JSON output of bench_pipeline.py")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON (default: committed baseline)")
+    parser.add_argument("--tolerances", default=str(DEFAULT_TOLERANCES), help="Tolerance file")
+    parser.add_argument("--tolerance", type=float, help="Override the default tolerance (e.g. 0.15)")
+    parser.add_argument("--allow-missing", action="store_true", help="Do not fail on benchmarks absent from the run")
+    parser.add_argument("--confirm", type=int, default=DEFAULT_CONFIRMATIONS,
+                        help="Fresh-process re-runs every regression must also fail (0 disables)")
+    parser.add_argument("--report-only", action="store_true",
+                        help="Exit 0 even when the baseline comes from another machine type")
+    parser.add_argument("--json", help="Also write the comparison rows to this file")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    default_tolerance, overrides = load_tolerances(Path(args.tolerances))
+    if args.tolerance is not None:
+        default_tolerance = args.tolerance
+    if args.allow_missing or current.get("meta", {}).get("only"): # A filtered run only answers for what it ran
+        baseline = dict(baseline, benchmarks={name: run for name, run in baseline["benchmarks"].items()
+                                              if name in current["benchmarks"]})
+
+    rows = compare(baseline, current, default_tolerance, overrides)
+    if args.confirm > 0:
+        rows = confirm_regressions(rows, baseline, args.confirm, default_tolerance, overrides)
+    baseline_meta, current_meta = baseline.get("meta", {}), current.get("meta", {})
+    print(format_report(rows, baseline_meta, current_meta))
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2) + "\n")
+    if baseline_meta.get("machine") != current_meta.get("machine"):
+        if args.report_only:
+            print("\nBaseline was captured on a different machine type: report only.")
+            return 0
+        print(f"\nerror: baseline was captured on {baseline_meta.get('machine')!r}, this run on "
+              f"{current_meta.get('machine')!r}; re-capture the baseline on this machine type.", file=sys.stderr)
+        return 2
+    return 1 if any(row["verdict"] in ("regression", "missing") for row in rows) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/INTEGRATION/TEST_DAEMON: Integration Tests for the Unix Socket Node Daemon
+
+import os
+import socket
+import stat
+import tempfile
+import time
+import unittest
+from unittest import mock
+from src.daemon import NodeDaemon, DaemonClient, DaemonError
+from src.sovereign_core import ZKVSNodePrime
+
+class TestNodeDaemon(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Persistent node state assurance
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmp.name, "axiomhive.sock")
+        self.node = ZKVSNodePrime()
+        self.daemon = NodeDaemon(self.node, self.socket_path, workers=4).start()
+        self.client = DaemonClient(self.socket_path)
+
+    def tearDown(self):
+        self.client.close()
+        self.daemon.shutdown()
+        self.node.close()
+        self.tmp.cleanup()
+
+    def test_state_persists_across_clients(self):
+        framework = {"intent": "Architect market dominance through verifiable systems."}
+        self.assertEqual(self.client.execute_mandate(framework), ZKVSNodePrime().execute_mandate(framework))
+        before = self.client.status()["ledger_events"]
+
+        other = DaemonClient(self.socket_path)
+        try:
+            other.execute_mandates([framework, {"intent": "filter the data"}])
+            status = other.status()
+        finally:
+            other.close()
+        self.assertGreater(status["ledger_events"], before)
+        self.assertEqual(status["pid"], os.getpid())
+        self.assertEqual(len(self.client.ledger_events()), len(self.node._verifiable_ledger))
+        self.assertEqual(self.client.ledger_events(offset=1, limit=2), self.node._verifiable_ledger[1:3])
+
+    def test_pipelined_requests_return_in_call_order(self):
+        frameworks = [{"intent": f"filter the data stream {i}"} for i in range(20)]
+        results = self.client.execute_pipelined(frameworks + [{"no_intent": True}])
+        self.assertEqual(results[:20], [self.node.execute_mandate(f) for f in frameworks])
+        self.assertIsInstance(results[20], DaemonError)
+        self.assertEqual(results[20].error_type, "ValueError")
+        self.assertTrue(self.client.ping()) # The connection stays usable after an error
+
+    def test_protocol_errors_and_socket_permissions(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode) & 0o077, 0)
+        with self.assertRaises(DaemonError) as raised:
+            self.client.call("reboot")
+        self.assertEqual(raised.exception.error_type, "ProtocolError")
+
+        raw = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        raw.connect(self.socket_path)
+        raw.sendall(b"not json\n")
+        self.assertIn(b'"ProtocolError"', raw.makefile("rb").readline())
+        raw.close()
+
+    def test_refuses_live_socket_and_reclaims_stale_one(self):
+        with self.assertRaises(RuntimeError):
+            NodeDaemon(self.node, self.socket_path)
+
+        stale = os.path.join(self.tmp.name, "stale.sock")
+        dead = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        dead.bind(stale)
+        dead.close() # Socket file left behind by a crashed daemon
+        daemon = NodeDaemon(self.node, stale).start()
+        client = DaemonClient(stale)
+        self.assertTrue(client.ping())
+        client.shutdown()
+        client.close()
+        deadline = time.monotonic() + 5
+        while os.path.exists(stale) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(os.path.exists(stale))
+        self.assertFalse(DaemonClient.is_running(stale))
+
+    def test_never_removes_non_sockets_or_trusts_other_users(self):
+        regular = os.path.join(self.tmp.name, "notes.txt")
+        with open(regular, "w") as f:
+            f.write("keep me")
+        with self.assertRaises(RuntimeError):
+            NodeDaemon(self.node, regular)
+        with open(regular) as f:
+            self.assertEqual(f.read(), "keep me")
+
+        nested = os.path.join(self.tmp.name, "runtime", "axiomhive.sock")
+        daemon = NodeDaemon(self.node, nested).start()
+        try:
+            self.assertEqual(stat.S_IMODE(os.stat(os.path.dirname(nested)).st_mode), 0o700)
+            with mock.patch("src.daemon._peer_credentials", return_value=(1, os.getuid() + 1000)):
+                with self.assertRaises(PermissionError):
+                    DaemonClient(nested).ping()
+        finally:
+            daemon.shutdown()
+
+if __name__ == '__main__':
+    unittest.main()
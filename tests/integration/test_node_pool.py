@@ -0,0 +1,66 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/INTEGRATION/TEST_NODE_POOL: Integration Tests for the Multi-Process Node Pool
+
+import os
+import signal
+import unittest
+from src.config import get_config
+from src.node_pool import NodePoolSupervisor, ConsistentHashRing, framework_digest
+from src.sovereign_core import ZKVSNodePrime
+
+class TestNodePool(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Multi-core scaling assurance
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = NodePoolSupervisor(workers=2, deadline=30)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_default_deadline_comes_from_config(self):
+        with NodePoolSupervisor(workers=1) as pool:
+            self.assertEqual(pool.deadline, get_config().node_pool_deadline)
+            self.assertGreater(pool.deadline, 0) # A hung worker is always restarted
+
+    def test_routing_is_stable_and_key_order_independent(self):
+        framework = {"intent": "filter the data", "context": "technical"}
+        reordered = {"context": "technical", "intent": "filter the data"}
+        self.assertEqual(framework_digest(framework), framework_digest(reordered))
+        self.assertEqual(self.pool.route(framework), self.pool.route(reordered))
+
+        ring = ConsistentHashRing([0, 1, 2, 3])
+        digests = [framework_digest({"intent": f"mandate {i}"}) for i in range(400)]
+        owners = {ring.route(d) for d in digests}
+        self.assertEqual(owners, {0, 1, 2, 3})
+
+    def test_pool_matches_single_node_output(self):
+        framework = {"intent": "Architect market dominance through verifiable systems."}
+        self.assertEqual(self.pool.execute_mandate(framework), ZKVSNodePrime().execute_mandate(framework))
+
+        results = self.pool.execute_mandates([{"intent": f"filter the data {i}"} for i in range(10)] + [{}])
+        self.assertEqual([r["status"] for r in results], ["success"] * 10 + ["error"])
+
+        roots = self.pool.ledger_roots()
+        self.assertEqual(sorted(roots), [0, 1])
+
+        samples = {(sample, tuple(sorted(labels.items()))): value
+                   for _, _, _, family in self.pool.collect() for sample, labels, value in family}
+        executed = sum(value for (sample, labels), value in samples.items()
+                       if sample == "axiomhive_mandates_total" and ("status", "success") in labels)
+        self.assertGreaterEqual(executed, 11)
+        self.assertTrue(all(roots.values()))
+
+    def test_crashed_worker_is_restarted(self):
+        framework = {"intent": "filter the crash data"}
+        slot = self.pool.route(framework)
+        worker = self.pool._workers[slot]
+        os.kill(worker.pid, signal.SIGKILL)
+        worker._process.join()
+
+        self.assertIn("AXIOMHIVE/ZKVS_SIEVE_PROTOCOL", self.pool.execute_mandate(framework))
+        self.assertGreaterEqual(self.pool.worker_status()[slot]["restarts"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
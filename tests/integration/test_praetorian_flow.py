@@ -1,6 +1,7 @@
 # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
 # TESTS/INTEGRATION/TEST_PRAETORIAN_FLOW: Integration Tests for Praetorian Core Flow
 
+import threading
 import unittest
 from src.sovereign_core import ZKVSNodePrime
 
@@ -80,5 +81,51 @@ class TestPraetorianFlow(unittest.TestCase):
         final_metrics = self.node._data_moat_engine.calculate_impact_metrics("some output")
         self.assertGreater(final_metrics['PSI'], 0.9997) # Should increase due to moat strength
 
+    def test_batch_mandate_execution(self):
+        """
+        Verifies that a batch runs every valid framework through all stages, reports
+        invalid ones individually, and matches the single-mandate output.
+        """
+        frameworks = [
+            {"intent": "Architect unassailable market dominance through verifiable systems."},
+            {"context": "missing intent"},
+            {"intent": "filter the data for sovereign signal"},
+        ]
+        expected_first = ZKVSNodePrime().execute_mandate(frameworks[0])
+
+        ledger_before = len(self.node._verifiable_ledger)
+        results = self.node.execute_mandates(frameworks)
+
+        self.assertEqual([r["status"] for r in results], ["success", "error", "success"])
+        self.assertEqual(results[0]["result"], expected_first)
+        self.assertIn("intent", results[1]["error"])
+        batch_events = self.node._verifiable_ledger[ledger_before:]
+        self.assertEqual(sum(1 for e in batch_events if e["message"].startswith("ZK computation performed.")), 1)
+
+    def test_concurrent_mandates_share_one_node(self):
+        """
+        Verifies that threads sharing one node keep the ledger hash chain intact.
+        """
+        errors = []
+
+        def worker(worker_id):
+            try:
+                for i in range(20):
+                    self.node.execute_mandate({"intent": f"filter the data stream {worker_id} {i}"})
+                    if i % 7 == 0:
+                        self.node._refactor_and_reboot(f"Concurrent reboot from worker {worker_id}")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertTrue(self.node._is_ready)
+        self.assertTrue(self.node.verify_ledger_chain())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,128 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/INTEGRATION/TEST_RPC: Integration Tests for the Binary RPC Protocol
+
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from src.admission import AdmissionController
+from src.rpc import RpcServer, RpcClient, RpcError, encode_framework, decode_framework
+from src.sovereign_core import ZKVSNodePrime
+
+class _DelayNode:
+    """Stand-in node sleeping for the framework's delay_ms and echoing its intent reversed."""
+
+    def __init__(self):
+        self.intents = []
+
+    def execute_mandate(self, framework):
+        self.intents.append(framework["intent"])
+        time.sleep(float(framework.get("delay_ms", 0)) / 1e3)
+        return framework["intent"][::-1]
+
+    def status(self):
+        return {"ready": True}
+
+class TestRpc(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Co-located client assurance
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmp.name, "rpc.sock")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _serve(self, node):
+        server = RpcServer(node, self.socket_path, workers=8).start()
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_framework_encoding_round_trips(self):
+        for framework in ({"intent": "naïve ✓ intent", "context": "technical", "n": [1, 2]},
+                          {"context": "no intent"}, {"intent": 7}):
+            body = memoryview(b"".join(encode_framework(framework)))
+            self.assertEqual(decode_framework(body), framework)
+
+    def test_node_calls_match_in_process_results(self):
+        node = ZKVSNodePrime()
+        self.addCleanup(node.close)
+        self._serve(node)
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode) & 0o077, 0)
+        client = RpcClient(self.socket_path)
+        try:
+            framework = {"intent": "Architect market dominance through verifiable systems."}
+            self.assertTrue(client.ping())
+            self.assertEqual(client.execute_mandate(framework), ZKVSNodePrime().execute_mandate(framework))
+            results = client.execute_mandates([framework, {}])
+            self.assertEqual([r["status"] for r in results], ["success", "error"])
+            with self.assertRaises(RpcError) as raised:
+                client.execute_mandate({"no_intent": True})
+            self.assertEqual(raised.exception.error_type, "ValueError")
+            self.assertEqual(client.status()["ledger_events"], len(node._verifiable_ledger))
+        finally:
+            client.close()
+
+    def test_requests_are_multiplexed_on_one_connection(self):
+        self._serve(_DelayNode())
+        client = RpcClient(self.socket_path)
+        try:
+            started = time.perf_counter()
+            futures = [client.execute_mandate_async({"intent": f"mandate {i}", "delay_ms": 200 - 20 * i})
+                       for i in range(8)]
+            results = [str(future.result(5)[1], "utf-8") for future in futures]
+            elapsed = time.perf_counter() - started
+            self.assertEqual(results, [f"mandate {i}"[::-1] for i in range(8)])
+            self.assertLess(elapsed, 0.6) # Ran concurrently, not one after another
+
+            threads = [threading.Thread(target=lambda: client.execute_mandate({"intent": "x"})) for _ in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            client.close()
+
+    def test_mandates_pass_admission_control(self):
+        node = _DelayNode()
+        server = RpcServer(node, self.socket_path, workers=2,
+                           admission=AdmissionController(2, 4, client_rate=1.0, client_burst=3)).start()
+        self.addCleanup(server.shutdown)
+        client = RpcClient(self.socket_path)
+        self.addCleanup(client.close)
+        futures = [client.execute_mandate_async({"intent": f"m{i}"}) for i in range(4)]
+        self.assertEqual([str(future.result(5)[1], "utf-8") for future in futures[:3]], ["0m", "1m", "2m"])
+        with self.assertRaises(RpcError) as raised:
+            futures[3].result(5)
+        self.assertEqual(raised.exception.error_type, "AdmissionRejected")
+        self.assertGreater(raised.exception.retry_after, 0)
+        self.assertTrue(client.ping()) # Status and ping are never gated
+        self.assertEqual(client.status()["admission"]["in_flight"], 0)
+        self.assertEqual(server.requests, 6)
+
+    def test_large_payloads_use_shared_memory(self):
+        node = _DelayNode()
+        self._serve(node)
+        intent = "filter the data stream " * 10000
+        client = RpcClient(self.socket_path, shared_memory_threshold=1024)
+        try:
+            self.assertEqual(client.execute_mandate({"intent": intent}), intent[::-1])
+            self.assertEqual(client._pending, {}) # Segment released once answered
+        finally:
+            client.close()
+
+        # From another process the server detaches without unlinking the client's segment
+        script = ("import sys; from src.rpc import RpcClient; c = RpcClient(sys.argv[1], shared_memory_threshold=1024); "
+                  "r = c.execute_mandate({'intent': 'y' * 200000}); c.close(); print(len(r))")
+        output = subprocess.run([sys.executable, "-c", script, self.socket_path], capture_output=True,
+                                text=True, timeout=30, cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+        self.assertEqual(output.stdout.strip(), "200000", output.stderr)
+        self.assertNotIn("resource_tracker", output.stderr)
+        self.assertEqual(node.intents[-1], "y" * 200000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/INTEGRATION/TEST_SERVER: Integration Tests for the Asyncio HTTP/1.1 Server
+
+import http.client
+import json
+import socket
+import threading
+import time
+import unittest
+from src.admission import AdmissionController
+from src.server import NodeServer
+from src.sovereign_core import ZKVSNodePrime
+
+def _post(path: str, body: bytes, extra: str = "") -> bytes:
+    return (f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n{extra}\r\n").encode() + body
+
+def _read_responses(sock: socket.socket, count: int):
+    """(status, headers, body) for count responses read off a raw socket."""
+    reader = sock.makefile("rb")
+    responses = []
+    for _ in range(count):
+        status = int(reader.readline().split()[1])
+        headers = {}
+        while True:
+            line = reader.readline().strip()
+            if not line:
+                break
+            name, _, value = line.decode().partition(":")
+            headers[name.lower()] = value.strip()
+        responses.append((status, headers, reader.read(int(headers["content-length"]))))
+    return responses
+
+class _SlowNode:
+    """Stand-in node whose mandates take a fixed time and echo their intent."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.started = threading.Event()
+
+    def execute_mandate(self, framework):
+        self.started.set()
+        time.sleep(self.delay)
+        return framework["intent"]
+
+class TestNodeServer(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Network serving assurance
+
+    def setUp(self):
+        self.node = ZKVSNodePrime()
+        # Intake queue sized independently of the 2-connection limit so pipelines are not shed
+        self.server = NodeServer(self.node, "127.0.0.1", 0, max_connections=2, workers=4,
+                                 admission=AdmissionController(4, 32)).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.node.close()
+
+    def test_keep_alive_endpoints(self):
+        framework = {"intent": "Architect market dominance through verifiable systems."}
+        expected = ZKVSNodePrime().execute_mandate(framework)
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.port)
+        connection.request("POST", "/execute", json.dumps({"framework": framework}))
+        response = connection.getresponse()
+        self.assertEqual((response.status, response.getheader("Connection")), (200, "keep-alive"))
+        self.assertEqual(json.loads(response.read())["result"], expected)
+        sock = connection.sock
+
+        connection.request("POST", "/execute-batch", json.dumps({"frameworks": [framework, {}]}))
+        results = json.loads(connection.getresponse().read())["results"]
+        self.assertEqual([r["status"] for r in results], ["success", "error"])
+
+        connection.request("GET", "/status")
+        status = json.loads(connection.getresponse().read())
+        self.assertEqual(status["ledger_events"], len(self.node._verifiable_ledger))
+        self.assertEqual(status["axioms"]["NOISE"], "-inf") # Strict JSON
+
+        connection.request("GET", "/ledger?offset=1&limit=2")
+        self.assertEqual(json.loads(connection.getresponse().read())["events"],
+                         json.loads(json.dumps(self.node._verifiable_ledger[1:3], default=str)))
+        self.assertIs(connection.sock, sock) # Every request reused one connection
+
+        for method, path, body, code in (("POST", "/execute", "{bad", 400), ("POST", "/execute", "{}", 400),
+                                         ("GET", "/execute", None, 405), ("GET", "/missing", None, 404),
+                                         ("GET", "/ledger?offset=x", None, 400)):
+            connection.request(method, path, body)
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, code, path)
+        connection.close()
+
+    def test_pipelined_responses_keep_request_order(self):
+        sock = socket.create_connection(("127.0.0.1", self.server.port))
+        intents = [f"filter the data stream {i}" for i in range(10)]
+        sock.sendall(b"".join(_post("/execute", json.dumps({"intent": intent}).encode()) for intent in intents)
+                     + b"GET /status HTTP/1.1\r\nConnection: close\r\n\r\n")
+        responses = _read_responses(sock, 11)
+        self.assertEqual([json.loads(body)["result"] for _, _, body in responses[:10]],
+                         [self.node.execute_mandate({"intent": intent}) for intent in intents])
+        self.assertEqual(responses[10][1]["connection"], "close")
+        self.assertEqual(sock.recv(1), b"") # Server closed after the Connection: close request
+        sock.close()
+
+    def test_connection_limit_rejects_with_retry_after(self):
+        held = [socket.create_connection(("127.0.0.1", self.server.port)) for _ in range(2)]
+        for sock in held:
+            sock.sendall(b"GET /status HTTP/1.1\r\n\r\n")
+            _read_responses(sock, 1)
+        extra = http.client.HTTPConnection("127.0.0.1", self.server.port)
+        extra.request("GET", "/status")
+        response = extra.getresponse()
+        self.assertEqual((response.status, response.getheader("Retry-After")), (503, "1"))
+        extra.close()
+        for sock in held:
+            sock.close()
+
+class TestServerAdmission(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Overload rejection assurance
+
+    def test_rejections_carry_retry_after(self):
+        node = _SlowNode(0.2)
+        server = NodeServer(node, "127.0.0.1", 0, workers=1,
+                            admission=AdmissionController(1, 1, client_rate=1.0, client_burst=3)).start()
+        try:
+            sock = socket.create_connection(("127.0.0.1", server.port))
+            sock.sendall(b"".join(_post("/execute", json.dumps({"intent": f"i{i}"}).encode()) for i in range(4)))
+            statuses = [(status, headers.get("retry-after"), json.loads(body))
+                        for status, headers, body in _read_responses(sock, 4)]
+            sock.close()
+        finally:
+            server.shutdown()
+        # One runs, one queues, the third is shed (queue over 3/4), the fourth exceeds the burst
+        self.assertEqual([s[0] for s in statuses], [200, 200, 503, 429])
+        self.assertEqual(statuses[2][2]["error"]["reason"], "shed")
+        self.assertEqual(statuses[3][2]["error"]["reason"], "rate_limited")
+        self.assertTrue(all(s[1] is not None and int(s[1]) >= 1 for s in statuses[2:]))
+
+    def test_unknown_priority_headers_count_as_normal(self):
+        admission = AdmissionController(4, 8)
+        server = NodeServer(_SlowNode(0), "127.0.0.1", 0, workers=2, admission=admission).start()
+        try:
+            sock = socket.create_connection(("127.0.0.1", server.port))
+            sock.sendall(b"".join(_post("/execute", b'{"intent": "x"}', f"X-AXIOMHIVE-Priority: {header}\r\n")
+                                  for header in ("bogus-1", "bogus-2", "HIGH")))
+            self.assertEqual([status for status, _, _ in _read_responses(sock, 3)], [200, 200, 200])
+            sock.close()
+        finally:
+            server.shutdown()
+        metrics = admission.metrics.render()
+        self.assertNotIn("bogus", metrics)
+        self.assertIn('priority="normal"} 2', metrics)
+        self.assertIn('priority="high"} 1', metrics)
+
+    def test_failures_outside_the_handler_become_500(self):
+        server = NodeServer(_SlowNode(0), "127.0.0.1", 0, workers=1).start()
+        try:
+            server._executor.shutdown() # run_in_executor now raises RuntimeError
+            sock = socket.create_connection(("127.0.0.1", server.port))
+            sock.sendall(_post("/execute", b'{"intent": "x"}') * 2)
+            status, headers, _ = _read_responses(sock, 1)[0]
+            self.assertEqual((status, headers["connection"]), (500, "close"))
+            self.assertEqual(sock.recv(1), b"") # Closed cleanly; the rest of the pipeline is not answered
+            sock.close()
+        finally:
+            server.shutdown()
+
+class TestServerDrain(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Graceful shutdown assurance
+
+    def test_shutdown_finishes_in_flight_requests(self):
+        node = _SlowNode(0.3)
+        server = NodeServer(node, "127.0.0.1", 0, keepalive_timeout=5, drain_timeout=5).start()
+        busy = socket.create_connection(("127.0.0.1", server.port))
+        idle = socket.create_connection(("127.0.0.1", server.port))
+        busy.sendall(_post("/execute", b'{"intent": "slow"}'))
+        self.assertTrue(node.started.wait(2))
+
+        server.shutdown()
+        status, headers, body = _read_responses(busy, 1)[0]
+        self.assertEqual((status, headers["connection"], json.loads(body)["result"]), (200, "close", "slow"))
+        self.assertEqual(idle.recv(1), b"") # Idle keep-alive connection closed without a response
+        with self.assertRaises(OSError):
+            socket.create_connection(("127.0.0.1", server.port), timeout=1)
+        busy.close()
+        idle.close()
+
+if __name__ == '__main__':
+    unittest.main()
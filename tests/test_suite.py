@@ -58,6 +58,21 @@ class TestZKVSProtocol(unittest.TestCase):
             self.assertIsNotNone(node._verifiable_ledger[-1]['hash'])
             self.assertNotEqual(node._verifiable_ledger[-1]['hash'], node._verifiable_ledger[-2]['hash']) # Should be different
 
+    def test_trust_error_rate_uses_the_running_count(self):
+        engine = TrustMetricsEngine(ZKVSNodePrime.AXIOMS)
+        ledger = [{'level': 'INFO'}, {'level': 'CRITICAL'}]
+        self.assertEqual(engine._evaluate_error_rate(ledger), 0.5)
+        ledger[:] = [{'level': 'CRITICAL'}] * 4 # Replaced in place: a scan sees the new entries
+        self.assertEqual(engine._evaluate_error_rate(ledger), 1.0)
+        self.assertEqual(engine._evaluate_error_rate(ledger, critical_events=1), 0.25)
+
+        node = ZKVSNodePrime()
+        node._refactor_and_reboot("Test reboot.")
+        node._log_event("Test event.", level="ERROR")
+        self.assertEqual(node._critical_events,
+                         sum(1 for event in node._verifiable_ledger if event['level'] == 'CRITICAL'))
+        self.assertGreater(node._critical_events, 0)
+
     def test_axiom_density_enforcement(self):
         node = ZKVSNodePrime()
         enforcement = AxiomEnforcement(node.AXIOMS)
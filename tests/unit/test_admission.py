@@ -0,0 +1,133 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_ADMISSION: Unit Tests for Admission Control
+
+import asyncio
+import math
+import threading
+import time
+import unittest
+from src.admission import AdmissionController, AdmissionRejected, TokenBucket, priority_of, retry_after_header
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestAdmissionController(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Overload protection assurance
+
+    def test_token_bucket_rate_limits_each_client(self):
+        clock = _Clock()
+        bucket = TokenBucket(rate=2.0, burst=4.0, now=0.0)
+        self.assertEqual(bucket.take(4, 0.0), 0.0)
+        self.assertAlmostEqual(bucket.take(1, 0.0), 0.5)
+        self.assertEqual(bucket.take(1, 0.5), 0.0) # Refilled one token
+        self.assertEqual(bucket.take(5, 10.0), math.inf) # More than a full bucket never fits
+        self.assertEqual(bucket.tokens, 4.0)
+
+        controller = AdmissionController(100, 10, client_rate=1.0, client_burst=2, clock=clock)
+        controller.acquire("a", cost=2)
+        with self.assertRaises(AdmissionRejected) as raised:
+            controller.acquire("a")
+        self.assertEqual(raised.exception.reason, "rate_limited")
+        self.assertAlmostEqual(raised.exception.retry_after, 1.0)
+        controller.acquire("b") # Other clients keep their own bucket
+        clock.now = 1.0
+        controller.acquire("a")
+
+        clock.now = 100.0 # Full bucket: an oversized batch is still turned away, and costs nothing
+        with self.assertRaises(AdmissionRejected) as raised:
+            controller.acquire("a", cost=3)
+        self.assertEqual(raised.exception.reason, "rate_limited")
+        self.assertAlmostEqual(raised.exception.retry_after, 2.0)
+        controller.acquire("a", cost=2)
+
+    def test_sheds_lower_priorities_first(self):
+        controller = AdmissionController(1, 4, max_wait=5)
+        controller.acquire("c")
+        threads = []
+        for _ in range(3):
+            def run():
+                controller.acquire("c", "high")
+                controller.release()
+            threads.append(threading.Thread(target=run))
+            threads[-1].start()
+            while controller.stats()["queue_depth"] < len(threads):
+                time.sleep(0.001)
+        # Three queued of four: low (limit 2) and normal (3) shed, high (3.6) still queues
+        for priority in ("low", "normal"):
+            with self.assertRaises(AdmissionRejected) as raised:
+                controller.acquire("c", priority)
+            self.assertEqual(raised.exception.reason, "shed")
+        threads.append(threading.Thread(target=lambda: (controller.acquire("c", "high"), controller.release())))
+        threads[-1].start()
+        controller.release()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(controller.stats()["queue_depth"], 0)
+        self.assertIn('reason="shed",priority="normal"', controller.metrics.render())
+
+    def test_queued_waiters_start_by_priority(self):
+        controller = AdmissionController(1, 10, max_wait=5)
+        controller.acquire("c")
+        order = []
+        threads = []
+        for priority in ("low", "normal", "absolute", "high"):
+            def run(p=priority):
+                controller.acquire("c", p)
+                order.append(p)
+                controller.release()
+            threads.append(threading.Thread(target=run))
+            threads[-1].start()
+            while controller.stats()["queue_depth"] < len(threads):
+                time.sleep(0.001)
+        controller.release()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order, ["absolute", "high", "normal", "low"])
+
+    def test_cancelled_async_waiters_give_up_their_place(self):
+        controller = AdmissionController(1, 4, max_wait=5)
+
+        async def scenario():
+            controller.acquire("holder")
+            queued = asyncio.ensure_future(controller.acquire_async("c"))
+            await asyncio.sleep(0.01)
+            self.assertEqual(controller.stats()["queue_depth"], 1)
+            queued.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await queued
+            controller.release()
+
+            # Admitted by release() but cancelled before resuming: the slot is handed back
+            controller.acquire("holder")
+            admitted = asyncio.ensure_future(controller.acquire_async("c"))
+            await asyncio.sleep(0.01)
+            controller.release()
+            admitted.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await admitted
+
+        asyncio.run(scenario())
+        self.assertEqual(controller.stats()["in_flight"], 0)
+        self.assertEqual(controller.stats()["queue_depth"], 0)
+        self.assertIn('reason="cancelled"', controller.metrics.render())
+
+    def test_queue_timeout_and_retry_after(self):
+        controller = AdmissionController(1, 10, max_wait=0.05)
+        controller.acquire("c")
+        with self.assertRaises(AdmissionRejected) as raised:
+            controller.acquire("c")
+        self.assertEqual(raised.exception.reason, "queue_timeout")
+        self.assertGreater(raised.exception.retry_after, 0)
+        self.assertEqual(controller.stats()["queue_depth"], 0)
+        controller.release()
+        self.assertEqual(controller.stats()["in_flight"], 0)
+        self.assertEqual((retry_after_header(0.001), retry_after_header(2.5)), ("1", "3"))
+        self.assertEqual(priority_of([{"priority": "low"}, {"priority": "high"}, {}]), "high")
+        self.assertEqual(priority_of([{"priority": "bogus"}]), "normal")
+
+if __name__ == '__main__':
+    unittest.main()
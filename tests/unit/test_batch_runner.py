@@ -0,0 +1,93 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_BATCH_RUNNER: Unit Tests for Resumable Bulk Execution
+
+import json
+import os
+import random
+import tempfile
+import time
+import unittest
+from src.batch_runner import BatchRunner
+
+class _EchoTarget:
+    """Stand-in node: echoes intents, taking a random time per chunk, and can be interrupted."""
+
+    def __init__(self, interrupt_after: int = -1, jitter: float = 0.0):
+        self.interrupt_after = interrupt_after
+        self.jitter = jitter
+        self.executed = []
+
+    def execute_mandates(self, frameworks):
+        if self.interrupt_after == 0:
+            raise KeyboardInterrupt
+        self.interrupt_after -= 1
+        time.sleep(random.random() * self.jitter)
+        self.executed.extend(f["intent"] for f in frameworks)
+        return [{"status": "success", "result": f["intent"].upper()} if f["intent"] != "bad"
+                else {"status": "error", "error": "rejected"} for f in frameworks]
+
+def _read(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+class TestBatchRunner(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Bulk execution assurance
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.tmp.name, "frameworks.jsonl")
+        self.output = os.path.join(self.tmp.name, "results.jsonl")
+        with open(self.input, "w") as f:
+            for i in range(100):
+                f.write(json.dumps({"id": f"job-{i}", "framework": {"intent": f"intent {i}"}}) + "\n")
+            f.write("\n{broken\n")
+            f.write(json.dumps({"intent": "bad"}) + "\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_writes_results_in_input_order(self):
+        report = BatchRunner(_EchoTarget(jitter=0.005), self.input, self.output, chunk_size=7,
+                             concurrency=4).run()
+        results = _read(self.output)
+        self.assertEqual([r["index"] for r in results], list(range(102)))
+        self.assertEqual(results[3], {"index": 3, "id": "job-3", "status": "success", "result": "INTENT 3"})
+        self.assertTrue(results[100]["error"].startswith("Invalid JSON line"))
+        self.assertEqual(results[101]["status"], "error")
+        self.assertEqual((report["succeeded"], report["failed"], report["interrupted"]), (100, 2, False))
+        self.assertFalse(os.path.exists(self.output + ".checkpoint"))
+
+    def test_completion_order_writes_every_record_once(self):
+        BatchRunner(_EchoTarget(jitter=0.01), self.input, self.output, chunk_size=5,
+                    concurrency=4, ordered=False).run()
+        self.assertEqual(sorted(r["index"] for r in _read(self.output)), list(range(102)))
+
+    def test_resume_after_interrupt(self):
+        expected = os.path.join(self.tmp.name, "expected.jsonl")
+        BatchRunner(_EchoTarget(), self.input, expected, chunk_size=10).run()
+
+        for ordered in (True, False):
+            report = BatchRunner(_EchoTarget(interrupt_after=6, jitter=0.005), self.input, self.output,
+                                 chunk_size=10, concurrency=3, ordered=ordered, checkpoint_interval=10).run()
+            self.assertTrue(report["interrupted"])
+            self.assertTrue(os.path.exists(self.output + ".checkpoint"))
+            with open(self.output, "a") as f:
+                f.write('{"index": 99, "status": "succ') # Torn line past the checkpoint
+
+            target = _EchoTarget()
+            report = BatchRunner(target, self.input, self.output, chunk_size=10, ordered=ordered,
+                                 resume=True).run()
+            results = _read(self.output)
+            self.assertEqual(sorted(r["index"] for r in results), list(range(102)))
+            self.assertEqual(sorted(results, key=lambda r: r["index"]), _read(expected))
+            self.assertLess(len(target.executed), 100) # Checkpointed records were not rerun
+            self.assertEqual((report["records"], report["resumed"] + report["processed"]), (102, 102))
+
+    def test_resume_rejects_foreign_checkpoint(self):
+        with open(self.output + ".checkpoint", "w") as f:
+            json.dump({"version": 1, "input": "/elsewhere.jsonl"}, f)
+        with self.assertRaises(ValueError):
+            BatchRunner(_EchoTarget(), self.input, self.output, resume=True).run()
+
+if __name__ == '__main__':
+    unittest.main()
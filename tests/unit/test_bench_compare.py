@@ -0,0 +1,64 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_BENCH_COMPARE: Unit Tests for the Benchmark Regression Gate
+
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from tests.bench.compare import compare, confirm_regressions, main, relative_change, tolerance_for
+
+def _run(**samples):
+    return {"benchmarks": {name: {"samples_s": values} for name, values in samples.items()}}
+
+class TestBenchmarkGate(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Performance regression assurance
+
+    def test_confidence_interval_brackets_the_change(self):
+        change, low, high = relative_change([1.0, 1.1, 0.9, 1.0, 1.0], [1.5, 1.6, 1.4, 1.5, 1.5])
+        self.assertAlmostEqual(change, 0.5)
+        self.assertLess(low, 0.5)
+        self.assertGreater(high, 0.5)
+
+    def test_verdicts(self):
+        baseline = _run(trust=[1.0, 1.01, 0.99], cerebrum=[1.0, 1.01, 0.99], noisy=[1.0, 2.0, 0.5], gone=[1.0])
+        current = _run(trust=[50.0, 51.0, 49.0], cerebrum=[0.5, 0.51, 0.49], noisy=[1.5, 0.6, 2.5], added=[1.0])
+        verdicts = {row["name"]: row["verdict"] for row in compare(baseline, current, 0.10)}
+        self.assertEqual(verdicts, {"trust": "regression", "cerebrum": "improvement", "noisy": "ok",
+                                    "gone": "missing", "added": "new"})
+
+    def test_most_specific_tolerance_wins(self):
+        overrides = {"node.*": 0.2, "node.execute_mandate*": 0.15}
+        self.assertEqual(tolerance_for("node.execute_mandate[intent=64]", 0.1, overrides), 0.15)
+        self.assertEqual(tolerance_for("node.log_event[ledger=1000]", 0.1, overrides), 0.2)
+        self.assertEqual(tolerance_for("cerebrum.process_intent", 0.1, overrides), 0.1)
+
+    def test_regressions_must_repeat_in_fresh_processes(self):
+        baseline = _run(steady=[1.0, 1.01, 0.99], flaky=[1.0, 1.01, 0.99], fine=[1.0, 1.01, 0.99])
+        current = _run(steady=[2.0, 2.01, 1.99], flaky=[2.0, 2.01, 1.99], fine=[1.0, 1.01, 0.99])
+        reruns = []
+
+        def rerun(names):
+            reruns.append(sorted(names))
+            return _run(steady=[2.0, 2.02, 1.98], flaky=[1.0, 1.01, 0.99])
+
+        rows = confirm_regressions(compare(baseline, current, 0.10), baseline, 2, 0.10, rerun=rerun)
+        verdicts = {row["name"]: (row["verdict"], row.get("confirmed_runs")) for row in rows}
+        self.assertEqual(verdicts, {"steady": ("regression", 2), "flaky": ("unconfirmed", 0), "fine": ("ok", None)})
+        self.assertEqual(reruns, [["flaky", "steady"], ["steady"]])
+    def test_other_machine_fails_the_gate_unless_report_only(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {}
+            for name, machine in (("baseline", "x86_64 ci-runner x4"), ("current", "x86_64 laptop x8")):
+                run = dict(_run(steady=[1.0, 1.01, 0.99]), meta={"machine": machine})
+                paths[name] = Path(tmp) / f"{name}.json"
+                paths[name].write_text(json.dumps(run))
+            argv = [str(paths["current"]), "--baseline", str(paths["baseline"]), "--confirm", "0"]
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as stderr:
+                self.assertEqual(main(argv), 2)
+                self.assertEqual(main(argv + ["--report-only"]), 0)
+            self.assertIn("ci-runner", stderr.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_CANONICAL: Unit Tests for Canonical Encoding and MandateContext
+
+import hashlib
+import unittest
+from src.canonical import canonical_encode, canonical_digest, canonical_hexdigest, MandateContext
+from src.data_moat.cultivation_engine import DynamicMoatCultivationEngine
+from src.praetorian_layers.dagger import DaggerLayer
+from src.sovereign_core import ZKVSNodePrime
+
+class TestCanonicalEncoding(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Deterministic hashing assurance
+
+    def test_encoding_is_key_order_and_container_independent(self):
+        a = {"intent": "x", "tags": {"b", "a"}, "pair": (1, 2), "raw": b"\x01"}
+        b = {"raw": b"\x01", "pair": [1, 2], "tags": {"a", "b"}, "intent": "x"}
+        self.assertEqual(canonical_encode(a), canonical_encode(b))
+        self.assertEqual(canonical_encode(a), b'\xff{"intent":"x","pair":[1,2],"raw":{"\\u0000bytes":"01"},'
+                                              b'"tags":{"\\u0000set":["a","b"]}}')
+
+    def test_encoding_is_type_unambiguous(self):
+        distinct = ["1", 1, 1.0, True, b"1", [1], {1}, {"1": "a"}, {1: "a"}, {"\x00map": [[1, "a"]]},
+                    {"raw": b"\x01"}, {"raw": "01"}, '{"raw":"01"}']
+        encodings = [canonical_encode(value) for value in distinct]
+        self.assertEqual(len(set(encodings)), len(distinct))
+        self.assertEqual(canonical_encode({"intent": "x", 1: "y", (2, 3): "z"}),
+                         canonical_encode({(2, 3): "z", 1: "y", "intent": "x"}))
+
+    def test_text_hashes_as_utf8(self):
+        self.assertEqual(canonical_hexdigest("sovereign"), hashlib.sha256(b"sovereign").hexdigest())
+
+    def test_context_computes_each_digest_once(self):
+        context = MandateContext({"intent": "filter the data"})
+        self.assertEqual(context.framework_digest, canonical_hexdigest({"intent": "filter the data"}))
+
+        # The Dagger verification hash is the digest the ZK step later reuses
+        result = DaggerLayer({}).execute_task({"sub_tasks": []}, context=context)
+        self.assertEqual(context.get("output"), result["verification_hash"])
+        self.assertEqual(context.digest("output", "ignored once cached"), result["verification_hash"])
+
+    def test_moat_hashes_the_verified_output_it_records(self):
+        context = MandateContext({"intent": "filter the data"})
+        DaggerLayer({}).execute_task({"sub_tasks": []}, context=context) # Caches the unverified "output"
+        DynamicMoatCultivationEngine({}).cultivate_moat({"intent": "data", "output": "proof_zk_validated"}, context)
+        expected = hashlib.sha256(canonical_digest("data") + canonical_digest("proof_zk_validated")).hexdigest()
+        self.assertEqual(context.get("moat_interaction"), expected)
+
+    def test_node_hashes_any_framework_inside_its_error_path(self):
+        node = ZKVSNodePrime()
+        self.assertIn("ZK-PROVEN", node.execute_mandate({"intent": "filter the data", 1: "mixed keys"}))
+
+        looped = {"intent": "filter the data"}
+        looped["self"] = looped
+        with self.assertRaises(RecursionError):
+            node.execute_mandate(looped)
+        self.assertTrue(any(event["level"] == "ERROR" for event in node._verifiable_ledger))
+        self.assertEqual([r["status"] for r in node.execute_mandates([{"intent": "a", 2: "b"}, looped])],
+                         ["success", "error"])
+
+if __name__ == '__main__':
+    unittest.main()
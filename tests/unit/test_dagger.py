@@ -1,9 +1,14 @@
 # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
 # TESTS/UNIT/TEST_DAGGER: Unit Tests for Dagger Agents
 
+import os
+import tempfile
+import threading
 import unittest
+import hashlib
 from src.dagger_agents.core import DaggerAgent, DataSieveAgent, ZKProofAgent, MarketAnalysisAgent
 from src.dagger_agents.utils import DaggerAgentUtils
+from src.dagger_agents.registry import DaggerAgentRegistry, DEFAULT_AGENT_SPECS
 
 class TestDaggerAgents(unittest.TestCase):
     # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Absolute Quality Assurance for Dagger Agents
@@ -30,6 +35,46 @@ class TestDaggerAgents(unittest.TestCase):
         self.assertEqual(agent.status, "idle")
         self.assertTrue(DaggerAgentUtils.validate_result_integrity(result_dict["result"]))
 
+    def test_data_sieve_agent_chunked_file_matches_whole_text(self):
+        agent = DataSieveAgent(self.axioms)
+        text = "The quick brown fox is an agile creature and the dog is not. " * 500
+        expected = DaggerAgentUtils.densify_text(text, 1.0)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "corpus.txt")
+            output = os.path.join(tmp, "sieved.txt")
+            with open(source, "w") as f:
+                f.write(text)
+
+            result = agent.execute({"path": source, "chunk_size": 997, "workers": 2, "output_path": output})["result"]
+            with open(output) as f:
+                self.assertEqual(f.read(), expected)
+
+        self.assertGreater(result["chunks"], 1)
+        self.assertEqual(result["sieve_hash"], hashlib.sha256(expected.encode()).hexdigest())
+        self.assertEqual(agent.status, "idle")
+
+    def test_data_sieve_agent_buffer_input(self):
+        agent = DataSieveAgent(self.axioms)
+        text = "An extremely dense buffer of signal words and the noise between them. " * 50
+        result = agent.execute({"buffer": memoryview(text.encode()), "chunk_size": 64})["result"]
+        expected = DaggerAgentUtils.densify_text(text, 1.0)
+        self.assertEqual(result["sieve_hash"], hashlib.sha256(expected.encode()).hexdigest())
+        self.assertTrue(result["densified_preview"].endswith("..."))
+
+    def test_data_sieve_agent_chunking_keeps_undensified_text_and_bounds_chunks(self):
+        agent = DataSieveAgent(dict(self.axioms, DENSITY=0.5))
+        text = "Keep every word of this text exactly as written, spacing included.  " * 40
+        result = agent.execute({"buffer": text.encode(), "chunk_size": 50})["result"]
+        self.assertGreater(result["chunks"], 1)
+        self.assertEqual(result["bytes_out"], len(text.encode()))
+        self.assertEqual(result["sieve_hash"], hashlib.sha256(text.encode()).hexdigest())
+
+        unbroken = ("é" * 1000).encode()
+        ranges = DaggerAgentUtils.plan_word_aligned_chunks(unbroken, 64)
+        self.assertTrue(all(end - start <= 64 * 16 for start, end in ranges))
+        self.assertEqual("".join(str(unbroken[start:end], "utf-8") for start, end in ranges), "é" * 1000)
+
     def test_zk_proof_agent_generation(self):
         agent = ZKProofAgent(self.axioms)
         task_params = {"input": "sensitive_transaction_data"}
@@ -39,6 +84,34 @@ class TestDaggerAgents(unittest.TestCase):
         self.assertEqual(agent.status, "idle")
         self.assertTrue(DaggerAgentUtils.validate_result_integrity(result_dict["result"]))
 
+    def test_zk_proof_agent_batch_merkle_aggregation(self):
+        agent = ZKProofAgent(self.axioms)
+        inputs = [f"transaction_{i}" for i in range(7)]
+        batch = agent.execute({"inputs": inputs})["result"]
+        self.assertEqual(batch["leaf_count"], 7)
+
+        for input_data, item in zip(inputs, batch["proofs"]):
+            single = agent.execute({"input": input_data})["result"]
+            self.assertIn(item["leaf"], single)
+            self.assertTrue(DaggerAgentUtils.verify_merkle_inclusion(item["leaf"], item["path"], batch["merkle_root"]))
+
+        tampered = batch["proofs"][0]
+        self.assertFalse(DaggerAgentUtils.verify_merkle_inclusion(batch["proofs"][1]["leaf"], tampered["path"], batch["merkle_root"]))
+
+    def test_merkle_tree_odd_levels_and_leaf_separation(self):
+        leaves = [hashlib.sha256(bytes([i])).digest() for i in range(9)]
+        for count in range(1, 10):
+            root, paths = DaggerAgentUtils.build_merkle_tree(leaves[:count])
+            for leaf, path in zip(leaves, paths):
+                self.assertTrue(DaggerAgentUtils.verify_merkle_inclusion(leaf.hex(), path, root.hex()))
+
+        # Duplicating the odd last leaf must not reproduce the root (CVE-2012-2459)
+        root, _ = DaggerAgentUtils.build_merkle_tree(leaves[:3])
+        self.assertNotEqual(root, DaggerAgentUtils.build_merkle_tree(leaves[:3] + leaves[2:3])[0])
+        # An interior node cannot be passed off as a leaf
+        pair_root, _ = DaggerAgentUtils.build_merkle_tree(leaves[:2])
+        self.assertFalse(DaggerAgentUtils.verify_merkle_inclusion(pair_root.hex(), [], pair_root.hex()))
+
     def test_market_analysis_agent_execution(self):
         agent = MarketAnalysisAgent(self.axioms)
         task_params = {"target": "AI market"}
@@ -67,5 +140,49 @@ class TestDaggerAgents(unittest.TestCase):
         original_text = "This is a test."
         self.assertEqual(DaggerAgentUtils.densify_text(original_text, axioms_normal['DENSITY']), original_text)
 
+    def test_dagger_agent_utils_densify_texts_batch(self):
+        texts = ["The cat and THE dog are here", b"AND the bytes are dense too", "ok"]
+        results = list(DaggerAgentUtils.densify_texts(texts, 1.0))
+        self.assertEqual(results, ["cat dog here", b"bytes dense too", ""])
+
+        as_bytes = list(DaggerAgentUtils.densify_texts(["Sovereign and dense output"], 1.0, as_bytes=True))
+        self.assertEqual(as_bytes, [b"Sovereign dense output"])
+
+    def test_dagger_agent_utils_densify_bytes_matches_text_separators(self):
+        for text in ("alpha\x1cbravo charlie delta word", "signal noise　the dense\x85output",
+                     "\x1f the plain ascii words and more \t"):
+            self.assertEqual(DaggerAgentUtils.densify_bytes(text.encode(), 1.0),
+                             DaggerAgentUtils.densify_text(text, 1.0).encode())
+
+    def test_agent_registry_loads_on_first_route(self):
+        registry = DaggerAgentRegistry(self.axioms, specs=DEFAULT_AGENT_SPECS, use_entry_points=False)
+        self.assertIn("zk_proof_agent", registry)
+        self.assertEqual(registry.loaded_agents(), {})
+
+        agent = registry.get("zk_proof_agent")
+        self.assertIsInstance(agent, ZKProofAgent)
+        self.assertIs(registry.get("zk_proof_agent"), agent)
+        self.assertEqual(list(registry.startup_costs()), ["zk_proof_agent"])
+        self.assertIsNone(registry.get("unknown_agent"))
+
+    def test_agent_registry_register_waits_for_an_inflight_load(self):
+        loading, release = threading.Event(), threading.Event()
+
+        def slow_agent(axioms):
+            loading.set()
+            release.wait(5)
+            return MarketAnalysisAgent(axioms)
+
+        registry = DaggerAgentRegistry(self.axioms, specs={"agent": slow_agent}, use_entry_points=False)
+        loader = threading.Thread(target=registry.get, args=("agent",))
+        loader.start()
+        self.assertTrue(loading.wait(5))
+        replacer = threading.Thread(target=registry.register, args=("agent", ZKProofAgent))
+        replacer.start()
+        release.set()
+        loader.join()
+        replacer.join()
+        self.assertIsInstance(registry.get("agent"), ZKProofAgent) # The old load cannot overwrite the new spec
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,55 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_HASHING: Unit Tests for the Pluggable Hash Backend
+
+import dataclasses
+import hashlib
+import unittest
+from src import hashing
+from src.config import get_config
+from src.sovereign_core import ZKVSNodePrime
+
+class TestHashBackends(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Backend interchangeability assurance
+
+    def tearDown(self):
+        hashing.set_algorithm(hashing.DEFAULT_ALGORITHM)
+
+    def test_backends_produce_32_byte_digests(self):
+        for name in hashing.HASH_BACKENDS:
+            hashing.set_algorithm(name)
+            self.assertEqual(len(hashing.digest(b"axiom")), 32)
+            self.assertEqual(hashing.hexdigest(b"axiom"), hashing.digest(b"axiom").hex())
+        hashing.set_algorithm("blake2b")
+        self.assertEqual(hashing.digest(b"axiom"), hashlib.blake2b(b"axiom", digest_size=32).digest())
+
+    def test_unknown_backend_rejected(self):
+        with self.assertRaises(ValueError):
+            hashing.set_algorithm("md5")
+
+    def test_node_runs_on_every_backend(self):
+        outputs = set()
+        for name in hashing.HASH_BACKENDS:
+            node = ZKVSNodePrime(dataclasses.replace(get_config(), hash_algorithm=name))
+            self.assertEqual(hashing.get_algorithm(), name) # The node's config selects the backend
+            outputs.add(node.execute_mandate({"intent": "filter the data"}).split("\n")[1])
+            self.assertTrue(node.verify_ledger_chain())
+            node.close() # Releases the backend for the next algorithm
+        self.assertEqual(len(outputs), 3) # Proofs differ per backend
+
+    def test_open_ledgers_pin_the_backend(self):
+        node = ZKVSNodePrime(dataclasses.replace(get_config(), hash_algorithm="sha256"))
+        try:
+            node.execute_mandate({"intent": "filter the data"})
+            with self.assertRaises(ValueError):
+                ZKVSNodePrime(dataclasses.replace(get_config(), hash_algorithm="blake2b"))
+            self.assertEqual(hashing.get_algorithm(), "sha256")
+            self.assertTrue(node.verify_ledger_chain())
+            ZKVSNodePrime(dataclasses.replace(get_config(), hash_algorithm="sha256")).close()
+        finally:
+            node.close()
+
+        with self.assertRaises(ValueError):
+            ZKVSNodePrime(dataclasses.replace(get_config(), hash_algorithm="md5"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_INSTRUMENTATION: Unit Tests for Per-Stage Latency Instrumentation
+
+import threading
+import unittest
+from src.instrumentation import LatencyHistogram, StageTimer, STAGES
+from src.sovereign_core import ZKVSNodePrime
+
+class TestLatencyHistogram(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Latency accounting assurance
+
+    def test_percentiles_follow_bucket_bounds(self):
+        histogram = LatencyHistogram(buckets=(0.001, 0.01, 0.1))
+        for seconds in [0.0005] * 90 + [0.05] * 10:
+            histogram.record(seconds)
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 100)
+        self.assertEqual(snapshot["p50_s"], 0.001)
+        self.assertEqual(snapshot["p99_s"], 0.05)  # Capped at the observed maximum
+        self.assertEqual(histogram.bucket_counts(), [90, 0, 10, 0])
+
+    def test_slow_mandates_counted_across_threads(self):
+        timer = StageTimer(slow_threshold=-1.0) # Every mandate counts as slow
+        threads = [threading.Thread(target=lambda: [timer.finish(timer.start()) for _ in range(2000)])
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(timer.slow_mandates, 16000)
+        self.assertEqual(timer.histograms["total"].count, 16000)
+
+class TestNodeStageMetrics(unittest.TestCase):
+
+    def test_every_stage_is_timed(self):
+        node = ZKVSNodePrime()
+        node.execute_mandate({"intent": "Filter the data stream"})
+        stages = node.stage_metrics()["stages"]
+        self.assertEqual(tuple(stages), STAGES)
+        for stage in STAGES:
+            self.assertEqual(stages[stage]["count"], 1, stage)
+        self.assertGreaterEqual(stages["total"]["sum_s"], stages["dagger"]["sum_s"])
+
+if __name__ == '__main__':
+    unittest.main()
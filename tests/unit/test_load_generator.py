@@ -0,0 +1,73 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_LOAD_GENERATOR: Unit Tests for Open- and Closed-Loop Load Generation
+
+import gzip
+import json
+import os
+import tempfile
+import time
+import unittest
+from src.load_generator import LoadGenerator, synthetic_frameworks, load_frameworks
+from src.sovereign_core import ZKVSNodePrime
+
+class _SlowTarget:
+    """Stand-in node taking a fixed service time per mandate."""
+
+    def __init__(self, service_time: float):
+        self.service_time = service_time
+        self._verifiable_ledger = []
+        self.calls = 0
+
+    def worker_status(self):
+        return [{"ledger_events": len(self._verifiable_ledger), "reboots": 0}]
+
+    def execute_mandate(self, framework):
+        self.calls += 1
+        time.sleep(self.service_time)
+        if framework["intent"] == "fail":
+            raise ValueError("rejected")
+        self._verifiable_ledger.append(framework)
+        return "ok"
+
+class TestLoadGenerator(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Capacity planning assurance
+
+    def test_closed_loop_reports_node_throughput_and_ledger_growth(self):
+        node = ZKVSNodePrime()
+        report = LoadGenerator(node, synthetic_frameworks(10), mode="closed", concurrency=2, duration=0.3).run()
+        self.assertGreater(report["completed"], 0)
+        self.assertEqual(report["errors"], 0)
+        self.assertEqual(report["latency"]["count"], report["completed"])
+        self.assertGreater(report["ledger_events_added"], report["completed"])
+        self.assertEqual(sum(b["count"] for b in report["latency_histogram"]), report["completed"])
+
+    def test_open_loop_holds_rate_and_counts_errors(self):
+        target = _SlowTarget(0.001)
+        frameworks = [{"intent": "ok"}, {"intent": "fail"}]
+        report = LoadGenerator(target, frameworks, mode="open", concurrency=4, rate=100, duration=0.5).run()
+        self.assertEqual(report["issued"], 50)
+        self.assertEqual(report["completed"] + report["errors"], 50)
+        self.assertEqual(report["errors"], 25)
+        self.assertEqual(report["error_samples"], {"ValueError: rejected": 25})
+        self.assertEqual(report["ledger_events_added"], 25)
+
+    def test_open_loop_latency_includes_queueing(self):
+        # One client, 20ms service, 100/s arrivals: later mandates wait behind earlier ones
+        report = LoadGenerator(_SlowTarget(0.02), [{"intent": "ok"}], mode="open",
+                               concurrency=1, rate=100, duration=0.2).run()
+        self.assertGreater(report["latency"]["max_s"], 0.1)
+
+    def test_recorded_frameworks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "capture.jsonl.gz")
+            with gzip.open(path, "wt") as f:
+                f.write(json.dumps({"t": 0.0, "framework": {"intent": "a"}}) + "\n")
+                f.write(json.dumps({"intent": "b"}) + "\n")
+            self.assertEqual(load_frameworks(path), [{"intent": "a"}, {"intent": "b"}])
+
+    def test_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            LoadGenerator(_SlowTarget(0), [{"intent": "a"}], mode="burst")
+
+if __name__ == '__main__':
+    unittest.main()
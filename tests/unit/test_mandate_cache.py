@@ -0,0 +1,57 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_MANDATE_CACHE: Unit Tests for the End-to-End Mandate Result Cache
+
+import unittest
+from src.config import AXIOMHIVEConfig
+from src.mandate_cache import MandateResultCache
+from src.sovereign_core import ZKVSNodePrime
+
+class TestMandateResultCache(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Cache expiry and eviction assurance
+
+    def test_ttl_and_lru_eviction(self):
+        now = [0.0]
+        cache = MandateResultCache(max_entries=2, ttl=10.0, clock=lambda: now[0])
+        cache.put("a", "A", "h1", "fa")
+        cache.put("b", "B", "h2", "fb")
+        self.assertEqual(cache.get("a").result, "A")  # "a" becomes most recently used
+        cache.put("c", "C", "h3", "fc")
+        self.assertIsNone(cache.get("b"))
+
+        now[0] = 11.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+class TestNodeMandateCache(unittest.TestCase):
+
+    def setUp(self):
+        self.node = ZKVSNodePrime(AXIOMHIVEConfig(enable_mandate_cache=True))
+
+    def test_repeat_mandate_is_served_from_cache_and_recorded(self):
+        framework = {"intent": "Filter the data stream"}
+        first = self.node.execute_mandate(framework)
+        sealed_hash = self.node._verifiable_ledger[-1]['hash']
+
+        second = self.node.execute_mandate({"intent": "Filter the data stream"})
+        self.assertEqual(first, second)
+        hit = self.node._verifiable_ledger[-1]
+        self.assertEqual(hit['level'], "CACHE")
+        self.assertEqual(hit['data']['original_hash'], sealed_hash)
+        self.assertTrue(self.node.verify_ledger_chain())
+        self.assertEqual(self.node.cache_stats()["hits"], 1)
+
+    def test_idempotency_key(self):
+        result = self.node.execute_mandate({"intent": "Filter the data stream"}, idempotency_key="retry-1")
+        self.assertEqual(self.node.execute_mandate({"intent": "Filter the data stream"}, idempotency_key="retry-1"), result)
+        with self.assertRaises(ValueError):
+            self.node.execute_mandate({"intent": "Something else"}, idempotency_key="retry-1")
+
+    def test_batch_uses_cache(self):
+        self.node.execute_mandate({"intent": "Filter the data stream"})
+        results = self.node.execute_mandates([{"intent": "Filter the data stream"}, {"intent": "New mandate"}])
+        self.assertEqual([r["status"] for r in results], ["success", "success"])
+        self.assertEqual(self.node.cache_stats()["hits"], 1)
+        self.assertEqual(len(self.node._mandate_cache), 2)
+
+if __name__ == '__main__':
+    unittest.main()
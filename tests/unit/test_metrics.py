@@ -0,0 +1,53 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_METRICS: Unit Tests for the Metrics Registry and Prometheus Endpoint
+
+import unittest
+import urllib.request
+from src.config import AXIOMHIVEConfig
+from src.metrics import MetricsRegistry
+from src.sovereign_core import ZKVSNodePrime
+
+class TestMetricsRegistry(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Fleet observability assurance
+
+    def test_text_exposition_format(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("axiomhive_test_total", "Test counter.", ("status",))
+        counter.inc(2, "success")
+        registry.callback("axiomhive_test_gauge", "Test gauge.", lambda: 1.5)
+        registry.callback("axiomhive_test_absent", "Absent gauge.", lambda: None)
+        self.assertEqual(registry.render(), "\n".join([
+            "# HELP axiomhive_test_total Test counter.",
+            "# TYPE axiomhive_test_total counter",
+            'axiomhive_test_total{status="success"} 2',
+            "# HELP axiomhive_test_gauge Test gauge.",
+            "# TYPE axiomhive_test_gauge gauge",
+            "axiomhive_test_gauge 1.5",
+            "# HELP axiomhive_test_absent Absent gauge.",
+            "# TYPE axiomhive_test_absent gauge",
+        ]) + "\n")
+        with self.assertRaises(ValueError):
+            registry.counter("axiomhive_test_total", "Duplicate.")
+
+class TestNodeMetricsEndpoint(unittest.TestCase):
+
+    def test_node_metrics_are_scraped_over_http(self):
+        node = ZKVSNodePrime(AXIOMHIVEConfig(enable_mandate_cache=True))
+        node.execute_mandate({"intent": "Filter the data stream"})
+        node.execute_mandate({"intent": "Filter the data stream"})
+        server = node.start_metrics_server(port=0)
+        try:
+            with urllib.request.urlopen(f"http://{server.host}:{server.port}/metrics", timeout=5) as response:
+                self.assertTrue(response.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+                body = response.read().decode()
+        finally:
+            node.stop_metrics_server()
+        self.assertIn('axiomhive_mandates_total{status="success"} 1', body)
+        self.assertIn('axiomhive_mandates_total{status="cache_hit"} 1', body)
+        self.assertIn("axiomhive_mandate_cache_hits_total 1", body)
+        self.assertIn('axiomhive_stage_latency_seconds_count{stage="total"} 1', body)
+        self.assertIn('axiomhive_stage_latency_seconds_bucket{stage="zk",le="+Inf"} 1', body)
+        self.assertIn("axiomhive_mandates_in_flight 0", body)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_PROCESS_POOL: Unit Tests for Process-Isolated Dagger Agents
+
+import os
+import signal
+import time
+import unittest
+from src.dagger_agents.core import DaggerAgent
+from src.dagger_agents.registry import DaggerAgentRegistry, DEFAULT_AGENT_SPECS
+from src.dagger_agents.process_pool import AgentProcessPool, ProcessPoolAgent
+from src.praetorian_layers.hadrian import HadrianLayer
+
+class _TwoPartError(Exception):
+    """Cannot be rebuilt from its pickled args."""
+    def __init__(self, code, detail):
+        super().__init__(f"{code}: {detail}")
+
+class SleepyAgent(DaggerAgent):
+    """Test agent that sleeps for the requested number of seconds."""
+    def __init__(self, axioms):
+        super().__init__("SleepyAgent", "testing", axioms)
+
+    def _perform_task(self, task_params):
+        if task_params.get("fail") == "value":
+            raise ValueError("negative sleep")
+        if task_params.get("fail") == "unpicklable":
+            raise _TwoPartError(7, "lost")
+        time.sleep(task_params.get("seconds", 0))
+        return f"slept in {os.getpid()}"
+
+class TestAgentProcessPool(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Process isolation assurance
+
+    def setUp(self):
+        self.axioms = {
+            'SHARPEN': 1.0, 'SOVEREIGNTY': 1.0, 'DENSITY': 1.0,
+            'NOISE': float('-inf'), 'DEPTH': float('inf'), 'FLAW': 0
+        }
+
+    def test_registry_routes_process_agents_to_pool(self):
+        registry = DaggerAgentRegistry(self.axioms, specs=DEFAULT_AGENT_SPECS, use_entry_points=False,
+                                       process_agents=["data_sieve_agent"], process_workers=1)
+        try:
+            agent = registry.get("data_sieve_agent")
+            self.assertIsInstance(agent, ProcessPoolAgent)
+            self.assertEqual(agent.status, "idle")
+
+            # Large payloads travel through shared memory
+            text = "the sovereign signal and the noise " * 4000
+            result = agent.execute({"buffer": text.encode(), "chunk_size": 4096})["result"]
+            self.assertGreater(result["bytes_out"], 0)
+            self.assertIn("Data sieved and densified:", agent.execute({"data": text})["result"])
+        finally:
+            registry.close()
+
+    def test_routing_does_not_start_the_pool(self):
+        registry = DaggerAgentRegistry(self.axioms, specs=DEFAULT_AGENT_SPECS, use_entry_points=False,
+                                       process_agents=["data_sieve_agent"], process_workers=1)
+        try:
+            plan = HadrianLayer(self.axioms, registry).orchestrate_task("filter the data")
+            self.assertEqual([task["agent_name"] for task in plan["sub_tasks"]], ["data_sieve_agent"])
+            self.assertIsNone(registry.process_pool_stats())
+            self.assertFalse(registry.is_routable("unknown_agent"))
+        finally:
+            registry.close()
+
+    def test_deadline_and_crash_restart_workers(self):
+        pool = AgentProcessPool({"sleepy": SleepyAgent}, self.axioms, workers=1, deadline=0.5)
+        try:
+            first_pid = pool._workers[0].pid
+            with self.assertRaises(TimeoutError):
+                pool.execute("sleepy", {"seconds": 5})
+            self.assertNotEqual(pool._workers[0].pid, first_pid)
+
+            os.kill(pool._workers[0].pid, signal.SIGKILL)
+            pool._workers[0]._process.join()
+            self.assertIn("slept in", pool.execute("sleepy", {"seconds": 0})["result"])
+            self.assertEqual(pool.stats()["restarts"], 2)
+        finally:
+            pool.close()
+
+    def test_worker_exceptions_keep_their_type(self):
+        pool = AgentProcessPool({"sleepy": SleepyAgent}, self.axioms, workers=1)
+        try:
+            with self.assertRaisesRegex(ValueError, "negative sleep"):
+                pool.execute("sleepy", {"fail": "value"})
+            with self.assertRaisesRegex(RuntimeError, "_TwoPartError: 7: lost"):
+                pool.execute("sleepy", {"fail": "unpicklable"})
+            self.assertIn("slept in", pool.execute("sleepy", {})["result"])
+            self.assertEqual(pool.stats()["restarts"], 0)
+        finally:
+            pool.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_PROFILING: Unit Tests for the profile_performance Mode
+
+import json
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from src.config import AXIOMHIVEConfig
+from src.profiling import MandateProfiler
+from src.sovereign_core import ZKVSNodePrime
+
+class TestMandateProfiling(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Observability assurance
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def _profiled_node(self, mode: str, dump_interval: float = 3600.0) -> ZKVSNodePrime:
+        return ZKVSNodePrime(AXIOMHIVEConfig(profile_performance=True, profile_mode=mode,
+                                             profile_output_dir=self.output_dir,
+                                             profile_dump_interval=dump_interval))
+
+    def test_cprofile_mode_writes_collapsed_stacks_and_memory_report(self):
+        node = self._profiled_node("cprofile")
+        node.execute_mandate({"intent": "Filter the data stream"})
+        collapsed = node._profiler.collapsed_stacks()
+        self.assertTrue(any("_execute_mandate" in stack for stack in collapsed))
+
+        node.disable_profiling()
+        self.assertIsNone(node._profiler)
+        files = {path.suffix: path for path in Path(self.output_dir).iterdir()}
+        self.assertEqual(set(files), {".collapsed", ".prof", ".json"})
+        for line in files[".collapsed"].read_text().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            self.assertGreater(int(count), 0)
+        self.assertEqual(json.loads(files[".json"].read_text())["mandates"], 1)
+
+    def test_sample_mode_captures_in_flight_mandates(self):
+        node = self._profiled_node("sample")
+        deadline = time.monotonic() + 2.0
+        while not node._profiler.collapsed_stacks() and time.monotonic() < deadline:
+            node.execute_mandate({"intent": "Filter the data stream " * 200})
+        stacks = node._profiler.collapsed_stacks()
+        node.disable_profiling(dump=False)
+        self.assertTrue(stacks)
+        self.assertTrue(all("execute_mandate" in stack for stack in stacks))
+
+    def test_periodic_dumps_run_off_the_mandate_thread(self):
+        node = self._profiled_node("cprofile", dump_interval=0.05)
+        profiler = node._profiler
+        dump, dump_threads = profiler.dump, []
+        profiler.dump = lambda: (dump_threads.append(threading.current_thread()), dump())[1]
+        node.execute_mandate({"intent": "Filter the data stream"})
+        deadline = time.monotonic() + 2.0
+        while not dump_threads and time.monotonic() < deadline:
+            time.sleep(0.01)
+        node.disable_profiling(dump=False)
+        self.assertTrue(dump_threads)
+        self.assertNotIn(threading.main_thread(), dump_threads)
+        self.assertTrue(any(Path(self.output_dir).glob("cpu-*.collapsed")))
+
+    def test_dump_keeps_samples_recorded_while_it_runs(self):
+        profiler = MandateProfiler(self.output_dir, mode="sample", sample_interval=3600.0, dump_interval=3600.0)
+        try:
+            memory = profiler.memory_by_component
+            def sample_during_dump():
+                with profiler._lock:
+                    profiler._samples["late;stack"] += 1 # As the sampler thread would, mid-dump
+                return memory()
+            profiler.memory_by_component = sample_during_dump
+            cpu = next(path for path in profiler.dump() if path.suffix == ".collapsed")
+            self.assertIn("late;stack 1", cpu.read_text())
+            self.assertEqual(profiler.collapsed_stacks(), {})
+        finally:
+            profiler.close(dump=False)
+
+if __name__ == '__main__':
+    unittest.main()
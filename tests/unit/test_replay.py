@@ -0,0 +1,68 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_REPLAY: Unit Tests for Traffic Capture and Verified Replay
+
+import gzip
+import os
+import tempfile
+import unittest
+from src.config import AXIOMHIVEConfig
+from src.replay import Replayer, read_capture
+from src.sovereign_core import ZKVSNodePrime
+
+FRAMEWORKS = [
+    {"intent": "Architect market dominance through verifiable systems", "context": "strategic"},
+    {"intent": "Optimize supply chain efficiency", "context": "commercial", "priority": "high"},
+]
+
+class TestCaptureAndReplay(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Production traffic reproduction assurance
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "capture.jsonl.gz")
+        node = ZKVSNodePrime(AXIOMHIVEConfig(capture_path=self.path))
+        for framework in FRAMEWORKS:
+            node.execute_mandate(framework)
+        node.execute_mandates(FRAMEWORKS + [{"no_intent": True}])
+        with self.assertRaises(ValueError):
+            node.execute_mandate({"no_intent": True})
+        node.close()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_capture_records_arrivals_batches_and_outcomes(self):
+        capture = read_capture(self.path)
+        self.assertEqual(capture["header"]["capture"], 1)
+        records = capture["records"]
+        self.assertEqual(len(records), 6)
+        self.assertEqual([r["t"] for r in records], sorted(r["t"] for r in records))
+        self.assertEqual([r.get("batch") for r in records], [None, None, 0, 0, 0, None])
+        self.assertEqual([r["status"] for r in records], ["success"] * 4 + ["error"] * 2)
+        self.assertEqual(records[0]["framework"], FRAMEWORKS[0])
+
+    def test_replay_against_fresh_node_matches_output_hashes(self):
+        report = Replayer(ZKVSNodePrime(), read_capture(self.path), speed=0, concurrency=1).run()
+        self.assertEqual(report["replayed"], 6)
+        self.assertEqual(report["matched"], 4)
+        self.assertEqual(report["mismatched"], 0)
+        self.assertEqual(report["errors"], 2)
+        self.assertEqual(report["unexpected_errors"], 0)
+
+    def test_replay_flags_changed_output(self):
+        capture = read_capture(self.path)
+        capture["records"][0]["output_hash"] = "0" * 64
+        report = Replayer(ZKVSNodePrime(), capture, speed=0).run()
+        self.assertEqual(report["mismatched"], 1)
+        self.assertEqual(report["mismatches"][0]["record"], 0)
+
+    def test_truncated_capture_is_readable(self):
+        with gzip.open(self.path, "rb") as f:
+            data = f.read()
+        truncated = os.path.join(self.tmp.name, "truncated.jsonl.gz")
+        with open(truncated, "wb") as f:
+            f.write(gzip.compress(data)[:-8]) # Drop the gzip trailer, as a killed process would
+        self.assertEqual(len(read_capture(truncated)["records"]), 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_SNAPSHOT: Unit Tests for Warm-Start Node Snapshots
+
+import dataclasses
+import json
+import os
+import tempfile
+import unittest
+from src.config import get_config
+from src.dagger_agents.core import DataSieveAgent
+from src.node_pool import _NodeHandler
+from src.snapshot import SnapshotError, ensure_snapshot, load_snapshot, save_snapshot
+from src.sovereign_core import ZKVSNodePrime
+
+class TestSnapshot(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Warm start assurance
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "node.snapshot.json")
+        self.config = dataclasses.replace(get_config(), enable_metrics=False, capture_path="")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_node_from_snapshot_starts_warm_and_matches(self):
+        framework = {"intent": "Architect market dominance through verifiable systems."}
+        source = ZKVSNodePrime(self.config)
+        registry = source._hadrian.dagger_agents
+        registry.register("custom_agent", DataSieveAgent)
+        for name in ("market_analysis_agent", "zk_proof_agent"): # Routed agents load on first use
+            registry.get(name)
+        snapshot = save_snapshot(source, self.path)
+        self.assertEqual(snapshot["warm_agents"], ["market_analysis_agent", "zk_proof_agent"])
+        self.assertEqual(snapshot["agent_specs"]["custom_agent"], "src.dagger_agents.core:DataSieveAgent")
+
+        node = ZKVSNodePrime.from_snapshot(self.path, trust_threshold=0.5)
+        self.assertEqual(sorted(node._hadrian.dagger_agents.loaded_agents()), snapshot["warm_agents"])
+        self.assertEqual(node._config.trust_threshold, 0.5)
+        self.assertEqual(node.execute_mandate(framework), ZKVSNodePrime(self.config).execute_mandate(framework))
+        self.assertTrue(node.verify_ledger_chain()) # Live state is not carried over: a fresh ledger
+
+        registry.register("lambda_agent", lambda axioms: None)
+        with self.assertRaises(SnapshotError):
+            save_snapshot(source, self.path)
+
+    def test_stale_snapshots_are_rejected_and_rebuilt(self):
+        ensure_snapshot(self.path, self.config)
+        with open(self.path) as f:
+            snapshot = json.load(f)
+        snapshot["fingerprint"] = "0" * 64
+        with open(self.path, "w") as f:
+            json.dump(snapshot, f)
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
+
+        rebuilt = ensure_snapshot(self.path, self.config)
+        self.assertEqual(load_snapshot(self.path)["fingerprint"], rebuilt["fingerprint"])
+        self.assertEqual(rebuilt["warm_agents"], sorted(rebuilt["agent_specs"]))
+        changed = ensure_snapshot(self.path, dataclasses.replace(self.config, trust_threshold=0.5))
+        self.assertEqual(changed["config"]["trust_threshold"], 0.5)
+
+        with open(self.path, "w") as f:
+            f.write("{truncated")
+        with self.assertRaises(SnapshotError):
+            ZKVSNodePrime.from_snapshot(self.path)
+
+    def test_pool_worker_handler_uses_snapshot(self):
+        ensure_snapshot(self.path, self.config)
+        handle = _NodeHandler(self.path)()
+        self.assertTrue(handle(("status", None))["ready"])
+        self.assertEqual(handle(("execute", {"intent": "filter the data"})),
+                         ZKVSNodePrime(self.config).execute_mandate({"intent": "filter the data"}))
+
+        os.unlink(self.path) # Missing snapshot: the worker falls back to a cold start
+        self.assertTrue(_NodeHandler(self.path)()(("status", None))["ready"])
+
+if __name__ == '__main__':
+    unittest.main()
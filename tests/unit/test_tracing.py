@@ -0,0 +1,54 @@
+# @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS
+# TESTS/UNIT/TEST_TRACING: Unit Tests for Per-Mandate Tracing Spans
+
+import json
+import os
+import tempfile
+import unittest
+from src.config import AXIOMHIVEConfig
+from src.sovereign_core import ZKVSNodePrime
+from src.tracing import JsonLinesExporter, Tracer, span, is_tracing
+
+class TestMandateTracing(unittest.TestCase):
+    # @AXIOMHIVE @DEVDOLLZAI ALEXIS ADAMS: FLAW=0 - Verifiable execution trace assurance
+
+    def _node(self, sample_rate: float) -> ZKVSNodePrime:
+        return ZKVSNodePrime(AXIOMHIVEConfig(enable_tracing=True, trace_exporter="memory", trace_sample_rate=sample_rate))
+
+    def test_mandate_span_tree(self):
+        node = self._node(1.0)
+        node.execute_mandate({"intent": "Architect market dominance through verifiable systems and filter the data."})
+        spans = node._tracer.exporter.spans()
+        root = next(s for s in spans if s["parent_id"] is None)
+        self.assertEqual(root["name"], "mandate")
+        self.assertEqual(len(root["attributes"]["framework_hash"]), 64)
+        self.assertEqual({s["trace_id"] for s in spans}, {root["trace_id"]})
+
+        names = [s["name"] for s in spans]
+        for name in ("cerebrum", "hadrian", "dagger", "enforcement", "zk_compute", "moat_cultivation"):
+            self.assertEqual(names.count(name), 1, name)
+        self.assertEqual(names.count("dagger_agent"), 3)
+        by_id = {s["span_id"]: s for s in spans}
+        agent = next(s for s in spans if s["name"] == "dagger_agent")
+        self.assertEqual(by_id[agent["parent_id"]]["name"], "dagger")
+        self.assertFalse(is_tracing())
+
+    def test_unsampled_mandates_record_nothing(self):
+        node = self._node(0.0)
+        node.execute_mandate({"intent": "Filter the data stream"})
+        self.assertEqual(node._tracer.exporter.spans(), [])
+
+    def test_jsonl_exporter_writes_batches(self):
+        path = os.path.join(tempfile.mkdtemp(), "traces.jsonl")
+        tracer = Tracer(JsonLinesExporter(path, flush_interval=60.0))
+        with tracer.start_trace("mandate"):
+            with span("cerebrum", intent_size=3):
+                pass
+        tracer.close()
+        with open(path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r["name"] for r in records], ["cerebrum", "mandate"])
+        self.assertEqual(records[0]["parent_id"], records[1]["span_id"])
+
+if __name__ == '__main__':
+    unittest.main()